@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import json
+import random
+from mercury_sync.simulation import (
+    ClusterSimulator,
+    SimulatedNetwork
+)
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description='Run an in-memory Monitor cluster and report detection and traffic metrics.'
+    )
+
+    parser.add_argument('--nodes', type=int, default=1000)
+    parser.add_argument('--warmup', type=float, default=10)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--latency', type=float, default=0.001)
+    parser.add_argument('--jitter', type=float, default=0.0005)
+    parser.add_argument('--loss', type=float, default=0)
+    parser.add_argument('--failures', type=int, default=1)
+    parser.add_argument('--partition', type=float, default=0)
+    parser.add_argument('--sample-interval', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=None)
+
+    args = parser.parse_args()
+
+    network = SimulatedNetwork(
+        latency=args.latency,
+        jitter=args.jitter,
+        loss=args.loss,
+        seed=args.seed
+    )
+
+    simulator = ClusterSimulator(
+        args.nodes,
+        network=network,
+        sample_interval=args.sample_interval
+    )
+
+    await simulator.start()
+    await simulator.run(args.warmup)
+
+    selector = random.Random(args.seed)
+
+    for node in selector.sample(simulator.addresses[1:], args.failures):
+        simulator.fail(node)
+
+    # Optionally split off a fraction of the cluster for the first half
+    # of the run, then heal it to measure reconvergence.
+    if args.partition > 0:
+        split = int(args.nodes * args.partition)
+        simulator.partition(simulator.addresses[:split])
+
+        await simulator.run(args.duration/2)
+        simulator.heal()
+
+        await simulator.run(args.duration/2)
+
+    else:
+        await simulator.run(args.duration)
+
+    print(json.dumps(simulator.report(), indent=4))
+
+    await simulator.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import time
+import tracemalloc
+from mercury_sync.timing import TimingWheel
+
+
+async def run_wait_for(responses: asyncio.Future, count: int, timeout: float):
+    await asyncio.gather(*[
+        asyncio.wait_for(
+            asyncio.shield(responses),
+            timeout=timeout
+        ) for _ in range(count)
+    ])
+
+
+async def run_timing_wheel(responses: asyncio.Future, count: int, timeout: float):
+    wheel = TimingWheel.shared()
+
+    await asyncio.gather(*[
+        wheel.wait_for(
+            asyncio.shield(responses),
+            timeout=timeout
+        ) for _ in range(count)
+    ])
+
+
+async def measure(name: str, runner, count: int, timeout: float):
+    loop = asyncio.get_running_loop()
+    responses = loop.create_future()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    run = asyncio.create_task(
+        runner(responses, count, timeout)
+    )
+
+    # Let every call start waiting, then sample the loop's timer heap
+    # before releasing them all at once.
+    while len(loop._scheduled) < 1 or len(asyncio.all_tasks()) < count:
+        await asyncio.sleep(0)
+
+    scheduled = len(loop._scheduled)
+    responses.set_result(None)
+
+    await run
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f'{name:<14} calls={count} elapsed={elapsed:.3f}s '
+        f'overhead={elapsed/count * 1e6:.2f}us/call '
+        f'loop_timers={scheduled} peak_memory={peak/1024/1024:.1f}mb'
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description='Compare timeout overhead of asyncio.wait_for and the timing wheel.'
+    )
+
+    parser.add_argument('--calls', type=int, default=50000)
+    parser.add_argument('--timeout', type=float, default=5)
+
+    args = parser.parse_args()
+
+    await measure('wait_for', run_wait_for, args.calls, args.timeout)
+    await measure('timing_wheel', run_timing_wheel, args.calls, args.timeout)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
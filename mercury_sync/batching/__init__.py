@@ -0,0 +1,2 @@
+from .batch_histogram import BatchHistogram
+from .request_batcher import RequestBatcher
\ No newline at end of file
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from typing import Dict
+
+
+class BatchHistogram:
+
+    __slots__ = (
+        "buckets",
+        "batches",
+        "items",
+        "max_size"
+    )
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = defaultdict(int)
+        self.batches = 0
+        self.items = 0
+        self.max_size = 0
+
+    @property
+    def mean(self) -> float:
+
+        if self.batches < 1:
+            return 0
+        
+        return self.items/self.batches
+
+    def record(self, size: int):
+        # Buckets are keyed by the next power of two so the histogram
+        # stays small regardless of the configured max batch size.
+        bucket = 1 << max(size - 1, 0).bit_length()
+
+        self.buckets[bucket] += 1
+        self.batches += 1
+        self.items += size
+        self.max_size = max(self.max_size, size)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'batches': self.batches,
+            'items': self.items,
+            'mean': self.mean,
+            'max_size': self.max_size,
+            'buckets': dict(sorted(self.buckets.items()))
+        }
@@ -0,0 +1,223 @@
+import asyncio
+import functools
+from mercury_sync.models.message import Message
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+
+
+BatchKey = Tuple[str, int, str, bool]
+
+
+class RequestBatcher:
+
+    def __init__(
+        self,
+        window: float,
+        max_size: int,
+        send_batch: Callable[
+            ...,
+            Awaitable[List[Tuple[Union[int, None], Message]]]
+        ]
+    ) -> None:
+        self.window = window
+        self.max_size = max_size
+
+        self._send_batch = send_batch
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+
+        self._pending: Dict[
+            BatchKey,
+            List[
+                Tuple[
+                    Message, 
+                    asyncio.Future
+                ]
+            ]
+        ] = {}
+
+        self._flush_handles: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self._dispatches: Dict[asyncio.Task, BatchKey] = {}
+
+    def submit(
+        self,
+        event_name: str,
+        message: Message,
+        as_tcp: bool=False
+    ) -> asyncio.Future:
+        
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+
+        key: BatchKey = (
+            message.host,
+            message.port,
+            event_name,
+            as_tcp
+        )
+
+        batch = self._pending.get(key)
+
+        if batch is None:
+            batch = []
+            self._pending[key] = batch
+
+            self._flush_handles[key] = self._loop.call_later(
+                self.window,
+                self._flush,
+                key
+            )
+
+        waiter = self._loop.create_future()
+        batch.append((
+            message,
+            waiter
+        ))
+
+        if len(batch) >= self.max_size:
+            self._flush(key)
+
+        return waiter
+    
+    def _flush(self, key: BatchKey):
+
+        flush_handle = self._flush_handles.pop(key, None)
+        if flush_handle:
+            flush_handle.cancel()
+
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        
+        dispatch = asyncio.create_task(
+            self._dispatch(
+                key,
+                batch
+            )
+        )
+
+        self._dispatches[dispatch] = key
+        dispatch.add_done_callback(self._dispatches.pop)
+
+        for _, waiter in batch:
+            waiter.add_done_callback(
+                functools.partial(
+                    self._abandon,
+                    dispatch,
+                    batch
+                )
+            )
+
+    def _abandon(
+        self,
+        dispatch: asyncio.Task,
+        batch: List[
+            Tuple[
+                Message, 
+                asyncio.Future
+            ]
+        ],
+        finished: asyncio.Future
+    ):
+        if dispatch.done():
+            return
+        
+        for _, waiter in batch:
+            if waiter.done() is False:
+                return
+            
+        # Callers that time out cancel their waiter, and once every
+        # caller has given up there is nobody left to answer, so the
+        # send is cancelled rather than left waiting on a dead remote.
+        if any([
+            waiter.cancelled() for _, waiter in batch
+        ]):
+            dispatch.cancel()
+
+    async def _dispatch(
+        self,
+        key: BatchKey,
+        batch: List[
+            Tuple[
+                Message, 
+                asyncio.Future
+            ]
+        ]
+    ):
+        _, _, event_name, as_tcp = key
+
+        try:
+            responses = await self._send_batch(
+                event_name,
+                [
+                    message for message, _ in batch
+                ],
+                as_tcp,
+                on_response=functools.partial(
+                    self._resolve,
+                    batch
+                )
+            )
+
+        except asyncio.CancelledError:
+            for _, waiter in batch:
+                waiter.cancel()
+
+            raise
+
+        except Exception as batch_error:
+            for _, waiter in batch:
+                if waiter.done() is False:
+                    waiter.set_exception(batch_error)
+
+            return
+
+        for (_, waiter), response in zip(batch, responses):
+            if waiter.done() is False:
+                waiter.set_result(response)
+
+    def _resolve(
+        self,
+        batch: List[
+            Tuple[
+                Message, 
+                asyncio.Future
+            ]
+        ],
+        idx: int,
+        response: Any
+    ):
+        _, waiter = batch[idx]
+
+        if waiter.done() is False:
+            waiter.set_result(response)
+
+    async def close(self):
+
+        for flush_handle in self._flush_handles.values():
+            flush_handle.cancel()
+
+        for batch in self._pending.values():
+            for _, waiter in batch:
+                waiter.cancel()
+
+        self._flush_handles.clear()
+        self._pending.clear()
+
+        # Sends to unreachable remotes never finish on their own, so
+        # outstanding dispatches are cancelled rather than awaited.
+        dispatches = list(self._dispatches.keys())
+        for dispatch in dispatches:
+            dispatch.cancel()
+
+        if len(dispatches) > 0:
+            await asyncio.gather(
+                *dispatches,
+                return_exceptions=True
+            )
@@ -0,0 +1,2 @@
+from .request_key import create_request_key
+from .response_cache import ResponseCache
\ No newline at end of file
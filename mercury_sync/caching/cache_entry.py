@@ -0,0 +1,23 @@
+from typing import Any
+
+
+class CacheEntry:
+
+    __slots__ = (
+        "value",
+        "expires_at",
+        "size"
+    )
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size: int=0
+    ) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+    def expired(self, current_time: float) -> bool:
+        return current_time >= self.expires_at
@@ -0,0 +1,2 @@
+from .lfu_eviction import LFUEviction
+from .lru_eviction import LRUEviction
\ No newline at end of file
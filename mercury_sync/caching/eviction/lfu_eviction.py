@@ -0,0 +1,77 @@
+from collections import OrderedDict, defaultdict
+from typing import Dict, Hashable, Union
+
+
+class LFUEviction:
+
+    __slots__ = (
+        "_frequencies",
+        "_buckets",
+        "_min_frequency"
+    )
+
+    def __init__(self) -> None:
+        self._frequencies: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, OrderedDict[Hashable, None]] = defaultdict(OrderedDict)
+        self._min_frequency = 0
+
+    def add(self, key: Hashable):
+
+        if key in self._frequencies:
+            self.touch(key)
+            return
+
+        self._frequencies[key] = 1
+        self._buckets[1][key] = None
+        self._min_frequency = 1
+
+    def touch(self, key: Hashable):
+        frequency = self._frequencies.get(key)
+
+        if frequency is None:
+            return
+        
+        bucket = self._buckets[frequency]
+        del bucket[key]
+
+        if len(bucket) < 1:
+            del self._buckets[frequency]
+
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+        self._frequencies[key] = frequency + 1
+        self._buckets[frequency + 1][key] = None
+
+    def remove(self, key: Hashable):
+        frequency = self._frequencies.pop(key, None)
+
+        if frequency is None:
+            return
+        
+        bucket = self._buckets[frequency]
+        bucket.pop(key, None)
+
+        if len(bucket) < 1:
+            del self._buckets[frequency]
+
+            if self._min_frequency == frequency and len(self._frequencies) > 0:
+                self._min_frequency = min(self._buckets.keys())
+
+    def victim(self) -> Union[Hashable, None]:
+
+        if len(self._frequencies) < 1:
+            return None
+        
+        bucket = self._buckets.get(self._min_frequency)
+
+        if bucket is None:
+            self._min_frequency = min(self._buckets.keys())
+            bucket = self._buckets[self._min_frequency]
+
+        return next(iter(bucket))
+    
+    def clear(self):
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
@@ -0,0 +1,32 @@
+from collections import OrderedDict
+from typing import Hashable, Union
+
+
+class LRUEviction:
+
+    __slots__ = (
+        "_order",
+    )
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[Hashable, None] = OrderedDict()
+
+    def add(self, key: Hashable):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def touch(self, key: Hashable):
+        self._order.move_to_end(key)
+
+    def remove(self, key: Hashable):
+        self._order.pop(key, None)
+
+    def victim(self) -> Union[Hashable, None]:
+
+        if len(self._order) < 1:
+            return None
+        
+        return next(iter(self._order))
+    
+    def clear(self):
+        self._order.clear()
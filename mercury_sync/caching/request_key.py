@@ -0,0 +1,22 @@
+import hashlib
+import pickle
+from mercury_sync.models.message import Message
+
+
+def create_request_key(
+    call_name: str,
+    message: Message
+) -> bytes:
+    request_data = pickle.dumps(
+        (
+            call_name,
+            message.__class__.__name__,
+            message.to_data()
+        ),
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+    return hashlib.blake2b(
+        request_data,
+        digest_size=16
+    ).digest()
@@ -0,0 +1,133 @@
+import pickle
+import time
+from mercury_sync.models.cache_policy import CachePolicy
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Union
+)
+from .cache_entry import CacheEntry
+from .eviction import (
+    LFUEviction,
+    LRUEviction
+)
+
+
+class ResponseCache:
+
+    def __init__(
+        self,
+        policy: CachePolicy
+    ) -> None:
+        self.policy = policy
+
+        self.ttl = policy.ttl
+        self.max_entries = policy.max_entries
+        self.max_bytes = policy.max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.size = 0
+
+        self._entries: Dict[Hashable, CacheEntry] = {}
+
+        if policy.eviction == 'lfu':
+            self._eviction = LFUEviction()
+
+        else:
+            self._eviction = LRUEviction()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable) -> Union[Any, None]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry.expired(time.monotonic()):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+
+            return None
+        
+        self._eviction.touch(key)
+        self.hits += 1
+
+        return entry.value
+    
+    def put(
+        self,
+        key: Hashable,
+        value: Any
+    ):
+        
+        size = 0
+        if self.max_bytes:
+            size = len(
+                pickle.dumps(
+                    value,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            )
+
+            # Never admit a single response larger than the whole cache.
+            if size > self.max_bytes:
+                return
+
+        if key in self._entries:
+            self._remove(key)
+
+        while len(self._entries) >= self.max_entries or (
+            self.max_bytes and self.size + size > self.max_bytes
+        ):
+            victim = self._eviction.victim()
+
+            if victim is None:
+                break
+
+            self._remove(victim)
+            self.evictions += 1
+
+        self._entries[key] = CacheEntry(
+            value,
+            time.monotonic() + self.ttl,
+            size=size
+        )
+
+        self._eviction.add(key)
+        self.size += size
+
+    def invalidate(self, key: Hashable) -> bool:
+
+        if key in self._entries:
+            self._remove(key)
+            return True
+        
+        return False
+    
+    def clear(self):
+        self._entries.clear()
+        self._eviction.clear()
+        self.size = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'entries': len(self._entries),
+            'size': self.size
+        }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._eviction.remove(key)
+        self.size -= entry.size
@@ -0,0 +1,3 @@
+from .circuit_open_error import CircuitOpenError
+from .peer_circuit_breaker import PeerCircuitBreaker
+from .peer_circuit_breakers import PeerCircuitBreakers
\ No newline at end of file
@@ -0,0 +1,19 @@
+import asyncio
+from typing import Tuple
+
+
+class CircuitOpenError(asyncio.TimeoutError):
+    # Subclasses TimeoutError so callers that already treat a peer
+    # timing out as a failure handle a fast-failed call the same way.
+
+    def __init__(
+        self,
+        address: Tuple[str, int]
+    ) -> None:
+        host, port = address
+
+        self.address = address
+
+        super().__init__(
+            f'Err. - Circuit open for peer - {host}:{port}'
+        )
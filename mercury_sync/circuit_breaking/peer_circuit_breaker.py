@@ -0,0 +1,163 @@
+from mercury_sync.middleware.circuit_breaker.circuit_breaker_state import CircuitBreakerState
+from typing import List
+
+
+class PeerCircuitBreaker:
+
+    __slots__ = (
+        'failure_threshold',
+        'min_requests',
+        'open_time',
+        'half_open_requests',
+        'bucket_width',
+        'bucket_ids',
+        'bucket_requests',
+        'bucket_failures',
+        'state',
+        'opened_at',
+        'half_opened_at',
+        'half_open_inflight',
+        'half_open_successes',
+        'rejected',
+        'trips'
+    )
+
+    def __init__(
+        self,
+        failure_threshold: float,
+        failure_window: float,
+        min_requests: int,
+        open_time: float,
+        half_open_requests: int,
+        buckets: int=10
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.open_time = open_time
+        self.half_open_requests = max(half_open_requests, 1)
+
+        # The window is split into fixed buckets so recording an
+        # outcome and checking the failure rate stay O(buckets).
+        self.bucket_width = failure_window/buckets
+        self.bucket_ids: List[int] = [-1] * buckets
+        self.bucket_requests: List[int] = [0] * buckets
+        self.bucket_failures: List[int] = [0] * buckets
+
+        self.state = CircuitBreakerState.CLOSED
+        self.opened_at = 0
+        self.half_opened_at = 0
+        self.half_open_inflight = 0
+        self.half_open_successes = 0
+
+        self.rejected = 0
+        self.trips = 0
+
+    def allow(self, current_time: float) -> bool:
+
+        if self.state == CircuitBreakerState.OPEN:
+
+            if current_time - self.opened_at < self.open_time:
+                self.rejected += 1
+                return False
+            
+            self.state = CircuitBreakerState.HALF_OPEN
+            self.half_opened_at = current_time
+            self.half_open_inflight = 0
+            self.half_open_successes = 0
+
+        if self.state == CircuitBreakerState.HALF_OPEN:
+
+            probes_expired = current_time - self.half_opened_at >= self.open_time
+
+            if self.half_open_inflight >= self.half_open_requests and probes_expired:
+                # Probes that never reported back (i.e. abandoned before
+                # completing) would otherwise hold the breaker half-open.
+                self.half_opened_at = current_time
+                self.half_open_inflight = 0
+
+            elif self.half_open_inflight >= self.half_open_requests:
+                self.rejected += 1
+                return False
+            
+            self.half_open_inflight += 1
+
+        return True
+    
+    def release(self):
+        # Cancelled calls say nothing about peer health, but must
+        # still give back any half-open probe slot they held.
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            self.half_open_inflight = max(self.half_open_inflight - 1, 0)
+
+    def record(
+        self,
+        current_time: float,
+        failed: bool
+    ):
+        
+        if self.state == CircuitBreakerState.OPEN:
+            return
+
+        if self.state == CircuitBreakerState.HALF_OPEN:
+            self.half_open_inflight = max(self.half_open_inflight - 1, 0)
+
+            if failed:
+                self._open(current_time)
+                return
+            
+            self.half_open_successes += 1
+            if self.half_open_successes >= self.half_open_requests:
+                self._close()
+
+            return
+        
+        bucket_id = int(current_time/self.bucket_width)
+        slot = bucket_id % len(self.bucket_ids)
+
+        if self.bucket_ids[slot] != bucket_id:
+            self.bucket_ids[slot] = bucket_id
+            self.bucket_requests[slot] = 0
+            self.bucket_failures[slot] = 0
+
+        self.bucket_requests[slot] += 1
+        if failed:
+            self.bucket_failures[slot] += 1
+
+        if failed is False:
+            return
+        
+        oldest_bucket = bucket_id - len(self.bucket_ids)
+        requests = 0
+        failures = 0
+
+        for idx, window_bucket_id in enumerate(self.bucket_ids):
+            if window_bucket_id > oldest_bucket:
+                requests += self.bucket_requests[idx]
+                failures += self.bucket_failures[idx]
+
+        if requests >= self.min_requests and failures/requests >= self.failure_threshold:
+            self._open(current_time)
+
+    def _open(self, current_time: float):
+        self.state = CircuitBreakerState.OPEN
+        self.opened_at = current_time
+        self.half_open_inflight = 0
+        self.half_open_successes = 0
+        self.trips += 1
+
+    def _close(self):
+        self.state = CircuitBreakerState.CLOSED
+        self.half_open_inflight = 0
+        self.half_open_successes = 0
+
+        for idx in range(len(self.bucket_ids)):
+            self.bucket_ids[idx] = -1
+            self.bucket_requests[idx] = 0
+            self.bucket_failures[idx] = 0
+
+    def to_dict(self):
+        return {
+            'state': self.state.value,
+            'rejected': self.rejected,
+            'trips': self.trips
+        }
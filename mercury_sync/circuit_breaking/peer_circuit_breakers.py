@@ -0,0 +1,87 @@
+import time
+from mercury_sync.env import Env
+from mercury_sync.env.time_parser import TimeParser
+from typing import (
+    Dict,
+    Tuple
+)
+from .circuit_open_error import CircuitOpenError
+from .peer_circuit_breaker import PeerCircuitBreaker
+
+
+class PeerCircuitBreakers:
+
+    def __init__(
+        self,
+        env: Env
+    ) -> None:
+        self.failure_threshold = env.MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        self.failure_window = TimeParser(
+            env.MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_WINDOW
+        ).time
+        self.min_requests = env.MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_MIN_REQUESTS
+        self.open_time = TimeParser(
+            env.MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_OPEN_TIME
+        ).time
+        self.half_open_requests = env.MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_HALF_OPEN_REQUESTS
+
+        self._breakers: Dict[Tuple[str, int], PeerCircuitBreaker] = {}
+
+    def get(
+        self,
+        address: Tuple[str, int]
+    ) -> PeerCircuitBreaker:
+        breaker = self._breakers.get(address)
+
+        if breaker is None:
+            breaker = PeerCircuitBreaker(
+                self.failure_threshold,
+                self.failure_window,
+                self.min_requests,
+                self.open_time,
+                self.half_open_requests
+            )
+
+            self._breakers[address] = breaker
+
+        return breaker
+
+    def check(
+        self,
+        address: Tuple[str, int]
+    ):
+        if self.get(address).allow(time.monotonic()) is False:
+            raise CircuitOpenError(address)
+        
+    def record(
+        self,
+        address: Tuple[str, int],
+        failed: bool=False,
+        cancelled: bool=False
+    ):
+        breaker = self._breakers.get(address)
+        if breaker is None:
+            return
+        
+        if cancelled:
+            breaker.release()
+            return
+        
+        breaker.record(
+            time.monotonic(),
+            failed
+        )
+
+    def remove(
+        self,
+        address: Tuple[str, int]
+    ):
+        self._breakers.pop(address, None)
+
+    def to_dict(self):
+        return {
+            f'{host}:{port}': breaker.to_dict() for (
+                host,
+                port
+            ), breaker in self._breakers.items()
+        }
@@ -0,0 +1 @@
+from .request_coalescer import RequestCoalescer
\ No newline at end of file
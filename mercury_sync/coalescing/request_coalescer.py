@@ -0,0 +1,78 @@
+import asyncio
+from mercury_sync.caching.request_key import create_request_key
+from mercury_sync.models.message import Message
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Hashable
+)
+
+
+class RequestCoalescer:
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def create_key(
+        self,
+        call_name: str,
+        message: Message
+    ) -> bytes:
+        return create_request_key(
+            call_name,
+            message
+        )
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Coroutine
+    ) -> Any:
+        
+        inflight_call = self._inflight.get(key)
+
+        if inflight_call is not None:
+            call.close()
+            self.hits += 1
+
+            # Shield the shared call so one caller timing out
+            # does not cancel the request for everyone else.
+            return await asyncio.shield(inflight_call)
+        
+        self.misses += 1
+
+        inflight_call = asyncio.ensure_future(call)
+        self._inflight[key] = inflight_call
+
+        inflight_call.add_done_callback(
+            lambda completed: self._complete(key, completed)
+        )
+
+        return await asyncio.shield(inflight_call)
+    
+    def _complete(
+        self,
+        key: Hashable,
+        completed: asyncio.Future
+    ):
+        self._inflight.pop(key, None)
+
+        # Retrieve the exception so calls whose callers have all
+        # been cancelled do not log an unretrieved exception.
+        if completed.cancelled() is False:
+            completed.exception()
+    
+    def to_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'inflight': self.inflight
+        }
@@ -0,0 +1,68 @@
+import asyncio
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+
+BatchResponse = Tuple[Union[int, None], Dict[str, Any]]
+
+
+class BatchWaiter:
+
+    __slots__ = (
+        'waiter',
+        'responses',
+        'remaining',
+        'on_response'
+    )
+
+    def __init__(
+        self,
+        size: int,
+        waiter: asyncio.Future,
+        on_response: Optional[
+            Callable[
+                [int, BatchResponse],
+                None
+            ]
+        ]=None
+    ) -> None:
+        self.waiter = waiter
+        self.responses: List[Union[BatchResponse, None]] = [None] * size
+        self.remaining = size
+        self.on_response = on_response
+
+    def receive(
+        self,
+        responses: List[
+            Tuple[
+                int,
+                Union[int, None],
+                Dict[str, Any]
+            ]
+        ]
+    ):
+        for idx, shard_id, data in responses:
+
+            if idx >= len(self.responses) or self.responses[idx] is not None:
+                continue
+
+            response: BatchResponse = (
+                shard_id,
+                data
+            )
+
+            self.responses[idx] = response
+            self.remaining -= 1
+
+            if self.on_response:
+                self.on_response(idx, response)
+
+        if self.remaining < 1 and self.waiter.done() is False:
+            self.waiter.set_result(self.responses)
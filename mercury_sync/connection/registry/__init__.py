@@ -0,0 +1 @@
+from .connection_registry import ConnectionRegistry
\ No newline at end of file
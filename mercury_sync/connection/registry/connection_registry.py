@@ -0,0 +1,82 @@
+from collections import defaultdict
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+
+
+class ConnectionRegistry:
+
+    def __init__(self) -> None:
+        self._refcounts: Dict[Tuple[str, int], int] = defaultdict(int)
+        self._routes: Dict[
+            Tuple[str, int],
+            Dict[Any, Tuple[str, int]]
+        ] = defaultdict(dict)
+
+    def __contains__(self, address: Tuple[str, int]) -> bool:
+        return self._refcounts.get(address, 0) > 0
+    
+    def __len__(self):
+        return len(self._refcounts)
+
+    def acquire(
+        self,
+        address: Tuple[str, int]
+    ) -> bool:
+        self._refcounts[address] += 1
+        return self._refcounts[address] == 1
+
+    def release(
+        self,
+        address: Tuple[str, int]
+    ) -> bool:
+        
+        if address not in self:
+            return False
+        
+        self._refcounts[address] -= 1
+        if self._refcounts[address] > 0:
+            return False
+        
+        del self._refcounts[address]
+
+        return True
+
+    def add_route(
+        self,
+        address: Tuple[str, int],
+        connection: Any,
+        target: Tuple[str, int]
+    ):
+        self._routes[address][connection] = target
+
+    def get_route(
+        self,
+        address: Tuple[str, int],
+        connection: Any
+    ) -> Tuple[str, int]:
+        return self._routes[address][connection]
+    
+    def routes(
+        self,
+        address: Tuple[str, int]
+    ) -> List[Tuple[Any, Tuple[str, int]]]:
+        return list(self._routes.get(address, {}).items())
+
+    def remove(
+        self,
+        address: Tuple[str, int]
+    ) -> List[Tuple[Any, Tuple[str, int]]]:
+        self._refcounts.pop(address, None)
+        return list(self._routes.pop(address, {}).items())
+    
+    def to_dict(self):
+        return {
+            f'{host}:{port}': refcount for (
+                host,
+                port
+            ), refcount in self._refcounts.items()
+        }
@@ -287,12 +287,10 @@ class MercurySyncHTTPConnection(MercurySyncTCPConnection):
     ) -> None:
         
         if self._is_server:
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._route_request(
-                        data,
-                        transport
-                    )
+            self._tasks.spawn(
+                self._route_request(
+                    data,
+                    transport
                 )
             )
 
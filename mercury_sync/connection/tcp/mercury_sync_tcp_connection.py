@@ -1,16 +1,32 @@
 
 import asyncio
+import mmap
+import os
 import pickle
 import socket
 import ssl
+import zlib
 import zstandard
 from collections import deque, defaultdict
+from mercury_sync.connection.base.batch_waiter import (
+    BatchResponse,
+    BatchWaiter
+)
 from mercury_sync.connection.base.connection_type import ConnectionType
+from mercury_sync.deduplication import DeduplicationCache
 from mercury_sync.encryption import AESGCMFernet
 from mercury_sync.env import Env
 from mercury_sync.env.time_parser import TimeParser
+from mercury_sync.models.bulk_transfer import BulkTransfer
 from mercury_sync.models.message import Message
 from mercury_sync.snowflake.snowflake_generator import SnowflakeGenerator
+from mercury_sync.tasks import TaskSupervisor
+from mercury_sync.streaming import StreamSession
+from mercury_sync.transfers import (
+    InboundTransfer,
+    OutboundTransfer,
+    checksum
+)
 from typing import (
     Tuple, 
     Deque, 
@@ -18,6 +34,8 @@ from typing import (
     Dict, 
     Coroutine, 
     AsyncIterable,
+    Callable,
+    List,
     Union,
     Optional
 )
@@ -57,7 +75,14 @@ class MercurySyncTCPConnection:
         self._server: asyncio.Server = None
         self._loop: Union[asyncio.AbstractEventLoop, None] = None
         self._waiters: Dict[str, Deque[asyncio.Future]] = defaultdict(deque)
-        self._pending_responses: Deque[asyncio.Task]= deque()
+        self._batch_waiters: Dict[int, BatchWaiter] = {}
+        self._waiter_targets: Dict[asyncio.Future, Any] = {}
+        self._read_buffers: Dict[asyncio.Transport, bytearray] = {}
+        self._read_decompressors: Dict[asyncio.Transport, Any] = {}
+        self._sessions: Dict[int, StreamSession] = {}
+        self._server_sessions: Dict[Tuple[asyncio.Transport, int], StreamSession] = {}
+        self._outbound_transfers: Dict[int, OutboundTransfer] = {}
+        self._inbound_transfers: Dict[Tuple[asyncio.Transport, int], InboundTransfer] = {}
         self._last_call: Deque[str] = deque()
 
         self._sent_values = deque()
@@ -77,11 +102,24 @@ class MercurySyncTCPConnection:
         self._semaphore: Union[asyncio.Semaphore, None] = None
         self._compressor: Union[zstandard.ZstdCompressor, None] = None
         self._decompressor: Union[zstandard.ZstdDecompressor, None] = None
-        self._cleanup_task: Union[asyncio.Task, None] = None
-        self._sleep_task: Union[asyncio.Task, None] = None
-        self._cleanup_interval = TimeParser(env.MERCURY_SYNC_CLEANUP_INTERVAL).time
         self._max_concurrency = env.MERCURY_SYNC_MAX_CONCURRENCY
+        self._tasks = TaskSupervisor(
+            max_pending=self._max_concurrency
+        )
         self._tcp_connect_retries = env.MERCURY_SYNC_TCP_CONNECT_RETRIES
+        self._transfer_directory = env.MERCURY_SYNC_TRANSFER_DIRECTORY
+        self._transfer_chunk_size = env.MERCURY_SYNC_TRANSFER_CHUNK_SIZE
+        self._transfer_window = env.MERCURY_SYNC_TRANSFER_WINDOW
+        self._transfer_idle_timeout = TimeParser(
+            env.MERCURY_SYNC_TRANSFER_IDLE_TIMEOUT
+        ).time
+
+        self._deduplication: Union[DeduplicationCache, None] = None
+        if env.MERCURY_SYNC_USE_REQUEST_DEDUPLICATION:
+            self._deduplication = DeduplicationCache(
+                TimeParser(env.MERCURY_SYNC_DEDUPLICATION_WINDOW).time,
+                env.MERCURY_SYNC_DEDUPLICATION_MAX_ENTRIES
+            )
 
         self.connection_type = ConnectionType.TCP
 
@@ -130,7 +168,8 @@ class MercurySyncTCPConnection:
 
             server = self._loop.create_server(
                 lambda: MercurySyncTCPServerProtocol(
-                    self.read
+                    self.read,
+                    on_connection_lost=self._release_transport
                 ),
                 sock=self.server_socket,
                 ssl=self._server_ssl_context
@@ -140,8 +179,6 @@ class MercurySyncTCPConnection:
 
             self.connected = True
 
-            self._cleanup_task = self._loop.create_task(self._cleanup())
-
     async def connect_async(
         self,
         cert_path: Optional[str]=None,
@@ -192,7 +229,8 @@ class MercurySyncTCPConnection:
 
             server = await self._loop.create_server(
                 lambda: MercurySyncTCPServerProtocol(
-                    self.read
+                    self.read,
+                    on_connection_lost=self._release_transport
                 ),
                 sock=self.server_socket,
                 ssl=self._server_ssl_context
@@ -201,8 +239,6 @@ class MercurySyncTCPConnection:
             self._server = server
             self.connected = True
 
-            self._cleanup_task = self._loop.create_task(self._cleanup())
-
     def _create_server_ssl_context(
         self, 
         cert_path: Optional[str]=None,
@@ -266,7 +302,8 @@ class MercurySyncTCPConnection:
 
                 client_transport, _ = await self._loop.create_connection(
                     lambda: MercurySyncTCPClientProtocol(
-                        self.read
+                        self.read,
+                        on_connection_lost=self._release_transport
                     ),
                     sock=tcp_socket,
                     ssl=self._client_ssl_context
@@ -283,6 +320,52 @@ class MercurySyncTCPConnection:
 
         if last_error:
             raise last_error
+        
+    async def close_client(
+        self,
+        address: Tuple[str, int]
+    ) -> None:
+        client_transport = self._client_transports.pop(address, None)
+
+        if client_transport:
+            self._release_transport(client_transport)
+            client_transport.close()
+
+    def _release_transport(self, transport: asyncio.Transport):
+        self._read_buffers.pop(transport, None)
+        self._read_decompressors.pop(transport, None)
+
+        for address, client_transport in list(self._client_transports.items()):
+            if client_transport is transport:
+                self._client_transports.pop(address)
+
+        # Transfers can't continue on another connection, so both ends
+        # fail now and the caller retries, resuming from the partial file.
+        for transfer in list(self._outbound_transfers.values()):
+            if transfer.transport is transport:
+                transfer.finish(
+                    self._transfer_error(
+                        f'Err. - Connection lost during transfer - {transfer.transfer_id}'
+                    )
+                )
+
+        for (transfer_transport, transfer_id), transfer in list(self._inbound_transfers.items()):
+            if transfer_transport is transport:
+                transfer.abort(
+                    ConnectionResetError(
+                        f'Err. - Connection lost during transfer - {transfer_id}'
+                    )
+                )
+
+    def _transfer_error(self, error: str) -> Tuple[None, Dict[str, Any]]:
+        return (
+            None,
+            {
+                'host': self.host,
+                'port': self.port,
+                'error': error
+            }
+        )
     
     def _create_client_ssl_context(
         self, 
@@ -307,36 +390,17 @@ class MercurySyncTCPConnection:
 
         return ssl_ctx
     
-    async def _cleanup(self):
-        while self._running:
-            self._sleep_task = asyncio.create_task(
-                asyncio.sleep(self._cleanup_interval)
-            )
-
-            await self._sleep_task
-
-            for pending in list(self._pending_responses):
-                if pending.done() or pending.cancelled():
-
-                    try:
-                        await pending
-
-                    except Exception:
-                        await self.close()
-                        await self.connect_async(
-                            cert_path=self._client_cert_path,
-                            key_path=self._client_key_path
-                        )
-
-                    self._pending_responses.pop()
-
     async def send(
         self, 
         event_name: bytes,
         data: bytes, 
-        address: Tuple[str, int]
+        address: Tuple[str, int],
+        request_id: Optional[int]=None
     ) -> Tuple[int, Dict[str, Any]]:
         
+        if request_id is None:
+            request_id = self.id_generator.generate()
+        
         async with self._semaphore:
             self._last_call.append(event_name)
 
@@ -353,7 +417,7 @@ class MercurySyncTCPConnection:
             item = pickle.dumps(
                 (
                     'request',
-                    self.id_generator.generate(),
+                    request_id,
                     event_name,
                     data,
                     self.host,
@@ -369,21 +433,687 @@ class MercurySyncTCPConnection:
 
             waiter = self._loop.create_future()
             self._waiters[event_name].append(waiter)
+            self._waiter_targets[waiter] = client_transport
 
-            (
-                _,
-                shard_id,
-                _,
-                response_data,
-                _, 
-                _
-            ) = await waiter
+            try:
+                (
+                    _,
+                    shard_id,
+                    _,
+                    response_data,
+                    _, 
+                    _
+                ) = await waiter
+
+            except asyncio.CancelledError:
+                # Hedged or timed out calls are cancelled by the caller, so
+                # drop the waiter rather than leave it to swallow a response.
+                self._discard_waiter(event_name, waiter)
+                raise
+
+            finally:
+                self._waiter_targets.pop(waiter, None)
 
             return (
                 shard_id,
                 response_data
             )
         
+    async def notify(
+        self,
+        event_name: str,
+        data: Any,
+        address: Tuple[str, int]
+    ) -> None:
+        
+        async with self._semaphore:
+
+            client_transport = self._client_transports.get(address)
+            if client_transport is None:
+                await self.connect_client(
+                    address,
+                    cert_path=self._client_cert_path,
+                    key_path=self._client_key_path
+                )
+
+                client_transport = self._client_transports.get(address)
+
+            item = pickle.dumps(
+                (
+                    'notify',
+                    self.id_generator.generate(),
+                    event_name,
+                    data,
+                    self.host,
+                    self.port
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+            encrypted_message = self._encryptor.encrypt(item)
+            compressed = self._compressor.compress(encrypted_message)
+
+            client_transport.write(compressed)
+        
+    async def open_session(
+        self,
+        event_name: str,
+        items: AsyncIterable[Any],
+        address: Tuple[str, int],
+        window: int=64
+    ) -> AsyncIterable[Tuple[Union[int, None], Dict[str, Any]]]:
+        
+        client_transport = self._client_transports.get(address)
+        if client_transport is None:
+            await self.connect_client(
+                address,
+                cert_path=self._client_cert_path,
+                key_path=self._client_key_path
+            )
+
+            client_transport = self._client_transports.get(address)
+
+        session_id = self.id_generator.generate()
+        session = StreamSession(
+            session_id,
+            event_name,
+            window,
+            lambda credits: self._write_frame(
+                client_transport,
+                'session_credit',
+                session_id,
+                event_name,
+                credits
+            )
+        )
+
+        self._sessions[session_id] = session
+
+        self._write_frame(
+            client_transport,
+            'session_open',
+            session_id,
+            event_name,
+            session.window
+        )
+
+        sender = asyncio.create_task(
+            self._send_session_items(
+                session,
+                items,
+                client_transport
+            )
+        )
+
+        try:
+            async for response in session.items():
+                yield response
+
+            if session.error:
+                yield (
+                    None,
+                    {
+                        'host': address[0],
+                        'port': address[1],
+                        'error': session.error
+                    }
+                )
+
+        finally:
+            self._sessions.pop(session_id, None)
+            session.close()
+
+            if sender.done() is False:
+                sender.cancel()
+
+    async def _send_session_items(
+        self,
+        session: StreamSession,
+        items: AsyncIterable[Any],
+        transport: asyncio.Transport
+    ) -> None:
+        
+        try:
+            async for item in items:
+                await session.outbound.acquire()
+
+                self._write_frame(
+                    transport,
+                    'session_data',
+                    session.session_id,
+                    session.event_name,
+                    [
+                        (
+                            self.id_generator.generate(), 
+                            item
+                        )
+                    ]
+                )
+
+        except Exception as send_error:
+            session.finish(
+                error=str(send_error) or send_error.__class__.__name__
+            )
+
+        self._write_frame(
+            transport,
+            'session_close',
+            session.session_id,
+            session.event_name,
+            None
+        )
+
+    def _open_server_session(
+        self,
+        session_id: int,
+        event_name: str,
+        window: int,
+        transport: asyncio.Transport
+    ) -> None:
+        session = StreamSession(
+            session_id,
+            event_name,
+            window,
+            lambda credits: self._write_frame(
+                transport,
+                'session_credit',
+                session_id,
+                event_name,
+                credits
+            )
+        )
+
+        self._server_sessions[(transport, session_id)] = session
+
+        self._tasks.spawn(
+            self._run_server_session(
+                session,
+                transport
+            )
+        )
+
+    async def _run_server_session(
+        self,
+        session: StreamSession,
+        transport: asyncio.Transport
+    ) -> None:
+        error: Union[str, None] = None
+        
+        try:
+            async for response in self.events.get(session.event_name)(
+                session.session_id,
+                session.items()
+            ):
+                await session.outbound.acquire()
+
+                self._write_frame(
+                    transport,
+                    'session_response',
+                    session.session_id,
+                    session.event_name,
+                    (
+                        self.id_generator.generate(),
+                        response.to_data()
+                    )
+                )
+
+        except Exception as session_error:
+            error = str(session_error) or session_error.__class__.__name__
+
+        finally:
+            self._server_sessions.pop((transport, session.session_id), None)
+            session.close()
+
+        self._write_frame(
+            transport,
+            'session_end',
+            session.session_id,
+            session.event_name,
+            error
+        )
+
+    async def send_file(
+        self,
+        event_name: str,
+        path: str,
+        address: Tuple[str, int],
+        name: Optional[str]=None,
+        compress: bool=True,
+        chunk_size: Optional[int]=None,
+        window: Optional[int]=None
+    ) -> Tuple[Union[int, None], Dict[str, Any]]:
+        
+        with open(path, 'rb') as transfer_file:
+            size = os.fstat(transfer_file.fileno()).st_size
+
+            if size < 1:
+                return await self.send_buffer(
+                    event_name,
+                    b'',
+                    address,
+                    name=name or os.path.basename(path),
+                    compress=compress,
+                    chunk_size=chunk_size,
+                    window=window
+                )
+
+            # Chunks are sliced from the mapping and copied one at a time,
+            # so memory use stays at roughly a window of chunks regardless
+            # of file size.
+            with mmap.mmap(
+                transfer_file.fileno(),
+                size,
+                access=mmap.ACCESS_READ
+            ) as mapped:
+                view = memoryview(mapped)
+
+                try:
+                    return await self.send_buffer(
+                        event_name,
+                        view,
+                        address,
+                        name=name or os.path.basename(path),
+                        compress=compress,
+                        chunk_size=chunk_size,
+                        window=window
+                    )
+                
+                finally:
+                    view.release()
+
+    async def send_buffer(
+        self,
+        event_name: str,
+        buffer: Union[bytes, bytearray, memoryview],
+        address: Tuple[str, int],
+        name: str,
+        compress: bool=True,
+        chunk_size: Optional[int]=None,
+        window: Optional[int]=None
+    ) -> Tuple[Union[int, None], Dict[str, Any]]:
+        
+        client_transport = self._client_transports.get(address)
+        if client_transport is None:
+            await self.connect_client(
+                address,
+                cert_path=self._client_cert_path,
+                key_path=self._client_key_path
+            )
+
+            client_transport = self._client_transports.get(address)
+
+        if chunk_size is None:
+            chunk_size = self._transfer_chunk_size
+
+        if window is None:
+            window = self._transfer_window
+
+        view = memoryview(buffer)
+        size = view.nbytes
+
+        transfer_checksum = await self._loop.run_in_executor(
+            None,
+            checksum,
+            view
+        )
+
+        transfer_id = self.id_generator.generate()
+        transfer = OutboundTransfer(
+            transfer_id,
+            event_name,
+            window,
+            client_transport
+        )
+
+        self._outbound_transfers[transfer_id] = transfer
+
+        try:
+            self._write_frame(
+                client_transport,
+                'transfer_open',
+                transfer_id,
+                event_name,
+                {
+                    'name': name,
+                    'size': size,
+                    'checksum': transfer_checksum,
+                    'chunk_size': chunk_size
+                }
+            )
+
+            offset = await asyncio.wait_for(
+                transfer.ready,
+                timeout=self._transfer_idle_timeout
+            )
+
+            if offset is not None:
+                for chunk_offset in range(offset, size, chunk_size):
+
+                    try:
+                        await asyncio.wait_for(
+                            transfer.window.acquire(),
+                            timeout=self._transfer_idle_timeout
+                        )
+
+                    except ConnectionResetError:
+                        break
+
+                    data = bytes(view[chunk_offset:chunk_offset + chunk_size])
+                    crc = zlib.crc32(data)
+
+                    if compress:
+                        data = self._compressor.compress(data)
+
+                    self._write_frame(
+                        client_transport,
+                        'transfer_chunk',
+                        transfer_id,
+                        event_name,
+                        (
+                            chunk_offset,
+                            data,
+                            crc,
+                            compress
+                        )
+                    )
+
+                self._write_frame(
+                    client_transport,
+                    'transfer_commit',
+                    transfer_id,
+                    event_name,
+                    None
+                )
+
+            return await transfer.done
+        
+        except asyncio.TimeoutError:
+            return self._transfer_error(
+                f'Err. - Transfer - {transfer_id} - idle for more than - {self._transfer_idle_timeout}s'
+            )
+
+        finally:
+            self._outbound_transfers.pop(transfer_id, None)
+            transfer.cancel()
+
+    def _open_transfer(
+        self,
+        transfer_id: int,
+        event_name: str,
+        transfer_info: Dict[str, Any],
+        transport: asyncio.Transport
+    ) -> None:
+        try:
+            if self.events.get(event_name) is None:
+                raise ValueError(
+                    f'Err. - No handler for transfer event - {event_name}'
+                )
+
+            transfer = InboundTransfer(
+                transfer_id,
+                event_name,
+                transfer_info.get('name'),
+                transfer_info.get('size'),
+                transfer_info.get('checksum'),
+                transfer_info.get('chunk_size'),
+                self._transfer_directory
+            )
+
+        except Exception as transfer_error:
+            self._write_frame(
+                transport,
+                'transfer_done',
+                transfer_id,
+                event_name,
+                self._transfer_error(
+                    str(transfer_error)
+                )
+            )
+
+            return
+
+        self._inbound_transfers[(transport, transfer_id)] = transfer
+
+        self._tasks.spawn(
+            self._receive_transfer(
+                transfer,
+                transport
+            )
+        )
+
+    async def _receive_transfer(
+        self,
+        transfer: InboundTransfer,
+        transport: asyncio.Transport
+    ) -> None:
+        
+        credit_batch = max(self._transfer_window//2, 1)
+        written = 0
+
+        try:
+            offset = await self._loop.run_in_executor(
+                None,
+                transfer.open
+            )
+
+            self._write_frame(
+                transport,
+                'transfer_ready',
+                transfer.transfer_id,
+                transfer.event_name,
+                offset
+            )
+
+            while True:
+                chunk: Union[Tuple[int, bytes, int, bool], None] = await asyncio.wait_for(
+                    transfer.chunks.get(),
+                    timeout=self._transfer_idle_timeout
+                )
+
+                if transfer.error:
+                    raise transfer.error
+
+                if chunk is None:
+                    break
+
+                chunk_offset, data, crc, compressed = chunk
+
+                if compressed:
+                    data = self._decompressor.decompress(data)
+
+                if zlib.crc32(data) != crc:
+                    transfer.discard()
+
+                    raise ValueError(
+                        f'Err. - Checksum mismatch for chunk at offset - {chunk_offset}'
+                    )
+
+                await self._loop.run_in_executor(
+                    None,
+                    transfer.write,
+                    chunk_offset,
+                    data
+                )
+
+                written += 1
+                if written >= credit_batch:
+                    self._write_frame(
+                        transport,
+                        'transfer_credit',
+                        transfer.transfer_id,
+                        transfer.event_name,
+                        written
+                    )
+
+                    written = 0
+
+            await self._loop.run_in_executor(
+                None,
+                transfer.commit
+            )
+
+            response: Message = await self.events.get(transfer.event_name)(
+                transfer.transfer_id,
+                BulkTransfer(
+                    name=transfer.name,
+                    path=transfer.path,
+                    size=transfer.size,
+                    checksum=transfer.checksum
+                )
+            )
+
+            result = (
+                self.id_generator.generate(),
+                response.to_data()
+            )
+
+        except asyncio.TimeoutError:
+            result = self._transfer_error(
+                f'Err. - Transfer - {transfer.transfer_id} - idle for more than - {self._transfer_idle_timeout}s'
+            )
+
+        except Exception as transfer_error:
+            result = self._transfer_error(
+                str(transfer_error) or transfer_error.__class__.__name__
+            )
+
+        finally:
+            self._inbound_transfers.pop((transport, transfer.transfer_id), None)
+            transfer.close()
+
+        self._write_frame(
+            transport,
+            'transfer_done',
+            transfer.transfer_id,
+            transfer.event_name,
+            result
+        )
+
+    def _write_frame(
+        self,
+        transport: asyncio.Transport,
+        message_type: str,
+        shard_id: int,
+        event_name: str,
+        payload: Any
+    ) -> None:
+        
+        if transport.is_closing():
+            return
+        
+        item = pickle.dumps(
+            (
+                message_type,
+                shard_id,
+                event_name,
+                payload,
+                self.host,
+                self.port
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        encrypted_message = self._encryptor.encrypt(item)
+        compressed = self._compressor.compress(encrypted_message)
+
+        transport.write(compressed)
+
+    def _discard_waiter(
+        self,
+        event_name: str,
+        waiter: asyncio.Future
+    ):
+        try:
+            self._waiters[event_name].remove(waiter)
+
+        except ValueError:
+            pass
+
+    def _pop_waiter(
+        self,
+        event_name: str,
+        target: Any
+    ) -> asyncio.Future:
+        event_waiter = self._waiters[event_name]
+
+        # Connections are shared between remotes, so prefer the waiter
+        # for the peer that answered over the most recent one.
+        for waiter in reversed(event_waiter):
+            if self._waiter_targets.get(waiter) == target:
+                event_waiter.remove(waiter)
+                break
+
+        else:
+            waiter = event_waiter.pop()
+
+        self._waiter_targets.pop(waiter, None)
+
+        return waiter
+
+    async def send_batch(
+        self,
+        event_name: str,
+        data: List[Any],
+        address: Tuple[str, int],
+        on_response: Optional[
+            Callable[
+                [int, BatchResponse],
+                None
+            ]
+        ]=None
+    ) -> List[BatchResponse]:
+        
+        async with self._semaphore:
+
+            client_transport = self._client_transports.get(address)
+            if client_transport is None:
+                await self.connect_client(
+                    address,
+                    cert_path=self._client_cert_path,
+                    key_path=self._client_key_path
+                )
+
+                client_transport = self._client_transports.get(address)
+
+            # Responders echo the batch id back, so concurrent batches to
+            # different remotes on one event can't resolve each other.
+            batch_id = self.id_generator.generate()
+
+            item = pickle.dumps(
+                (
+                    'batch_request',
+                    batch_id,
+                    event_name,
+                    data,
+                    self.host,
+                    self.port
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+            encrypted_message = self._encryptor.encrypt(item)
+            compressed = self._compressor.compress(encrypted_message)
+
+            client_transport.write(compressed)
+
+            # Responses arrive per item as the remote finishes them, and
+            # are handed to on_response before the whole batch resolves.
+            batch_waiter = BatchWaiter(
+                len(data),
+                self._loop.create_future(),
+                on_response=on_response
+            )
+
+            self._batch_waiters[batch_id] = batch_waiter
+
+            try:
+                return await batch_waiter.waiter
+
+            finally:
+                # Cancelled or timed out batches must not leave their waiter
+                # behind for a late response to land on.
+                self._batch_waiters.pop(batch_id, None)
+        
     async def send_bytes(
         self,
         event_name: str,
@@ -512,37 +1242,72 @@ class MercurySyncTCPConnection:
         data: bytes,
         transport: asyncio.Transport
     ) -> None:
-        decompressed = b''
+        # TCP has no message boundaries - a read may hold several frames
+        # or part of one - so each transport keeps a streaming decompressor
+        # and only the output of the frame in progress, which means every
+        # byte is decompressed once however the frame was split.
+        buffer = self._read_buffers.get(transport)
+        decompressor = self._read_decompressors.get(transport)
 
-        try:
-            decompressed = self._decompressor.decompress(data)
+        if decompressor is None:
+            buffer = bytearray()
+            decompressor = self._decompressor.decompressobj()
 
-        except Exception as decompression_error:
-            self._pending_responses.append(
-                asyncio.create_task(
+        while data:
+
+            try:
+                buffer.extend(
+                    decompressor.decompress(data)
+                )
+
+            except Exception as decompression_error:
+                self._read_buffers.pop(transport, None)
+                self._read_decompressors.pop(transport, None)
+
+                self._tasks.spawn(
                     self._send_error(
                         error_message=str(decompression_error),
                         transport=transport
                     )
                 )
-            )
 
-            if bool(self._last_call):
-                event_name = self._last_call.pop()
-                event_waiter = self._waiters[event_name]
+                if bool(self._last_call):
+                    event_name = self._last_call.pop()
+                    event_waiter = self._waiters[event_name]
 
-                if bool(event_waiter):
-                    waiter = event_waiter.pop()
+                    if bool(event_waiter):
+                        waiter = event_waiter.pop()
 
-                    try:
+                        try:
 
-                        waiter.set_result(None)
+                            waiter.set_result(None)
 
-                    except asyncio.InvalidStateError:
-                        pass
+                        except asyncio.InvalidStateError:
+                            pass
 
-            return
+                return
+            
+            if decompressor.eof is False:
+                break
+            
+            data = decompressor.unused_data
+
+            self._read_message(
+                bytes(buffer),
+                transport
+            )
+
+            buffer = bytearray()
+            decompressor = self._decompressor.decompressobj()
+
+        self._read_buffers[transport] = buffer
+        self._read_decompressors[transport] = decompressor
 
+    def _read_message(
+        self,
+        decompressed: bytes,
+        transport: asyncio.Transport
+    ) -> None:
         decrypted = self._encryptor.decrypt(decompressed)
 
         result: Tuple[
@@ -564,19 +1329,75 @@ class MercurySyncTCPConnection:
         ) = result
 
         if message_type == 'request':
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._read(
-                        event_name,
+
+            deduplication_key: Union[Tuple[str, str, int], None] = None
+            response_waiter: Union[asyncio.Future, None] = None
+
+            if self._deduplication:
+                deduplication_key = (
+                    incoming_host,
+                    event_name,
+                    shard_id
+                )
+
+                cached_response = self._deduplication.get(deduplication_key)
+                if cached_response is not None:
+                    self._tasks.spawn(
+                        self._replay_response(
+                            cached_response,
+                            transport
+                        )
+                    )
+
+                    return
+                
+                response_waiter = self._deduplication.reserve(deduplication_key)
+
+            self._tasks.spawn(
+                self._read(
+                    event_name,
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    ),
+                    transport,
+                    deduplication_key=deduplication_key,
+                    response_waiter=response_waiter
+                )
+            )
+
+        elif message_type == 'notify':
+            self._tasks.spawn(
+                self._read_notification(
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    )
+                )
+            )
+
+        elif message_type == 'batch_request':
+            self._tasks.spawn(
+                self._read_batch(
+                    event_name,
+                    shard_id,
+                    [
                         self.events.get(event_name)(
                             shard_id,
-                            self.parsers[event_name](**payload)
-                        ),
-                        transport
-                    )
+                            self.parsers[event_name](**item_payload)
+                        ) for item_payload in payload
+                    ],
+                    transport
                 )
             )
 
+        elif message_type == 'batch_response':
+
+            batch_waiter = self._batch_waiters.get(shard_id)
+
+            if batch_waiter:
+                batch_waiter.receive(payload)
+
         elif message_type == "stream_connect":
 
             self.queue[event_name].append((
@@ -588,12 +1409,10 @@ class MercurySyncTCPConnection:
                 incoming_port
             ))
 
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._initialize_stream(
-                        event_name,
-                        transport
-                    )
+            self._tasks.spawn(
+                self._initialize_stream(
+                    event_name,
+                    transport
                 )
             )
 
@@ -620,16 +1439,14 @@ class MercurySyncTCPConnection:
                 incoming_port
             ))
 
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._read_iterator(
-                        event_name,
-                        self.events.get(event_name)(
-                            shard_id,
-                            self.parsers[event_name](**payload)
-                        ),
-                        transport
-                    )
+            self._tasks.spawn(
+                self._read_iterator(
+                    event_name,
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    ),
+                    transport
                 )
             )
 
@@ -645,6 +1462,83 @@ class MercurySyncTCPConnection:
                 except asyncio.InvalidStateError:
                     pass
 
+        elif message_type == 'session_open':
+            self._open_server_session(
+                shard_id,
+                event_name,
+                payload,
+                transport
+            )
+
+        elif message_type == 'session_data':
+            session = self._server_sessions.get((transport, shard_id))
+
+            if session:
+                for item_shard_id, item_data in payload:
+                    session.put((
+                        item_shard_id,
+                        self.parsers[event_name](**item_data)
+                    ))
+
+        elif message_type == 'session_close':
+            session = self._server_sessions.get((transport, shard_id))
+
+            if session:
+                session.finish()
+
+        elif message_type == 'session_credit':
+            session = self._server_sessions.get(
+                (transport, shard_id),
+                self._sessions.get(shard_id)
+            )
+
+            if session:
+                session.outbound.grant(payload)
+
+        elif message_type == 'session_response':
+            session = self._sessions.get(shard_id)
+
+            if session:
+                session.put(payload)
+
+        elif message_type == 'session_end':
+            session = self._sessions.get(shard_id)
+
+            if session:
+                session.finish(error=payload)
+
+        elif message_type == 'transfer_open':
+            self._open_transfer(
+                shard_id,
+                event_name,
+                payload,
+                transport
+            )
+
+        elif message_type == 'transfer_chunk' or message_type == 'transfer_commit':
+            transfer = self._inbound_transfers.get((transport, shard_id))
+
+            if transfer:
+                transfer.put(payload)
+
+        elif message_type == 'transfer_ready':
+            transfer = self._outbound_transfers.get(shard_id)
+
+            if transfer:
+                transfer.start(payload)
+
+        elif message_type == 'transfer_credit':
+            transfer = self._outbound_transfers.get(shard_id)
+
+            if transfer:
+                transfer.window.grant(payload)
+
+        elif message_type == 'transfer_done':
+            transfer = self._outbound_transfers.get(shard_id)
+
+            if transfer:
+                transfer.finish(payload)
+
         else:
 
             if event_name is None and bool(self._last_call):
@@ -654,7 +1548,10 @@ class MercurySyncTCPConnection:
             event_waiter = self._waiters[event_name]
 
             if bool(event_waiter):
-                waiter = event_waiter.pop()
+                waiter = self._pop_waiter(
+                    event_name,
+                    transport
+                )
 
                 try:
 
@@ -674,9 +1571,23 @@ class MercurySyncTCPConnection:
         self,
         event_name: str,
         coroutine: Coroutine,
-        transport: asyncio.Transport
+        transport: asyncio.Transport,
+        deduplication_key: Optional[Tuple[str, str, int]]=None,
+        response_waiter: Optional[asyncio.Future]=None
     ) -> Coroutine[Any, Any, None]:
-        response: Message = await coroutine
+        
+        try:
+            response: Message = await coroutine
+
+        except Exception:
+            if response_waiter:
+                self._deduplication.complete(
+                    deduplication_key,
+                    response_waiter,
+                    None
+                )
+
+            raise
 
         item = pickle.dumps(
             (
@@ -693,6 +1604,129 @@ class MercurySyncTCPConnection:
         encrypted_message = self._encryptor.encrypt(item)
         compressed = self._compressor.compress(encrypted_message)
 
+        if response_waiter:
+            self._deduplication.complete(
+                deduplication_key,
+                response_waiter,
+                compressed
+            )
+
+        transport.write(compressed)
+
+    async def _read_notification(
+        self,
+        coroutine: Coroutine
+    ) -> Coroutine[Any, Any, None]:
+        # One-way calls have no waiter on the other side, so the
+        # handler's response is dropped rather than sent back.
+        await coroutine
+
+    async def _replay_response(
+        self,
+        response_waiter: asyncio.Future,
+        transport: asyncio.Transport
+    ) -> Coroutine[Any, Any, None]:
+        # Duplicates that arrive while the original is still running
+        # wait on it instead of invoking the handler a second time.
+        response: Union[bytes, None] = await asyncio.shield(response_waiter)
+
+        if response is not None:
+            transport.write(response)
+
+    async def _read_batch(
+        self,
+        event_name: str,
+        batch_id: int,
+        coroutines: List[Coroutine],
+        transport: asyncio.Transport
+    ) -> Coroutine[Any, Any, None]:
+        # Items are answered as they finish rather than once the whole
+        # batch has, so one slow handler doesn't hold back the others.
+        pending: Dict[asyncio.Future, int] = {
+            asyncio.ensure_future(coroutine): idx for idx, coroutine in enumerate(coroutines)
+        }
+
+        try:
+
+            while len(pending) > 0:
+
+                completed, _ = await asyncio.wait(
+                    pending.keys(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                self._send_batch_responses(
+                    event_name,
+                    batch_id,
+                    [
+                        (
+                            pending.pop(task),
+                            task
+                        ) for task in completed
+                    ],
+                    transport
+                )
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _send_batch_responses(
+        self,
+        event_name: str,
+        batch_id: int,
+        completed: List[
+            Tuple[
+                int,
+                asyncio.Future
+            ]
+        ],
+        transport: asyncio.Transport
+    ):
+        responses: List[
+            Tuple[
+                int,
+                Union[int, None],
+                Dict[str, Any]
+            ]
+        ] = []
+
+        for idx, task in completed:
+            error = task.exception()
+
+            if error:
+                responses.append((
+                    idx,
+                    None,
+                    {
+                        'host': self.host,
+                        'port': self.port,
+                        'error': str(error) or error.__class__.__name__
+                    }
+                ))
+
+            else:
+                responses.append((
+                    idx,
+                    self.id_generator.generate(),
+                    task.result().to_data()
+                ))
+
+        item = pickle.dumps(
+            (
+                'batch_response', 
+                batch_id,
+                event_name,
+                responses,
+                self.host,
+                self.port
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        encrypted_message = self._encryptor.encrypt(item)
+        compressed = self._compressor.compress(encrypted_message)
+
         transport.write(compressed)
 
     async def _read_iterator(
@@ -774,25 +1808,22 @@ class MercurySyncTCPConnection:
         self._stream = False
         self._running = False
 
-        for client in self._client_transports.values():
-            client.abort()
-        
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            if self._cleanup_task.cancelled() is False:
-                try:
-                    self._sleep_task.cancel()
-                    if not self._sleep_task.cancelled():
-                        await self._sleep_task
+        if self._deduplication:
+            self._deduplication.clear()
 
-                except asyncio.CancelledError:
-                    pass
+        for transfer in self._outbound_transfers.values():
+            transfer.cancel()
 
-                try:
+        # Partial files are left in place so the transfer can resume.
+        for transfer in self._inbound_transfers.values():
+            transfer.close()
 
-                    await self._cleanup_task
+        for client in self._client_transports.values():
+            client.abort()
 
-                except asyncio.CancelledError:
-                    pass
+        self._read_buffers.clear()
+        self._read_decompressors.clear()
+        
+        await self._tasks.shutdown()
 
             
\ No newline at end of file
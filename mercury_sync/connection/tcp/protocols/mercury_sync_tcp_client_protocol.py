@@ -1,5 +1,5 @@
 import asyncio
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 
 
 class MercurySyncTCPClientProtocol(asyncio.Protocol):
@@ -8,12 +8,19 @@ class MercurySyncTCPClientProtocol(asyncio.Protocol):
         callback: Callable[
             [Any],
             bytes
-        ]
+        ],
+        on_connection_lost: Optional[
+            Callable[
+                [asyncio.Transport],
+                None
+            ]
+        ]=None
     ):
         super().__init__()
         self.transport: asyncio.Transport = None
         self.loop = asyncio.get_event_loop()
         self.callback = callback
+        self.on_connection_lost = on_connection_lost
 
         self.on_con_lost = self.loop.create_future()
 
@@ -28,3 +35,6 @@ class MercurySyncTCPClientProtocol(asyncio.Protocol):
 
     def connection_lost(self, exc):
         self.on_con_lost.set_result(True)
+
+        if self.on_connection_lost:
+            self.on_connection_lost(self.transport)
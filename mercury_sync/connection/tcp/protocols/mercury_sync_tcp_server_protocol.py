@@ -1,5 +1,5 @@
 import asyncio
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 
 class MercurySyncTCPServerProtocol(asyncio.Protocol):
@@ -11,10 +11,17 @@ class MercurySyncTCPServerProtocol(asyncio.Protocol):
                 Tuple[str, int]
             ],
             bytes
-        ]
+        ],
+        on_connection_lost: Optional[
+            Callable[
+                [asyncio.Transport],
+                None
+            ]
+        ]=None
     ):
         super().__init__()
         self.callback = callback
+        self.on_connection_lost = on_connection_lost
         self.transport: asyncio.Transport = None
 
     def connection_made(self, transport) -> str:
@@ -24,4 +31,8 @@ class MercurySyncTCPServerProtocol(asyncio.Protocol):
         self.callback(
             data,
             self.transport
-        )
\ No newline at end of file
+        )
+
+    def connection_lost(self, exc):
+        if self.on_connection_lost:
+            self.on_connection_lost(self.transport)
\ No newline at end of file
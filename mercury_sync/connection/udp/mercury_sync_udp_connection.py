@@ -7,13 +7,19 @@ import ssl
 import zstandard
 from collections import deque, defaultdict
 from dtls import do_patch
+from mercury_sync.connection.base.batch_waiter import (
+    BatchResponse,
+    BatchWaiter
+)
 from mercury_sync.connection.base.connection_type import ConnectionType
 from mercury_sync.connection.udp.protocols import MercurySyncUDPProtocol
+from mercury_sync.deduplication import DeduplicationCache
 from mercury_sync.encryption import AESGCMFernet
 from mercury_sync.env import Env
 from mercury_sync.env.time_parser import TimeParser
 from mercury_sync.models.message import Message
 from mercury_sync.snowflake.snowflake_generator import SnowflakeGenerator
+from mercury_sync.tasks import TaskSupervisor
 from typing import (
     Tuple, 
     Deque, 
@@ -21,6 +27,8 @@ from typing import (
     Dict, 
     Coroutine, 
     AsyncIterable,
+    Callable,
+    List,
     Optional,
     Union
 )
@@ -54,7 +62,8 @@ class MercurySyncUDPConnection:
         self.queue: Dict[str, Deque[Tuple[str, int, float, Any]] ] = defaultdict(deque)
         self.parsers: Dict[str, Message] = {}
         self._waiters: Dict[str, Deque[asyncio.Future]] = defaultdict(deque)
-        self._pending_responses: Deque[asyncio.Task] = deque()
+        self._batch_waiters: Dict[int, BatchWaiter] = {}
+        self._waiter_targets: Dict[asyncio.Future, Any] = {}
 
         self._udp_cert_path: Union[str, None] = None
         self._udp_key_path: Union[str, None] = None
@@ -66,12 +75,19 @@ class MercurySyncUDPConnection:
         self._decompressor: Union[zstandard.ZstdDecompressor, None] = None
         
         self._running = False
-        self._cleanup_task: Union[asyncio.Task, None] = None
-        self._sleep_task: Union[asyncio.Task, None] = None
-        self._cleanup_interval = TimeParser(env.MERCURY_SYNC_CLEANUP_INTERVAL).time
         self._max_concurrency = env.MERCURY_SYNC_MAX_CONCURRENCY
+        self._tasks = TaskSupervisor(
+            max_pending=self._max_concurrency
+        )
         self.udp_socket: Union[socket.socket, None] = None
 
+        self._deduplication: Union[DeduplicationCache, None] = None
+        if env.MERCURY_SYNC_USE_REQUEST_DEDUPLICATION:
+            self._deduplication = DeduplicationCache(
+                TimeParser(env.MERCURY_SYNC_DEDUPLICATION_WINDOW).time,
+                env.MERCURY_SYNC_DEDUPLICATION_MAX_ENTRIES
+            )
+
         self.connection_type = ConnectionType.UDP
 
     def connect(
@@ -136,8 +152,6 @@ class MercurySyncUDPConnection:
         transport, _ = self._loop.run_until_complete(server)
         self._transport = transport
 
-        self._cleanup_task = self._loop.create_task(self._cleanup())
-
     async def connect_async(
         self, 
         cert_path: Optional[str]=None,
@@ -185,8 +199,6 @@ class MercurySyncUDPConnection:
         transport, _ = await server
         self._transport = transport
 
-        self._cleanup_task = self._loop.create_task(self._cleanup())
-
     def _create_udp_ssl_context(
         self,
         cert_path: Optional[str]=None,
@@ -212,44 +224,20 @@ class MercurySyncUDPConnection:
         
         return ssl_ctx
     
-    async def _cleanup(self):
-        while self._running:
-            self._sleep_task = asyncio.create_task(
-                asyncio.sleep(self._cleanup_interval)
-            )
-
-            await self._sleep_task
-
-            for pending in list(self._pending_responses):
-                if pending.done() or pending.cancelled():
-                    try:
-                        await pending
-
-                    except (
-                        ConnectionAbortedError,
-                        ConnectionRefusedError,
-                        ConnectionResetError,
-                        asyncio.CancelledError,
-                        asyncio.InvalidStateError
-                    ):
-                        await self.close()
-                        await self.connect_async(
-                            cert_path=self._udp_cert_path,
-                            key_path=self._udp_key_path
-                        )
-
-                    self._pending_responses.pop()
-    
     async def send(
         self, 
         event_name: str,
         data: Any, 
-        addr: Tuple[str, int]
+        addr: Tuple[str, int],
+        request_id: Optional[int]=None
     ) -> Tuple[int, Dict[str, Any]]:
 
+        if request_id is None:
+            request_id = self.id_generator.generate()
+
         item = pickle.dumps((
             'request',
-            self.id_generator.generate(),
+            request_id,
             event_name,
             data
         ), protocol=pickle.HIGHEST_PROTOCOL)
@@ -261,21 +249,129 @@ class MercurySyncUDPConnection:
 
         waiter = self._loop.create_future()
         self._waiters[event_name].append(waiter)
+        self._waiter_targets[waiter] = addr
 
-        (
-            _,
-            shard_id,
-            _,
-            response_data,
-            _, 
-            _
-        ) = await waiter
+        try:
+            (
+                _,
+                shard_id,
+                _,
+                response_data,
+                _, 
+                _
+            ) = await waiter
+
+        except asyncio.CancelledError:
+            # Hedged or timed out calls are cancelled by the caller, so
+            # drop the waiter rather than leave it to swallow a response.
+            self._discard_waiter(event_name, waiter)
+            raise
+
+        finally:
+            self._waiter_targets.pop(waiter, None)
 
         return (
             shard_id,
             response_data
         )
     
+    async def notify(
+        self,
+        event_name: str,
+        data: Any,
+        addr: Tuple[str, int]
+    ) -> None:
+        item = pickle.dumps((
+            'notify',
+            self.id_generator.generate(),
+            event_name,
+            data
+        ), protocol=pickle.HIGHEST_PROTOCOL)
+
+        encrypted_message = self._encryptor.encrypt(item)
+        compressed = self._compressor.compress(encrypted_message)
+        
+        self._transport.sendto(compressed, addr)
+    
+    def _discard_waiter(
+        self,
+        event_name: str,
+        waiter: asyncio.Future
+    ):
+        try:
+            self._waiters[event_name].remove(waiter)
+
+        except ValueError:
+            pass
+
+    def _pop_waiter(
+        self,
+        event_name: str,
+        target: Any
+    ) -> asyncio.Future:
+        event_waiter = self._waiters[event_name]
+
+        # Connections are shared between remotes, so prefer the waiter
+        # for the peer that answered over the most recent one.
+        for waiter in reversed(event_waiter):
+            if self._waiter_targets.get(waiter) == target:
+                event_waiter.remove(waiter)
+                break
+
+        else:
+            waiter = event_waiter.pop()
+
+        self._waiter_targets.pop(waiter, None)
+
+        return waiter
+
+    async def send_batch(
+        self,
+        event_name: str,
+        data: List[Any],
+        addr: Tuple[str, int],
+        on_response: Optional[
+            Callable[
+                [int, BatchResponse],
+                None
+            ]
+        ]=None
+    ) -> List[BatchResponse]:
+        
+        # Responders echo the batch id back, so concurrent batches to
+        # different remotes on one event can't resolve each other.
+        batch_id = self.id_generator.generate()
+
+        item = pickle.dumps((
+            'batch_request',
+            batch_id,
+            event_name,
+            data
+        ), protocol=pickle.HIGHEST_PROTOCOL)
+
+        encrypted_message = self._encryptor.encrypt(item)
+        compressed = self._compressor.compress(encrypted_message)
+        
+        self._transport.sendto(compressed, addr)
+
+        # Responses arrive per item as the remote finishes them, and
+        # are handed to on_response before the whole batch resolves.
+        batch_waiter = BatchWaiter(
+            len(data),
+            self._loop.create_future(),
+            on_response=on_response
+        )
+
+        self._batch_waiters[batch_id] = batch_waiter
+
+        try:
+            return await batch_waiter.waiter
+
+        finally:
+            # Cancelled or timed out batches must not leave their waiter
+            # behind for a late response to land on.
+            self._batch_waiters.pop(batch_id, None)
+    
     async def send_bytes(
         self,
         event_name: str,
@@ -357,39 +453,96 @@ class MercurySyncUDPConnection:
         incoming_host, incoming_port = addr
 
         if message_type == 'request':
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._read(
-                        event_name,
-                        self.events.get(event_name)(
-                            shard_id,
-                            self.parsers[event_name](**payload)
-                        ),
-                        addr
+
+            deduplication_key: Union[Tuple[str, str, int], None] = None
+            response_waiter: Union[asyncio.Future, None] = None
+
+            if self._deduplication:
+                deduplication_key = (
+                    incoming_host,
+                    event_name,
+                    shard_id
+                )
+
+                cached_response = self._deduplication.get(deduplication_key)
+                if cached_response is not None:
+                    self._tasks.spawn(
+                        self._replay_response(
+                            cached_response,
+                            addr
+                        )
                     )
+
+                    return
+                
+                response_waiter = self._deduplication.reserve(deduplication_key)
+
+            self._tasks.spawn(
+                self._read(
+                    event_name,
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    ),
+                    addr,
+                    deduplication_key=deduplication_key,
+                    response_waiter=response_waiter
                 )
             )
             
-        elif message_type == 'stream':
-            self._pending_responses.append(
-                asyncio.create_task(
-                    self._read_iterator(
-                        event_name,
+        elif message_type == 'notify':
+            self._tasks.spawn(
+                self._read_notification(
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    )
+                )
+            )
+            
+        elif message_type == 'batch_request':
+            self._tasks.spawn(
+                self._read_batch(
+                    event_name,
+                    shard_id,
+                    [
                         self.events.get(event_name)(
                             shard_id,
-                            self.parsers[event_name](**payload)
-                        ),
-                        addr
-                    )
+                            self.parsers[event_name](**item_payload)
+                        ) for item_payload in payload
+                    ],
+                    addr
+                )
+            )
+            
+        elif message_type == 'stream':
+            self._tasks.spawn(
+                self._read_iterator(
+                    event_name,
+                    self.events.get(event_name)(
+                        shard_id,
+                        self.parsers[event_name](**payload)
+                    ),
+                    addr
                 )
             )
 
+        elif message_type == 'batch_response':
+
+            batch_waiter = self._batch_waiters.get(shard_id)
+
+            if batch_waiter:
+                batch_waiter.receive(payload)
+
         else:
 
             event_waiter = self._waiters[event_name]
       
             if bool(event_waiter):
-                waiter = event_waiter.pop()
+                waiter = self._pop_waiter(
+                    event_name,
+                    addr
+                )
                 
                 try:
                     
@@ -410,9 +563,23 @@ class MercurySyncUDPConnection:
         self,
         event_name: str,
         coroutine: Coroutine,
-        addr: Tuple[str, int]
+        addr: Tuple[str, int],
+        deduplication_key: Optional[Tuple[str, str, int]]=None,
+        response_waiter: Optional[asyncio.Future]=None
     ) -> Coroutine[Any, Any, None]:
-        response: Message = await coroutine
+        
+        try:
+            response: Message = await coroutine
+
+        except Exception:
+            if response_waiter:
+                self._deduplication.complete(
+                    deduplication_key,
+                    response_waiter,
+                    None
+                )
+
+            raise
 
         item = pickle.dumps(
             (
@@ -427,6 +594,127 @@ class MercurySyncUDPConnection:
         encrypted_message = self._encryptor.encrypt(item)
         compressed = self._compressor.compress(encrypted_message)
 
+        if response_waiter:
+            self._deduplication.complete(
+                deduplication_key,
+                response_waiter,
+                compressed
+            )
+
+        self._transport.sendto(compressed, addr)
+
+    async def _read_notification(
+        self,
+        coroutine: Coroutine
+    ) -> Coroutine[Any, Any, None]:
+        # One-way calls have no waiter on the other side, so the
+        # handler's response is dropped rather than sent back.
+        await coroutine
+
+    async def _replay_response(
+        self,
+        response_waiter: asyncio.Future,
+        addr: Tuple[str, int]
+    ) -> Coroutine[Any, Any, None]:
+        # Duplicates that arrive while the original is still running
+        # wait on it instead of invoking the handler a second time.
+        response: Union[bytes, None] = await asyncio.shield(response_waiter)
+
+        if response is not None:
+            self._transport.sendto(response, addr)
+
+    async def _read_batch(
+        self,
+        event_name: str,
+        batch_id: int,
+        coroutines: List[Coroutine],
+        addr: Tuple[str, int]
+    ) -> Coroutine[Any, Any, None]:
+        # Items are answered as they finish rather than once the whole
+        # batch has, so one slow handler doesn't hold back the others.
+        pending: Dict[asyncio.Future, int] = {
+            asyncio.ensure_future(coroutine): idx for idx, coroutine in enumerate(coroutines)
+        }
+
+        try:
+
+            while len(pending) > 0:
+
+                completed, _ = await asyncio.wait(
+                    pending.keys(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                self._send_batch_responses(
+                    event_name,
+                    batch_id,
+                    [
+                        (
+                            pending.pop(task),
+                            task
+                        ) for task in completed
+                    ],
+                    addr
+                )
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _send_batch_responses(
+        self,
+        event_name: str,
+        batch_id: int,
+        completed: List[
+            Tuple[
+                int,
+                asyncio.Future
+            ]
+        ],
+        addr: Tuple[str, int]
+    ):
+        responses: List[
+            Tuple[
+                int,
+                Union[int, None],
+                Dict[str, Any]
+            ]
+        ] = []
+
+        for idx, task in completed:
+            error = task.exception()
+
+            if error:
+                responses.append((
+                    idx,
+                    None,
+                    {
+                        'host': self.host,
+                        'port': self.port,
+                        'error': str(error) or error.__class__.__name__
+                    }
+                ))
+
+            else:
+                responses.append((
+                    idx,
+                    self.id_generator.generate(),
+                    task.result().to_data()
+                ))
+
+        item = pickle.dumps(
+            (
+                'batch_response', 
+                batch_id,
+                event_name,
+                responses
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+        encrypted_message = self._encryptor.encrypt(item)
+        compressed = self._compressor.compress(encrypted_message)
+
         self._transport.sendto(compressed, addr)
 
     async def _read_iterator(
@@ -454,21 +742,8 @@ class MercurySyncUDPConnection:
     async def close(self) -> None:
         self._running = False
         self._transport.abort()
-        
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            if self._cleanup_task.cancelled() is False:
-                try:
-                    self._sleep_task.cancel()
-                    if not self._sleep_task.cancelled():
-                        await self._sleep_task
-
-                except asyncio.CancelledError:
-                    pass
-
-                try:
 
-                    await self._cleanup_task
-
-                except asyncio.CancelledError:
-                    pass
\ No newline at end of file
+        if self._deduplication:
+            self._deduplication.clear()
+        
+        await self._tasks.shutdown()
\ No newline at end of file
@@ -112,5 +112,3 @@ class MercurySyncUDPMulticastConnection(MercurySyncUDPConnection):
 
         transport, _ = await server
         self._transport = transport
-
-        self._cleanup_task = self._loop.create_task(self._cleanup())
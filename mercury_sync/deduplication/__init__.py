@@ -0,0 +1 @@
+from .deduplication_cache import DeduplicationCache
\ No newline at end of file
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Hashable,
+    Union
+)
+from .deduplication_entry import DeduplicationEntry
+
+
+class DeduplicationCache:
+
+    def __init__(
+        self,
+        window: float,
+        max_entries: int
+    ) -> None:
+        self.window = window
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[Hashable, DeduplicationEntry] = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable
+    ) -> Union[asyncio.Future, None]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry.response
+
+    def reserve(
+        self,
+        key: Hashable
+    ) -> asyncio.Future:
+        current_time = time.monotonic()
+        self._purge(current_time)
+
+        response = asyncio.get_event_loop().create_future()
+        self._entries[key] = DeduplicationEntry(
+            response,
+            current_time + self.window
+        )
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return response
+    
+    def complete(
+        self,
+        key: Hashable,
+        waiter: asyncio.Future,
+        response: Union[bytes, None]
+    ):
+        entry = self._entries.get(key)
+
+        if response is None and entry and entry.response is waiter:
+            # Failed handlers are not cached so a retry runs again.
+            del self._entries[key]
+
+        if waiter.done() is False:
+            waiter.set_result(response)
+
+    def _purge(self, current_time: float):
+        # Every entry shares the same window, so insertion order
+        # is also expiry order and we can stop at the first live one.
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+
+            if entry.expires_at > current_time:
+                break
+
+            del self._entries[key]
+
+    def clear(self):
+        for entry in self._entries.values():
+            if entry.response.done() is False:
+                entry.response.set_result(None)
+
+        self._entries.clear()
+
+    def to_dict(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries)
+        }
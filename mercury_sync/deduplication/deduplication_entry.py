@@ -0,0 +1,17 @@
+import asyncio
+
+
+class DeduplicationEntry:
+
+    __slots__ = (
+        'response',
+        'expires_at'
+    )
+
+    def __init__(
+        self,
+        response: asyncio.Future,
+        expires_at: float
+    ) -> None:
+        self.response = response
+        self.expires_at = expires_at
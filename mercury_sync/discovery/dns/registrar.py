@@ -158,7 +158,7 @@ class Registrar(Controller):
             messages=messages
         )
             
-    @client('resolve_query')
+    @client('resolve_query', coalesce=True)
     async def submit_query(
         self,
         host: str,
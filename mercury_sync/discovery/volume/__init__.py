@@ -0,0 +1 @@
+from .backup_volume import BackupVolume
\ No newline at end of file
@@ -1,5 +1,16 @@
 import asyncio
+import mmap
+import os
+import struct
+import zlib
 from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+
+# magic, version, payload length, payload crc32
+SNAPSHOT_HEADER = struct.Struct('>4sBQI')
+SNAPSHOT_MAGIC = b'MSBV'
+SNAPSHOT_VERSION = 1
 
 
 class BackupVolume:
@@ -14,5 +25,133 @@ class BackupVolume:
         self.service_name = service_name
         self.instance_id = instance_id
 
+        self.snapshot_path = os.path.join(
+            path,
+            f'{service_name}-{instance_id}.snapshot'
+        )
+
+        self._executor: Union[ThreadPoolExecutor, None] = None
+
+    async def write(self, data: bytes):
+        await self._run(
+            self._write,
+            data
+        )
+
+    async def read(self) -> Union[bytes, None]:
+        return await self._run(self._read)
     
+    async def _run(self, call, *args):
+        
+        # A single thread serializes snapshot I/O, so a slow disk can
+        # never interleave a read with a half-finished replace.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(
+            self._executor,
+            call,
+            *args
+        )
+
+    def _write(self, data: bytes):
+
+        # Snapshots decide who we rejoin, so only this user may write or
+        # replace them.
+        os.makedirs(
+            self.path,
+            mode=0o700,
+            exist_ok=True
+        )
+
+        header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            len(data),
+            zlib.crc32(data)
+        )
+
+        temporary_path = f'{self.snapshot_path}.{os.getpid()}.tmp'
+
+        with open(
+            os.open(
+                temporary_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o600
+            ),
+            'wb'
+        ) as snapshot:
+            snapshot.write(header)
+            snapshot.write(data)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+
+        # The rename is atomic, so readers see the previous snapshot or
+        # this one and never a torn write.
+        os.replace(
+            temporary_path,
+            self.snapshot_path
+        )
+
+        directory_fd = os.open(self.path, os.O_RDONLY)
+
+        try:
+            os.fsync(directory_fd)
+
+        finally:
+            os.close(directory_fd)
+
+    def _read(self) -> Union[bytes, None]:
+
+        try:
+            snapshot = open(self.snapshot_path, 'rb')
+
+        except FileNotFoundError:
+            return None
+        
+        with snapshot:
+            stats = os.fstat(snapshot.fileno())
+            if stats.st_uid != os.getuid():
+                return None
+
+            size = stats.st_size
+            if size < SNAPSHOT_HEADER.size:
+                return None
+
+            with mmap.mmap(
+                snapshot.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            ) as mapped:
+                
+                magic, version, length, expected_checksum = SNAPSHOT_HEADER.unpack_from(mapped)
+
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    return None
+                
+                if SNAPSHOT_HEADER.size + length > size:
+                    return None
+                
+                with memoryview(mapped)[
+                    SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + length
+                ] as payload:
+                    
+                    if zlib.crc32(payload) != expected_checksum:
+                        return None
+                    
+                    return payload.tobytes()
+                
+    async def close(self):
+        if self._executor:
+            executor = self._executor
+            self._executor = None
 
+            # Waiting for a write in progress would block the loop, so
+            # the join happens on a default executor thread instead.
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                executor.shutdown
+            )
@@ -0,0 +1,8 @@
+from .healthcheck_codec import (
+    decode_healthcheck,
+    encode_healthcheck
+)
+from .varint import (
+    decode_varint,
+    encode_varint
+)
\ No newline at end of file
@@ -0,0 +1,210 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+from .varint import (
+    decode_varint,
+    encode_varint
+)
+
+
+CODEC_VERSION = 1
+
+STATUSES: Tuple[str, ...] = (
+    'initializing',
+    'waiting',
+    'healthy',
+    'suspect',
+    'failed',
+    'left'
+)
+
+STATUS_CODES: Dict[str, int] = {
+    status: code for code, status in enumerate(STATUSES)
+}
+
+# Optional fields in wire order. Host fields are written as indexes into
+# the message's host table, statuses as single bytes and everything else
+# as varints.
+HOST_FIELDS = (
+    'host',
+    'target_host'
+)
+
+STATUS_FIELDS = (
+    'target_status',
+    'source_status'
+)
+
+INT_FIELDS = (
+    'port',
+    'target_port',
+    'incarnation',
+    'target_incarnation'
+)
+
+HOST_FIELD = 0
+INT_FIELD = 1
+STATUS_FIELD = 2
+ERROR_FIELD = 3
+UPDATES_FIELD = 4
+LOAD_FIELD = 5
+
+FIELDS: Tuple[Tuple[int, str, int], ...] = tuple(
+    (1 << bit, field, kind) for bit, (field, kind) in enumerate((
+        *[(field, HOST_FIELD) for field in HOST_FIELDS],
+        *[(field, INT_FIELD) for field in INT_FIELDS],
+        *[(field, STATUS_FIELD) for field in STATUS_FIELDS],
+        ('error', ERROR_FIELD),
+        ('updates', UPDATES_FIELD),
+        ('load', LOAD_FIELD)
+    ))
+)
+
+
+def encode_healthcheck(data: Dict[str, Any]) -> bytes:
+
+    hosts: Dict[str, int] = {}
+
+    def intern(host: str) -> int:
+        index = hosts.get(host)
+        if index is None:
+            index = len(hosts)
+            hosts[host] = index
+
+        return index
+
+    body = bytearray()
+    presence = 0
+
+    encode_varint(intern(data['source_host']), body)
+    encode_varint(data['source_port'], body)
+    body.append(STATUS_CODES[data['status']])
+
+    for bit, field, kind in FIELDS:
+        value = data.get(field)
+        if value is None:
+            continue
+
+        presence |= bit
+
+        if kind == HOST_FIELD:
+            encode_varint(intern(value), body)
+
+        elif kind == INT_FIELD:
+            encode_varint(value, body)
+
+        elif kind == STATUS_FIELD:
+            body.append(STATUS_CODES[value])
+
+        elif kind == ERROR_FIELD:
+            encoded_error = value.encode()
+            encode_varint(len(encoded_error), body)
+            body.extend(encoded_error)
+
+        elif kind == LOAD_FIELD:
+            for metric in value:
+                encode_varint(metric, body)
+
+        else:
+            encode_varint(len(value), body)
+
+            for host, port, status, incarnation in value:
+                encode_varint(intern(host), body)
+                encode_varint(port, body)
+                body.append(STATUS_CODES[status])
+                encode_varint(incarnation, body)
+
+    # The host table is only complete once the body is written, so the
+    # header is assembled last and prepended.
+    header = bytearray([CODEC_VERSION])
+    encode_varint(presence, header)
+    encode_varint(len(hosts), header)
+
+    for host in hosts:
+        encoded_host = host.encode()
+        encode_varint(len(encoded_host), header)
+        header.extend(encoded_host)
+
+    header.extend(body)
+
+    return bytes(header)
+
+
+def decode_healthcheck(packed: bytes) -> Dict[str, Any]:
+
+    if packed[0] != CODEC_VERSION:
+        raise ValueError(
+            f'Err. - Unsupported HealthCheck encoding version - {packed[0]}'
+        )
+
+    presence, offset = decode_varint(packed, 1)
+    hosts_count, offset = decode_varint(packed, offset)
+
+    hosts: List[str] = []
+    for _ in range(hosts_count):
+        host_length, offset = decode_varint(packed, offset)
+        hosts.append(
+            packed[offset:offset + host_length].decode()
+        )
+
+        offset += host_length
+
+    data: Dict[str, Any] = {}
+
+    source_host, offset = decode_varint(packed, offset)
+    data['source_host'] = hosts[source_host]
+    data['source_port'], offset = decode_varint(packed, offset)
+    data['status'] = STATUSES[packed[offset]]
+    offset += 1
+
+    for bit, field, kind in FIELDS:
+        if presence & bit == 0:
+            continue
+
+        if kind == HOST_FIELD:
+            host_index, offset = decode_varint(packed, offset)
+            data[field] = hosts[host_index]
+
+        elif kind == INT_FIELD:
+            data[field], offset = decode_varint(packed, offset)
+
+        elif kind == STATUS_FIELD:
+            data[field] = STATUSES[packed[offset]]
+            offset += 1
+
+        elif kind == ERROR_FIELD:
+            error_length, offset = decode_varint(packed, offset)
+            data[field] = packed[offset:offset + error_length].decode()
+            offset += error_length
+
+        elif kind == LOAD_FIELD:
+            load: List[int] = []
+            for _ in range(4):
+                metric, offset = decode_varint(packed, offset)
+                load.append(metric)
+
+            data[field] = tuple(load)
+
+        else:
+            updates_count, offset = decode_varint(packed, offset)
+
+            updates: List[Tuple[str, int, str, int]] = []
+            for _ in range(updates_count):
+                host_index, offset = decode_varint(packed, offset)
+                port, offset = decode_varint(packed, offset)
+                status = STATUSES[packed[offset]]
+                incarnation, offset = decode_varint(packed, offset + 1)
+
+                updates.append((
+                    hosts[host_index],
+                    port,
+                    status,
+                    incarnation
+                ))
+
+            data[field] = updates
+
+    return data
@@ -0,0 +1,36 @@
+from typing import Tuple
+
+
+def encode_varint(
+    value: int,
+    buffer: bytearray
+):
+    # Zigzag first so the occasional negative value stays small.
+    value = (value << 1) ^ (value >> 63)
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def decode_varint(
+    data: bytes,
+    offset: int
+) -> Tuple[int, int]:
+    
+    value = 0
+    shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            break
+
+        shift += 7
+
+    return (value >> 1) ^ -(value & 1), offset
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from pydantic import (
     BaseModel,
     StrictStr,
@@ -55,6 +57,31 @@ class Env(BaseModel):
     MERCURY_SYNC_MAX_CONCURRENCY: StrictInt=2048
     MERCURY_SYNC_AUTH_SECRET: StrictStr
     MERCURY_SYNC_MULTICAST_GROUP: IPvAnyAddress='224.1.1.1'
+    MERCURY_SYNC_BALANCER_EWMA_DECAY: StrictFloat=0.3
+    MERCURY_SYNC_BALANCER_MIN_REQUESTS: StrictInt=5
+    MERCURY_SYNC_BALANCER_ERROR_THRESHOLD: StrictFloat=0.5
+    MERCURY_SYNC_BALANCER_LATENCY_MULTIPLIER: Union[StrictInt, StrictFloat]=3
+    MERCURY_SYNC_BALANCER_EJECTION_TIME: StrictStr='30s'
+    MERCURY_SYNC_BALANCER_MAX_EJECTION_PERCENT: StrictFloat=0.5
+    MERCURY_SYNC_BATCH_WINDOW: StrictStr='0s'
+    MERCURY_SYNC_BATCH_MAX_SIZE: StrictInt=64
+    MERCURY_SYNC_USE_REQUEST_DEDUPLICATION: StrictBool=False
+    MERCURY_SYNC_DEDUPLICATION_WINDOW: StrictStr='30s'
+    MERCURY_SYNC_DEDUPLICATION_MAX_ENTRIES: StrictInt=4096
+    MERCURY_SYNC_USE_CLIENT_CIRCUIT_BREAKER: StrictBool=False
+    MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_THRESHOLD: StrictFloat=0.5
+    MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_WINDOW: StrictStr='10s'
+    MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_MIN_REQUESTS: StrictInt=10
+    MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_OPEN_TIME: StrictStr='5s'
+    MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_HALF_OPEN_REQUESTS: StrictInt=3
+    MERCURY_SYNC_STREAM_WINDOW: StrictInt=64
+    MERCURY_SYNC_TRANSFER_DIRECTORY: StrictStr=os.path.join(
+        tempfile.gettempdir(),
+        'mercury_sync'
+    )
+    MERCURY_SYNC_TRANSFER_CHUNK_SIZE: StrictInt=1048576
+    MERCURY_SYNC_TRANSFER_WINDOW: StrictInt=8
+    MERCURY_SYNC_TRANSFER_IDLE_TIMEOUT: StrictStr='30s'
 
     @classmethod
     def types_map(self) -> Dict[str, Callable[[str], PrimaryType]]:
@@ -80,5 +107,27 @@ class Env(BaseModel):
             'MERCURY_SYNC_CLEANUP_INTERVAL': str,
             'MERCURY_SYNC_MAX_CONCURRENCY': int,
             'MERCURY_SYNC_AUTH_SECRET': str,
-            'MERCURY_SYNC_MULTICAST_GROUP': str
+            'MERCURY_SYNC_MULTICAST_GROUP': str,
+            'MERCURY_SYNC_BALANCER_EWMA_DECAY': float,
+            'MERCURY_SYNC_BALANCER_MIN_REQUESTS': int,
+            'MERCURY_SYNC_BALANCER_ERROR_THRESHOLD': float,
+            'MERCURY_SYNC_BALANCER_LATENCY_MULTIPLIER': float,
+            'MERCURY_SYNC_BALANCER_EJECTION_TIME': str,
+            'MERCURY_SYNC_BALANCER_MAX_EJECTION_PERCENT': float,
+            'MERCURY_SYNC_BATCH_WINDOW': str,
+            'MERCURY_SYNC_BATCH_MAX_SIZE': int,
+            'MERCURY_SYNC_USE_REQUEST_DEDUPLICATION': lambda value: True if value.lower() == 'true' else False,
+            'MERCURY_SYNC_DEDUPLICATION_WINDOW': str,
+            'MERCURY_SYNC_DEDUPLICATION_MAX_ENTRIES': int,
+            'MERCURY_SYNC_USE_CLIENT_CIRCUIT_BREAKER': lambda value: True if value.lower() == 'true' else False,
+            'MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_THRESHOLD': float,
+            'MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_FAILURE_WINDOW': str,
+            'MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_MIN_REQUESTS': int,
+            'MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_OPEN_TIME': str,
+            'MERCURY_SYNC_CLIENT_CIRCUIT_BREAKER_HALF_OPEN_REQUESTS': int,
+            'MERCURY_SYNC_STREAM_WINDOW': int,
+            'MERCURY_SYNC_TRANSFER_DIRECTORY': str,
+            'MERCURY_SYNC_TRANSFER_CHUNK_SIZE': int,
+            'MERCURY_SYNC_TRANSFER_WINDOW': int,
+            'MERCURY_SYNC_TRANSFER_IDLE_TIMEOUT': str
         }
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 from ipaddress import IPv4Address
 from pydantic import (
     BaseModel,
@@ -8,7 +9,8 @@ from pydantic import (
 from typing import (
     Dict, 
     Union,
-    Callable
+    Callable,
+    Literal
 )
 
 
@@ -30,6 +32,25 @@ class MonitorEnv(BaseModel):
     MERCURY_SYNC_REGISTRATION_TIMEOUT: StrictStr='1m'
     MERCURY_SYNC_HEALTH_POLL_INTERVAL: StrictFloat='1s'
     MERCURY_SYNC_INDIRECT_CHECK_NODES: StrictInt=3
+    MERCURY_SYNC_GOSSIP_RETRANSMIT_MULTIPLIER: StrictInt=3
+    MERCURY_SYNC_GOSSIP_MAX_PIGGYBACK: StrictInt=8
+    MERCURY_SYNC_GOSSIP_QUEUE_SIZE: StrictInt=1024
+    MERCURY_SYNC_ANTI_ENTROPY_INTERVAL: StrictStr='5s'
+    MERCURY_SYNC_ANTI_ENTROPY_BUCKETS: StrictInt=32
+    MERCURY_SYNC_FAILURE_DETECTOR: Literal["timeout", "phi"]="timeout"
+    MERCURY_SYNC_PHI_THRESHOLD: StrictFloat=8.0
+    MERCURY_SYNC_PHI_WINDOW_SIZE: StrictInt=100
+    MERCURY_SYNC_PHI_MIN_SAMPLES: StrictInt=5
+    MERCURY_SYNC_PHI_MIN_STD_DEVIATION: StrictStr='0.01s'
+    MERCURY_SYNC_PROBE_BATCH_WINDOW: StrictStr='0.005s'
+    MERCURY_SYNC_MEMBERSHIP_EVENTS_BUFFER: StrictInt=1024
+    MERCURY_SYNC_SNAPSHOT_DIRECTORY: StrictStr=os.path.join(
+        os.path.expanduser('~'),
+        '.mercury_sync',
+        'snapshots'
+    )
+    MERCURY_SYNC_SNAPSHOT_INTERVAL: StrictStr='0s'
+    MERCURY_SYNC_LOAD_SAMPLE_INTERVAL: StrictStr='1s'
 
     @classmethod
     def types_map(self) -> Dict[str, Callable[[str], PrimaryType]]:
@@ -46,5 +67,20 @@ class MonitorEnv(BaseModel):
             'MERCURY_SYNC_BOOT_WAIT': str,
             'MERCURY_SYNC_REGISTRATION_TIMEOUT': str,
             'MERCURY_SYNC_HEALTH_POLL_INTERVAL': str,
-            'MERCURY_SYNC_INDIRECT_CHECK_NODES': int
+            'MERCURY_SYNC_INDIRECT_CHECK_NODES': int,
+            'MERCURY_SYNC_GOSSIP_RETRANSMIT_MULTIPLIER': int,
+            'MERCURY_SYNC_GOSSIP_MAX_PIGGYBACK': int,
+            'MERCURY_SYNC_GOSSIP_QUEUE_SIZE': int,
+            'MERCURY_SYNC_ANTI_ENTROPY_INTERVAL': str,
+            'MERCURY_SYNC_ANTI_ENTROPY_BUCKETS': int,
+            'MERCURY_SYNC_FAILURE_DETECTOR': str,
+            'MERCURY_SYNC_PHI_THRESHOLD': float,
+            'MERCURY_SYNC_PHI_WINDOW_SIZE': int,
+            'MERCURY_SYNC_PHI_MIN_SAMPLES': int,
+            'MERCURY_SYNC_PHI_MIN_STD_DEVIATION': str,
+            'MERCURY_SYNC_PROBE_BATCH_WINDOW': str,
+            'MERCURY_SYNC_MEMBERSHIP_EVENTS_BUFFER': int,
+            'MERCURY_SYNC_SNAPSHOT_DIRECTORY': str,
+            'MERCURY_SYNC_SNAPSHOT_INTERVAL': str,
+            'MERCURY_SYNC_LOAD_SAMPLE_INTERVAL': str
         }
\ No newline at end of file
@@ -0,0 +1 @@
+from .gossip_queue import GossipQueue
\ No newline at end of file
@@ -0,0 +1,100 @@
+import heapq
+import math
+from mercury_sync.models.healthcheck import (
+    HealthStatus,
+    MembershipUpdate
+)
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union
+)
+
+
+class GossipQueue:
+
+    def __init__(
+        self,
+        max_size: int=1024,
+        max_piggyback: int=8,
+        retransmit_multiplier: int=3
+    ) -> None:
+        self.max_size = max(max_size, 1)
+        self.max_piggyback = max_piggyback
+        self.retransmit_multiplier = retransmit_multiplier
+
+        self._entries: Dict[
+            Tuple[str, int], 
+            List[Union[MembershipUpdate, int]]
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def enqueue(
+        self,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int
+    ):
+        address = (host, port)
+
+        # A newer update about a node supersedes the queued one and
+        # restarts its retransmit count.
+        self._entries.pop(address, None)
+        self._entries[address] = [
+            (
+                host,
+                port,
+                status,
+                incarnation
+            ),
+            0
+        ]
+
+        if len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+
+    def get_retransmit_limit(self, cluster_size: int) -> int:
+        return self.retransmit_multiplier * max(
+            math.ceil(
+                math.log10(cluster_size + 1)
+            ),
+            1
+        )
+
+    def select(self, cluster_size: int) -> List[MembershipUpdate]:
+
+        if len(self._entries) < 1:
+            return []
+
+        retransmit_limit = self.get_retransmit_limit(cluster_size)
+
+        # Least-sent updates go first so fresh changes spread before
+        # ones that have already reached most of the cluster.
+        selected = heapq.nsmallest(
+            self.max_piggyback,
+            self._entries.items(),
+            key=lambda item: item[1][1]
+        )
+
+        updates: List[MembershipUpdate] = []
+        for address, entry in selected:
+            update, transmits = entry
+
+            transmits += 1
+            if transmits >= retransmit_limit:
+                del self._entries[address]
+
+            else:
+                entry[1] = transmits
+
+            updates.append(update)
+
+        return updates
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,2 @@
+from .hedge_executor import HedgeExecutor
+from .latency_window import LatencyWindow
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from mercury_sync.models.hedge_policy import HedgePolicy
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Union
+)
+from .latency_window import LatencyWindow
+
+
+class HedgeExecutor:
+
+    def __init__(
+        self,
+        policy: HedgePolicy
+    ) -> None:
+        self.policy = policy
+        self.quantile = policy.quantile
+        self.min_samples = policy.min_samples
+        self.max_hedges = policy.max_hedges
+        self.fixed_delay = policy.hedge_delay
+
+        self.latencies = LatencyWindow(size=policy.window_size)
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def get_delay(self) -> Union[float, None]:
+
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        
+        if len(self.latencies) < self.min_samples:
+            return None
+        
+        return self.latencies.quantile(self.quantile)
+
+    async def run(
+        self,
+        create_call: Callable[[], Coroutine]
+    ) -> Any:
+        
+        self.requests += 1
+        delay = self.get_delay()
+
+        if delay is None or self.max_hedges < 1:
+            start = time.monotonic()
+            result = await create_call()
+
+            self.latencies.record(time.monotonic() - start)
+            return result
+        
+        primary = asyncio.ensure_future(create_call())
+        started: Dict[asyncio.Future, float] = {
+            primary: time.monotonic()
+        }
+
+        pending = {primary}
+        hedges_sent = 0
+        error: Union[BaseException, None] = None
+
+        try:
+            while pending:
+
+                timeout = None
+                if hedges_sent < self.max_hedges:
+                    timeout = delay
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for completed in done:
+                    if completed.cancelled():
+                        continue
+
+                    completed_error = completed.exception()
+                    if completed_error is None:
+                        self.latencies.record(
+                            time.monotonic() - started[completed]
+                        )
+
+                        if completed is not primary:
+                            self.hedge_wins += 1
+
+                        return completed.result()
+                    
+                    error = completed_error
+
+                # Either the hedge delay elapsed or an attempt failed
+                # early - in both cases a duplicate may still win.
+                if hedges_sent < self.max_hedges:
+                    hedge = asyncio.ensure_future(create_call())
+                    started[hedge] = time.monotonic()
+                    pending.add(hedge)
+
+                    hedges_sent += 1
+                    self.hedges += 1
+
+            if error is None:
+                error = asyncio.CancelledError()
+
+            raise error
+        
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'delay': self.get_delay()
+        }
@@ -0,0 +1,47 @@
+from collections import deque
+from typing import (
+    Deque,
+    List,
+    Union
+)
+
+
+class LatencyWindow:
+
+    __slots__ = (
+        'size',
+        'samples',
+        '_sorted',
+        '_stale'
+    )
+
+    def __init__(self, size: int=256) -> None:
+        self.size = size
+        self.samples: Deque[float] = deque(maxlen=size)
+        self._sorted: List[float] = []
+        self._stale = 0
+
+    def __len__(self):
+        return len(self.samples)
+
+    def record(self, latency: float):
+        self.samples.append(latency)
+        self._stale += 1
+
+    def quantile(self, quantile: float) -> Union[float, None]:
+
+        if len(self.samples) < 1:
+            return None
+
+        # Re-sorting the whole window on every call is wasteful on
+        # hot paths, so only refresh once enough new samples arrive.
+        if self._stale >= max(1, self.size // 16) or len(self._sorted) < 1:
+            self._sorted = sorted(self.samples)
+            self._stale = 0
+
+        index = min(
+            len(self._sorted) - 1,
+            int(quantile * len(self._sorted))
+        )
+
+        return self._sorted[index]
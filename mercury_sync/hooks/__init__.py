@@ -2,4 +2,5 @@ from .client_hook import client
 from .endpoint_hook import endpoint
 from .middleware_hook import middleware
 from .server_hook import server
+from .session_hook import session
 from .stream_hook import stream
\ No newline at end of file
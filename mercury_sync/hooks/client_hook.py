@@ -1,12 +1,32 @@
 import functools
+import random
+import weakref
+from mercury_sync.caching import (
+    create_request_key,
+    ResponseCache
+)
+from mercury_sync.coalescing import RequestCoalescer
+from mercury_sync.hedging import HedgeExecutor
+from mercury_sync.models.cache_policy import CachePolicy
+from mercury_sync.models.error import Error
+from mercury_sync.models.hedge_policy import HedgePolicy
+from mercury_sync.models.retry_policy import RetryPolicy
+from mercury_sync.retries import RetryExecutor
 from mercury_sync.service import Service
 from mercury_sync.service.controller import Controller
-from typing import Union
+from mercury_sync.snowflake.constants import MAX_INSTANCE
+from mercury_sync.snowflake.snowflake_generator import SnowflakeGenerator
+from typing import Optional, Union
 
 
 def client(
     call_name: str, 
-    as_tcp: bool=False
+    as_tcp: bool=False,
+    one_way: bool=False,
+    coalesce: bool=False,
+    cache: Optional[CachePolicy]=None,
+    retry: Optional[RetryPolicy]=None,
+    hedge: Optional[HedgePolicy]=None
 ):
 
     def wraps(func):
@@ -14,6 +34,60 @@ def client(
         func.client_only = True
         func.target = call_name
 
+        # Decorating happens once per class, so coalescing state is kept
+        # per instance and dropped with it - a new instance can never join
+        # calls made by an earlier one.
+        coalescers: Union[
+            weakref.WeakKeyDictionary[
+                Union[Service, Controller],
+                RequestCoalescer
+            ],
+            None
+        ] = None
+        if coalesce:
+            coalescers = weakref.WeakKeyDictionary()
+
+        # Cached responses are per instance for the same reason, so a new
+        # instance never serves an earlier one's responses.
+        response_caches: Union[
+            weakref.WeakKeyDictionary[
+                Union[Service, Controller],
+                ResponseCache
+            ],
+            None
+        ] = None
+        if cache:
+            response_caches = weakref.WeakKeyDictionary()
+
+        def get_response_cache(
+            connection: Union[Service, Controller]
+        ) -> Union[ResponseCache, None]:
+            
+            if response_caches is None:
+                return None
+            
+            response_cache = response_caches.get(connection)
+
+            if response_cache is None:
+                response_cache = ResponseCache(cache)
+                response_caches[connection] = response_cache
+
+            return response_cache
+
+        retries: Union[RetryExecutor, None] = None
+        if retry:
+            retries = RetryExecutor(retry)
+
+        hedger: Union[HedgeExecutor, None] = None
+        if hedge:
+            hedger = HedgeExecutor(hedge)
+
+        id_generator: Union[SnowflakeGenerator, None] = None
+        if retries or hedger:
+            id_generator = SnowflakeGenerator(
+                random.randint(0, MAX_INSTANCE)
+            )
+
         @functools.wraps(func)
         async def decorator(
             *args,
@@ -21,17 +95,122 @@ def client(
         ):
             connection: Union[Service, Controller] = args[0]
 
-            if as_tcp:
-                return await connection.send_tcp(
+            message = await func(*args, **kwargs)
+
+            # Nothing comes back from a one-way call, so there is
+            # nothing to cache, coalesce or retry on.
+            if one_way and as_tcp:
+                return await connection.notify_tcp(
+                    call_name,
+                    message
+                )
+            
+            elif one_way:
+                return await connection.notify(
+                    call_name,
+                    message
+                )
+
+            coalescer: Union[RequestCoalescer, None] = None
+            if coalescers is not None:
+                coalescer = coalescers.get(connection)
+
+                if coalescer is None:
+                    coalescer = RequestCoalescer()
+                    coalescers[connection] = coalescer
+
+            response_cache = get_response_cache(connection)
+
+            request_key: Union[bytes, None] = None
+            if coalescer or response_cache is not None:
+                request_key = create_request_key(
+                    call_name,
+                    message
+                )
+
+            if response_cache is not None:
+                cached = response_cache.get(request_key)
+
+                if cached is not None:
+                    return cached
+
+            # Retries and hedges reuse one request id so servers with
+            # request deduplication enabled run the handler only once.
+            request_id: Union[int, None] = None
+            if id_generator:
+                request_id = id_generator.generate()
+
+            def create_call():
+                if as_tcp:
+                    return connection.send_tcp(
+                        call_name,
+                        message,
+                        request_id=request_id
+                    )
+
+                return connection.send(
                     call_name,
-                    await func(*args, **kwargs)
+                    message,
+                    request_id=request_id
+                )
+            
+            create_attempt = create_call
+            if hedger:
+                create_attempt = lambda: hedger.run(create_call)
+
+            if retries:
+                call = retries.run(create_attempt)
+
+            else:
+                call = create_attempt()
+
+            if coalescer:
+                response = await coalescer.run(
+                    request_key,
+                    call
                 )
 
             else:
-                return await connection.send(
+                response = await call
+
+            _, response_data = response
+
+            if response_cache is not None and isinstance(response_data, Error) is False:
+                response_cache.put(
+                    request_key,
+                    response
+                )
+
+            return response
+        
+        async def invalidate(
+            *args,
+            **kwargs
+        ) -> bool:
+            
+            if response_caches is None:
+                return False
+            
+            connection: Union[Service, Controller] = args[0]
+
+            response_cache = response_caches.get(connection)
+            if response_cache is None:
+                return False
+            
+            message = await func(*args, **kwargs)
+
+            return response_cache.invalidate(
+                create_request_key(
                     call_name,
-                    await func(*args, **kwargs)
+                    message
                 )
+            )
+        
+        decorator.coalescers = coalescers
+        decorator.caches = response_caches
+        decorator.invalidate = invalidate
+        decorator.retries = retries
+        decorator.hedger = hedger
 
         return decorator
     
@@ -0,0 +1,33 @@
+import functools
+from mercury_sync.service import Service
+from mercury_sync.service.controller import Controller
+from typing import Optional, Union
+
+
+def session(
+    call_name: str,
+    window: Optional[int]=None
+):
+
+    def wraps(func):
+
+        func.client_only = True
+        func.target = call_name
+
+        @functools.wraps(func)
+        async def decorator(
+            *args,
+            **kwargs
+        ):
+            connection: Union[Service, Controller] = args[0]
+
+            async for response in connection.session(
+                call_name,
+                func(*args, **kwargs),
+                window=window
+            ):
+                yield response
+            
+        return decorator
+    
+    return wraps
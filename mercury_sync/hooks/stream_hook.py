@@ -9,7 +9,8 @@ from typing import Union
 
 def stream(
     call_name: str, 
-    as_tcp: bool=False
+    as_tcp: bool=False,
+    concurrent: bool=False
 ):
 
     def wraps(func):
@@ -29,7 +30,8 @@ def stream(
                 async for data in func(*args, **kwargs):
                     async for response in connection.stream_tcp(
                         call_name,
-                        data
+                        data,
+                        concurrent=concurrent
                     ):
                         yield response
 
@@ -38,7 +40,8 @@ def stream(
                 async for data in func(*args, **kwargs):
                     async for response in connection.stream(
                         call_name,
-                        data
+                        data,
+                        concurrent=concurrent
                     ):
 
                         yield response
@@ -0,0 +1,6 @@
+from .load_balancer import LoadBalancer
+from .load_sampler import (
+    LoadSampler,
+    calculate_load_score
+)
+from .target_stats import TargetStats
\ No newline at end of file
@@ -0,0 +1,191 @@
+import random
+import statistics
+import time
+from mercury_sync.env import Env
+from mercury_sync.env.time_parser import TimeParser
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TypeVar
+)
+from .target_stats import TargetStats
+
+
+T = TypeVar('T')
+
+
+class LoadBalancer:
+
+    def __init__(
+        self,
+        env: Env
+    ) -> None:
+        self._decay = env.MERCURY_SYNC_BALANCER_EWMA_DECAY
+        self._min_requests = env.MERCURY_SYNC_BALANCER_MIN_REQUESTS
+        self._error_threshold = env.MERCURY_SYNC_BALANCER_ERROR_THRESHOLD
+        self._latency_multiplier = env.MERCURY_SYNC_BALANCER_LATENCY_MULTIPLIER
+        self._max_ejection_percent = env.MERCURY_SYNC_BALANCER_MAX_EJECTION_PERCENT
+
+        self._ejection_time = TimeParser(
+            env.MERCURY_SYNC_BALANCER_EJECTION_TIME
+        ).time
+
+        self._stats: Dict[Hashable, TargetStats] = {}
+
+    def create_stats(self) -> TargetStats:
+        return TargetStats(
+            decay=self._decay
+        )
+
+    def stats(self, target: Hashable) -> TargetStats:
+        target_stats = self._stats.get(target)
+
+        if target_stats is None:
+            target_stats = self.create_stats()
+            self._stats[target] = target_stats
+
+        return target_stats
+
+    def start(self, target: Hashable) -> float:
+        return self.stats(target).start()
+    
+    def complete(
+        self,
+        target: Hashable,
+        started: float,
+        failed: bool=False
+    ) -> float:
+        return self.stats(target).complete(
+            started,
+            failed=failed
+        )
+    
+    def cancel(self, target: Hashable):
+        self.stats(target).cancel()
+
+    def update_load(
+        self,
+        target: Hashable,
+        load: float
+    ):
+        self.stats(target).load = max(load, 0.0)
+
+    def remove(self, target: Hashable):
+        self._stats.pop(target, None)
+
+    def select(
+        self,
+        candidates: List[T],
+        lookup: Optional[
+            Callable[
+                [T],
+                TargetStats
+            ]
+        ]=None
+    ) -> T:
+        
+        if lookup is None:
+            lookup = self.stats
+
+        candidates_count = len(candidates)
+
+        if candidates_count == 1:
+            return candidates[0]
+        
+        current_time = time.monotonic()
+
+        candidate_stats = [
+            lookup(candidate) for candidate in candidates
+        ]
+
+        self._eject_outliers(
+            candidate_stats,
+            current_time
+        )
+
+        available = [
+            idx for idx, target_stats in enumerate(candidate_stats) if target_stats.is_ejected(current_time) is False
+        ]
+
+        # If every candidate is ejected we fail open rather than
+        # refusing to route at all.
+        if len(available) < 1:
+            available = list(range(candidates_count))
+
+        if len(available) == 1:
+            return candidates[available[0]]
+        
+        first_idx, second_idx = random.sample(available, 2)
+
+        first_stats = candidate_stats[first_idx]
+        second_stats = candidate_stats[second_idx]
+
+        # Targets we have never called still carry any reported load, so
+        # an unknown latency takes the other candidate's - or a unit one
+        # if neither has been called - leaving load to break the tie.
+        first_latency = first_stats.latency
+        second_latency = second_stats.latency
+
+        if first_latency is None:
+            first_latency = second_latency
+
+        if second_latency is None:
+            second_latency = first_latency
+
+        if first_latency is None:
+            first_latency = second_latency = 1
+
+        if second_stats.cost(second_latency) < first_stats.cost(first_latency):
+            return candidates[second_idx]
+        
+        return candidates[first_idx]
+    
+    def _eject_outliers(
+        self,
+        candidate_stats: List[TargetStats],
+        current_time: float
+    ):
+        max_ejected = int(len(candidate_stats) * self._max_ejection_percent)
+
+        ejected_count = 0
+        latencies: List[float] = []
+
+        for target_stats in candidate_stats:
+
+            if target_stats.ejected_until and target_stats.is_ejected(current_time) is False:
+                target_stats.reinstate()
+
+            if target_stats.is_ejected(current_time):
+                ejected_count += 1
+
+            elif target_stats.latency is not None:
+                latencies.append(target_stats.latency)
+
+        if ejected_count >= max_ejected:
+            return
+        
+        median_latency: Optional[float] = None
+        if len(latencies) > 1:
+            median_latency = statistics.median(latencies)
+
+        for target_stats in candidate_stats:
+
+            if ejected_count >= max_ejected:
+                break
+
+            if target_stats.requests < self._min_requests or target_stats.is_ejected(current_time):
+                continue
+
+            high_error_rate = target_stats.error_rate > self._error_threshold
+            high_latency = median_latency is not None and target_stats.latency > median_latency * self._latency_multiplier
+
+            if high_error_rate or high_latency:
+                target_stats.eject(
+                    current_time,
+                    self._ejection_time
+                )
+
+                ejected_count += 1
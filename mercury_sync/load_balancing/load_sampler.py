@@ -0,0 +1,86 @@
+import asyncio
+import os
+import psutil
+from mercury_sync.models.healthcheck import LoadReport
+from typing import Union
+
+
+# Scales that map each signal onto roughly one unit of load, so a node
+# at 100% cpu, 100ms of loop lag or 100 queued requests costs double.
+LOOP_LAG_SCALE = 0.1
+QUEUE_DEPTH_SCALE = 100
+
+
+def calculate_load_score(load: LoadReport) -> float:
+    cpu_percent, loop_lag, inflight, queue_depth = load
+
+    return (
+        cpu_percent / 100
+    ) + (
+        loop_lag / 10**6 / LOOP_LAG_SCALE
+    ) + (
+        (inflight + queue_depth) / QUEUE_DEPTH_SCALE
+    )
+
+
+class LoadSampler:
+
+    def __init__(
+        self,
+        interval: float
+    ) -> None:
+        self.interval = interval
+        self.cpu_percent = 0.0
+        self.loop_lag = 0.0
+
+        self._process: Union[psutil.Process, None] = None
+        self._sampler_task: Union[asyncio.Task, None] = None
+        self._running = False
+
+    def start(self):
+        if self._sampler_task is None:
+            self._process = psutil.Process(os.getpid())
+            self._process.cpu_percent()
+
+            self._running = True
+            self._sampler_task = asyncio.create_task(
+                self._sample()
+            )
+
+    def create_report(
+        self,
+        inflight: int,
+        queue_depth: int
+    ) -> LoadReport:
+        return (
+            round(self.cpu_percent),
+            round(self.loop_lag * 10**6),
+            inflight,
+            queue_depth
+        )
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+
+        while self._running:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+
+            # Any time past the requested wake up was spent waiting on
+            # other callbacks, which is the lag requests see as well.
+            self.loop_lag = max(loop.time() - expected, 0)
+            self.cpu_percent = self._process.cpu_percent()
+
+    async def close(self):
+        self._running = False
+
+        if self._sampler_task:
+            self._sampler_task.cancel()
+
+            try:
+                await self._sampler_task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._sampler_task = None
@@ -0,0 +1,80 @@
+import time
+from typing import Union
+
+
+class TargetStats:
+
+    __slots__ = (
+        "decay",
+        "latency",
+        "error_rate",
+        "inflight",
+        "requests",
+        "ejected_until",
+        "ejections",
+        "load"
+    )
+
+    def __init__(
+        self,
+        decay: float=0.3
+    ) -> None:
+        self.decay = decay
+        self.latency: Union[float, None] = None
+        self.error_rate = 0.0
+        self.inflight = 0
+        self.requests = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.load = 0.0
+
+    def start(self) -> float:
+        self.inflight += 1
+        return time.monotonic()
+
+    def complete(
+        self,
+        started: float,
+        failed: bool=False
+    ) -> float:
+        elapsed = time.monotonic() - started
+
+        self.inflight = max(self.inflight - 1, 0)
+        self.requests += 1
+
+        if self.latency is None:
+            self.latency = elapsed
+
+        else:
+            self.latency += self.decay * (elapsed - self.latency)
+
+        self.error_rate += self.decay * (float(failed) - self.error_rate)
+
+        return elapsed
+    
+    def cancel(self):
+        self.inflight = max(self.inflight - 1, 0)
+    
+    def cost(self, default_latency: float=0) -> float:
+        latency = self.latency
+
+        if latency is None:
+            latency = default_latency
+
+        return latency * (self.inflight + 1) * (1 + self.load)
+    
+    def is_ejected(self, current_time: float) -> bool:
+        return self.ejected_until > current_time
+    
+    def eject(
+        self,
+        current_time: float,
+        ejection_time: float
+    ):
+        self.ejections = min(self.ejections + 1, 10)
+        self.ejected_until = current_time + (ejection_time * self.ejections)
+
+    def reinstate(self):
+        self.ejected_until = 0.0
+        self.error_rate = 0.0
+        self.requests = 0
@@ -0,0 +1,19 @@
+from .member import Member
+from .member_table import (
+    MemberTable,
+    STATUS_PRECEDENCE
+)
+from .membership_digest import (
+    compare_digests,
+    create_digest,
+    select_entries
+)
+from .membership_event import (
+    MembershipEvent,
+    MembershipEventType
+)
+from .membership_subscription import MembershipSubscription
+from .phi_accrual_detector import (
+    PhiAccrualDetector,
+    SampleWindow
+)
\ No newline at end of file
@@ -0,0 +1,61 @@
+import asyncio
+from mercury_sync.models.healthcheck import (
+    HealthStatus,
+    LoadReport
+)
+from typing import (
+    Dict,
+    Tuple,
+    Union
+)
+from .phi_accrual_detector import PhiAccrualDetector
+
+
+class Member:
+
+    __slots__ = (
+        'node_id',
+        'host',
+        'port',
+        'status',
+        'incarnation',
+        'confirmed_suspicions',
+        'investigators',
+        'suspect_task',
+        'detector',
+        'load',
+        'index',
+        'joined'
+    )
+
+    def __init__(
+        self,
+        node_id: int,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int=0
+    ) -> None:
+        self.node_id = node_id
+        self.host = host
+        self.port = port
+        self.status = status
+        self.incarnation = incarnation
+        self.confirmed_suspicions = 0
+        self.investigators: Union[Dict[Tuple[str, int], HealthStatus], None] = None
+        self.suspect_task: Union[asyncio.Task, None] = None
+        self.detector: Union[PhiAccrualDetector, None] = None
+        self.load: Union[LoadReport, None] = None
+        self.index = -1
+        self.joined = False
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return (
+            self.host,
+            self.port
+        )
+    
+    def clear_suspicion(self):
+        self.confirmed_suspicions = 0
+        self.investigators = None
@@ -0,0 +1,278 @@
+import random
+from mercury_sync.models.healthcheck import HealthStatus
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
+from .member import Member
+
+
+# For equal incarnations a stronger claim wins, so a suspicion beats
+# an alive report and a failure beats both (SWIM, section 4.2).
+STATUS_PRECEDENCE: Dict[HealthStatus, int] = {
+    'initializing': 0,
+    'waiting': 0,
+    'healthy': 0,
+    'suspect': 1,
+    'failed': 2,
+    'left': 3
+}
+
+
+class MemberTable:
+
+    def __init__(self) -> None:
+        self._ids: Dict[Tuple[str, int], int] = {}
+        self._rows: List[Union[Member, None]] = []
+        self._active: List[Member] = []
+        self._probe_order: List[Member] = []
+        self._probe_index = 0
+
+    def __len__(self) -> int:
+        return len(self._active)
+    
+    def __contains__(self, address: Tuple[str, int]) -> bool:
+        return self.get(*address) is not None
+    
+    def __iter__(self) -> Iterator[Member]:
+        return iter(list(self._active))
+    
+    def get_node_id(
+        self,
+        host: str,
+        port: int
+    ) -> int:
+        address = (host, port)
+
+        node_id = self._ids.get(address)
+        if node_id is None:
+            node_id = len(self._rows)
+            self._ids[address] = node_id
+            self._rows.append(None)
+
+        return node_id
+
+    def get(
+        self,
+        host: str,
+        port: int
+    ) -> Union[Member, None]:
+        node_id = self._ids.get((host, port))
+        if node_id is None:
+            return None
+        
+        return self._rows[node_id]
+    
+    def get_status(
+        self,
+        host: str,
+        port: int
+    ) -> Union[HealthStatus, None]:
+        member = self.get(host, port)
+        if member:
+            return member.status
+    
+    def add(
+        self,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int=0
+    ) -> Member:
+        
+        member = self.get(host, port)
+        if member:
+            member.status = status
+            member.incarnation = incarnation
+            return member
+        
+        node_id = self.get_node_id(host, port)
+        member = Member(
+            node_id,
+            host,
+            port,
+            status,
+            incarnation=incarnation
+        )
+
+        member.index = len(self._active)
+        self._active.append(member)
+        self._rows[node_id] = member
+
+        # Joiners land at a random position in the remainder of the
+        # current round, so they are probed before it completes without
+        # biasing where in the round that happens.
+        probe_position = random.randint(
+            self._probe_index,
+            len(self._probe_order)
+        )
+
+        self._probe_order.append(member)
+        self._probe_order[probe_position], self._probe_order[-1] = (
+            self._probe_order[-1],
+            self._probe_order[probe_position]
+        )
+
+        return member
+    
+    def update(
+        self,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int
+    ) -> bool:
+        
+        member = self.get(host, port)
+        if member is None:
+            self.add(
+                host,
+                port,
+                status,
+                incarnation=incarnation
+            )
+
+            return True
+        
+        if incarnation > member.incarnation:
+            overrides = True
+
+        elif incarnation == member.incarnation:
+            overrides = STATUS_PRECEDENCE[status] > STATUS_PRECEDENCE[member.status]
+
+        else:
+            overrides = False
+
+        if overrides:
+            member.status = status
+            member.incarnation = incarnation
+
+        return overrides
+    
+    def remove(
+        self,
+        host: str,
+        port: int
+    ) -> Union[Member, None]:
+        member = self.get(host, port)
+        if member is None:
+            return None
+
+        # Swap the last row into the hole so removal stays O(1) and the
+        # active list remains dense for sampling.
+        last = self._active.pop()
+        if last is not member:
+            self._active[member.index] = last
+            last.index = member.index
+
+        member.index = -1
+        self._rows[member.node_id] = None
+
+        return member
+    
+    def members(
+        self,
+        statuses: Optional[Sequence[HealthStatus]]=None
+    ) -> List[Member]:
+        
+        if statuses is None:
+            return list(self._active)
+        
+        return [
+            member for member in self._active if member.status in statuses
+        ]
+    
+    def addresses(
+        self,
+        statuses: Optional[Sequence[HealthStatus]]=None
+    ) -> List[Tuple[str, int]]:
+        return [
+            member.address for member in self.members(statuses=statuses)
+        ]
+    
+    def sample(
+        self,
+        count: int,
+        statuses: Optional[Sequence[HealthStatus]]=None,
+        exclude: Optional[Tuple[str, int]]=None
+    ) -> List[Member]:
+        
+        active_count = len(self._active)
+        if count < 1 or active_count < 1:
+            return []
+
+        # Rejection sampling touches O(k) rows when most members match,
+        # falling back to a filtered scan only when few of them do.
+        selected: Dict[int, Member] = {}
+        attempts = count * 4
+
+        while len(selected) < count and attempts > 0:
+            attempts -= 1
+
+            member = self._active[random.randrange(active_count)]
+
+            if statuses is not None and member.status not in statuses:
+                continue
+
+            if exclude is not None and member.address == exclude:
+                continue
+
+            selected[member.node_id] = member
+
+        if len(selected) >= count:
+            return list(selected.values())
+        
+        candidates = [
+            member for member in self.members(statuses=statuses) if member.address != exclude
+        ]
+
+        return random.sample(
+            candidates,
+            min(count, len(candidates))
+        )
+    
+    def next_probe(
+        self,
+        statuses: Optional[Sequence[HealthStatus]]=None
+    ) -> Union[Member, None]:
+        
+        # SWIM round-robin: walk a shuffled order and reshuffle once a
+        # round is exhausted, so every member is probed within one pass
+        # of N periods. Removed rows are skipped lazily and dropped at
+        # the next reshuffle, keeping the amortized cost per probe O(1).
+        reshuffled = False
+
+        while True:
+
+            if self._probe_index >= len(self._probe_order):
+                if reshuffled or len(self._active) < 1:
+                    return None
+
+                self._probe_order = list(self._active)
+                random.shuffle(self._probe_order)
+                self._probe_index = 0
+                reshuffled = True
+
+            member = self._probe_order[self._probe_index]
+            self._probe_index += 1
+
+            if self._rows[member.node_id] is not member:
+                continue
+
+            if statuses is not None and member.status not in statuses:
+                continue
+
+            return member
+
+    def to_dict(self):
+        return {
+            f'{member.host}:{member.port}': {
+                'status': member.status,
+                'incarnation': member.incarnation
+            } for member in self._active
+        }
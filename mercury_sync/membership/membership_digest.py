@@ -0,0 +1,92 @@
+import zlib
+from hashlib import blake2b
+from mercury_sync.models.healthcheck import (
+    HealthStatus,
+    MembershipUpdate
+)
+from typing import (
+    Iterable,
+    List,
+    Sequence
+)
+from .member_table import STATUS_PRECEDENCE
+
+
+def get_bucket(
+    host: str,
+    port: int,
+    buckets: int
+) -> int:
+    return zlib.crc32(
+        f'{host}:{port}'.encode()
+    ) % buckets
+
+
+def hash_entry(
+    host: str,
+    port: int,
+    status: HealthStatus,
+    incarnation: int
+) -> int:
+    # Statuses of equal precedence (waiting/healthy) merge as equals, so
+    # they hash as equals too - otherwise two converged views would
+    # never produce matching digests.
+    entry_hash = blake2b(
+        f'{host}:{port}:{incarnation}:{STATUS_PRECEDENCE[status]}'.encode(),
+        digest_size=8
+    )
+
+    return int.from_bytes(
+        entry_hash.digest(),
+        byteorder='big'
+    )
+
+
+def create_digest(
+    entries: Iterable[MembershipUpdate],
+    buckets: int
+) -> List[int]:
+    digest = [0] * buckets
+
+    # XOR keeps each bucket independent of entry order.
+    for host, port, status, incarnation in entries:
+        bucket = get_bucket(host, port, buckets)
+        digest[bucket] ^= hash_entry(
+            host,
+            port,
+            status,
+            incarnation
+        )
+
+    return digest
+
+
+def compare_digests(
+    local: Sequence[int],
+    remote: Sequence[int]
+) -> List[int]:
+    
+    if len(local) != len(remote):
+        return list(range(len(local)))
+    
+    return [
+        bucket for bucket, (local_hash, remote_hash) in enumerate(
+            zip(local, remote)
+        ) if local_hash != remote_hash
+    ]
+
+
+def select_entries(
+    entries: Iterable[MembershipUpdate],
+    buckets: int,
+    selected: Sequence[int]
+) -> List[MembershipUpdate]:
+    selected_buckets = set(selected)
+
+    return [
+        entry for entry in entries if get_bucket(
+            entry[0],
+            entry[1],
+            buckets
+        ) in selected_buckets
+    ]
@@ -0,0 +1,56 @@
+from mercury_sync.models.healthcheck import HealthStatus
+from typing import (
+    Literal,
+    Tuple
+)
+
+
+MembershipEventType = Literal[
+    "join",
+    "suspect",
+    "alive",
+    "failed",
+    "left"
+]
+
+
+class MembershipEvent:
+
+    __slots__ = (
+        'event_type',
+        'host',
+        'port',
+        'status',
+        'incarnation',
+        'timestamp'
+    )
+
+    def __init__(
+        self,
+        event_type: MembershipEventType,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int,
+        timestamp: float
+    ) -> None:
+        self.event_type = event_type
+        self.host = host
+        self.port = port
+        self.status = status
+        self.incarnation = incarnation
+        self.timestamp = timestamp
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return (
+            self.host,
+            self.port
+        )
+    
+    def __repr__(self) -> str:
+        return (
+            f'MembershipEvent(event_type={self.event_type}, host={self.host}, '
+            f'port={self.port}, status={self.status}, incarnation={self.incarnation}, '
+            f'timestamp={self.timestamp})'
+        )
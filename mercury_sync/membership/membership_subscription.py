@@ -0,0 +1,68 @@
+import asyncio
+from collections import deque
+from typing import Deque, Union
+from .membership_event import MembershipEvent
+
+
+class MembershipSubscription:
+
+    def __init__(
+        self,
+        max_buffered: int=1024
+    ) -> None:
+        self.max_buffered = max(max_buffered, 1)
+        self.dropped = 0
+
+        self._events: Deque[MembershipEvent] = deque()
+        self._waiter: Union[asyncio.Future, None] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def publish(self, event: MembershipEvent):
+
+        if self._closed:
+            return
+
+        # A slow subscriber loses its oldest events rather than holding
+        # memory or blocking the Monitor, and can check dropped to know
+        # it should resync from a full view.
+        if len(self._events) >= self.max_buffered:
+            self._events.popleft()
+            self.dropped += 1
+
+        self._events.append(event)
+        self._wake()
+
+    def close(self):
+        self._closed = True
+        self._wake()
+
+    def _wake(self):
+        if self._waiter and self._waiter.done() is False:
+            self._waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> MembershipEvent:
+
+        while len(self._events) < 1:
+
+            if self._closed:
+                raise StopAsyncIteration
+            
+            self._waiter = asyncio.get_event_loop().create_future()
+
+            try:
+                await self._waiter
+
+            finally:
+                self._waiter = None
+
+        return self._events.popleft()
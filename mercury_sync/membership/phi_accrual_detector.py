@@ -0,0 +1,158 @@
+import math
+from array import array
+from statistics import NormalDist
+from typing import Union
+
+
+# 1 - cdf() bottoms out in float precision past roughly 8 sigma, so
+# probabilities are clamped rather than allowed to reach zero.
+MIN_PROBABILITY = 1e-15
+
+
+class SampleWindow:
+
+    __slots__ = (
+        'size',
+        'count',
+        '_samples',
+        '_next',
+        '_sum',
+        '_squares'
+    )
+
+    def __init__(
+        self,
+        size: int=100
+    ) -> None:
+        self.size = max(size, 1)
+        self.count = 0
+        self._samples = array('d', [0.0] * self.size)
+        self._next = 0
+        self._sum = 0.0
+        self._squares = 0.0
+
+    def add(self, sample: float):
+
+        if self.count == self.size:
+            evicted = self._samples[self._next]
+            self._sum -= evicted
+            self._squares -= evicted * evicted
+
+        else:
+            self.count += 1
+
+        self._samples[self._next] = sample
+        self._sum += sample
+        self._squares += sample * sample
+
+        self._next = (self._next + 1) % self.size
+
+    @property
+    def mean(self) -> float:
+        if self.count < 1:
+            return 0.0
+        
+        return self._sum/self.count
+    
+    @property
+    def std_deviation(self) -> float:
+        if self.count < 2:
+            return 0.0
+
+        mean = self.mean
+        variance = max(
+            self._squares/self.count - mean * mean,
+            0.0
+        )
+
+        return math.sqrt(variance)
+
+
+class PhiAccrualDetector:
+
+    __slots__ = (
+        'min_samples',
+        'min_std_deviation',
+        'last_arrival',
+        'intervals',
+        'round_trips'
+    )
+
+    def __init__(
+        self,
+        window_size: int=100,
+        min_samples: int=5,
+        min_std_deviation: float=0.01
+    ) -> None:
+        self.min_samples = min_samples
+        self.min_std_deviation = min_std_deviation
+        self.last_arrival: Union[float, None] = None
+        self.intervals = SampleWindow(size=window_size)
+        self.round_trips = SampleWindow(size=window_size)
+
+    @property
+    def ready(self) -> bool:
+        return self.round_trips.count >= self.min_samples
+    
+    def heartbeat(
+        self,
+        now: float,
+        round_trip: float
+    ):
+        if self.last_arrival is not None:
+            self.intervals.add(now - self.last_arrival)
+
+        self.last_arrival = now
+        self.round_trips.add(round_trip)
+
+    def phi(self, now: float) -> float:
+
+        if self.last_arrival is None or self.intervals.count < self.min_samples:
+            return 0.0
+        
+        distribution = self._create_distribution(self.intervals)
+        later = 1 - distribution.cdf(now - self.last_arrival)
+
+        return -math.log10(
+            max(later, MIN_PROBABILITY)
+        )
+    
+    def round_trip_timeout(self, threshold: float) -> float:
+        return self._get_quantile(
+            self.round_trips,
+            threshold
+        )
+    
+    def arrival_deadline(self, threshold: float) -> Union[float, None]:
+        # Monotonic time at which phi of the inter-arrival history
+        # crosses the threshold if nothing further is heard.
+        if self.last_arrival is None or self.intervals.count < self.min_samples:
+            return None
+        
+        return self.last_arrival + self._get_quantile(
+            self.intervals,
+            threshold
+        )
+    
+    def _get_quantile(
+        self,
+        window: SampleWindow,
+        threshold: float
+    ) -> float:
+        distribution = self._create_distribution(window)
+
+        return distribution.inv_cdf(
+            1 - max(
+                10 ** -threshold,
+                MIN_PROBABILITY
+            )
+        )
+
+    def _create_distribution(self, window: SampleWindow) -> NormalDist:
+        return NormalDist(
+            mu=window.mean,
+            sigma=max(
+                window.std_deviation,
+                self.min_std_deviation
+            )
+        )
@@ -0,0 +1,12 @@
+from pydantic import (
+    StrictStr,
+    StrictInt
+)
+from .message import Message
+
+
+class BulkTransfer(Message):
+    name: StrictStr
+    path: StrictStr
+    size: StrictInt
+    checksum: StrictStr
@@ -0,0 +1,21 @@
+from mercury_sync.env.time_parser import TimeParser
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt
+)
+from typing import (
+    Optional, 
+    Literal
+)
+
+
+class CachePolicy(BaseModel):
+    time_to_live: StrictStr='30s'
+    max_entries: StrictInt=1024
+    max_bytes: Optional[StrictInt]
+    eviction: Literal["lru", "lfu"]="lru"
+
+    @property
+    def ttl(self):
+        return TimeParser(self.time_to_live).time
@@ -1,8 +1,20 @@
+from mercury_sync.encoding import (
+    decode_healthcheck,
+    encode_healthcheck
+)
 from pydantic import (
     StrictStr,
-    StrictInt
+    StrictInt,
+    root_validator
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple
 )
-from typing import Literal, Optional
 from .message import Message
 
 
@@ -11,15 +23,50 @@ HealthStatus = Literal[
     "waiting",
     "healthy", 
     "suspect", 
-    "failed"
+    "failed",
+    "left"
+]
+
+MembershipUpdate = Tuple[
+    StrictStr,
+    StrictInt,
+    HealthStatus,
+    StrictInt
+]
+
+# cpu percent, event loop lag in microseconds, in-flight requests and
+# queued tasks, kept as ints so they pack into a few varint bytes.
+LoadReport = Tuple[
+    StrictInt,
+    StrictInt,
+    StrictInt,
+    StrictInt
 ]
 
 class HealthCheck(Message):
     target_host: Optional[StrictStr]
     target_port: Optional[StrictInt]
     target_status: Optional[HealthStatus]
-    target_last_updated: Optional[StrictInt]
+    target_incarnation: Optional[StrictInt]
     source_host: StrictStr
     source_port: StrictInt
     source_status: Optional[HealthStatus]
-    status: HealthStatus
\ No newline at end of file
+    status: HealthStatus
+    incarnation: Optional[StrictInt]
+    updates: Optional[List[MembershipUpdate]]
+    load: Optional[LoadReport]
+
+    @root_validator(pre=True)
+    def unpack(cls, values: Dict[str, Any]):
+        packed = values.get('packed')
+        if packed is None:
+            return values
+        
+        return decode_healthcheck(packed)
+
+    def to_data(self):
+        # Membership traffic is the bulk of what a cluster sends, so it
+        # goes out packed rather than as a dict of field names.
+        return {
+            'packed': encode_healthcheck(self.__dict__)
+        }
\ No newline at end of file
@@ -0,0 +1,24 @@
+from mercury_sync.env.time_parser import TimeParser
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat
+)
+from typing import Optional
+
+
+class HedgePolicy(BaseModel):
+    delay: Optional[StrictStr]
+    quantile: StrictFloat=0.95
+    min_samples: StrictInt=20
+    max_hedges: StrictInt=1
+    window_size: StrictInt=256
+
+    @property
+    def hedge_delay(self):
+
+        if self.delay is None:
+            return None
+        
+        return TimeParser(self.delay).time
@@ -0,0 +1,15 @@
+from pydantic import (
+    StrictStr,
+    StrictInt
+)
+from typing import List, Optional
+from .healthcheck import MembershipUpdate
+from .message import Message
+
+
+class MembershipDigest(Message):
+    source_host: StrictStr
+    source_port: StrictInt
+    buckets: Optional[List[StrictInt]]
+    requested: Optional[List[StrictInt]]
+    updates: Optional[List[MembershipUpdate]]
@@ -0,0 +1,45 @@
+from mercury_sync.env.time_parser import TimeParser
+from pydantic import (
+    BaseModel,
+    StrictStr,
+    StrictInt,
+    StrictFloat
+)
+from typing import (
+    Optional,
+    Union
+)
+
+
+class RetryPolicy(BaseModel):
+    max_attempts: StrictInt=3
+    backoff: StrictStr='0.01s'
+    max_backoff: StrictStr='1s'
+    attempt_timeout: Optional[StrictStr]
+    deadline: Optional[StrictStr]
+    budget_ratio: StrictFloat=0.2
+    budget_min_per_second: Union[StrictInt, StrictFloat]=10
+
+    @property
+    def base_backoff(self):
+        return TimeParser(self.backoff).time
+    
+    @property
+    def backoff_limit(self):
+        return TimeParser(self.max_backoff).time
+    
+    @property
+    def timeout(self):
+
+        if self.attempt_timeout is None:
+            return None
+        
+        return TimeParser(self.attempt_timeout).time
+    
+    @property
+    def total_timeout(self):
+
+        if self.deadline is None:
+            return None
+        
+        return TimeParser(self.deadline).time
@@ -1,21 +1,57 @@
 import asyncio
+import json
 import math
-import random
 import time
-from collections import defaultdict, deque
+from mercury_sync.batching import RequestBatcher
+from mercury_sync.discovery.volume import BackupVolume
 from mercury_sync.env import (
     Env, 
     MonitorEnv,
     load_env
 )
 from mercury_sync.env.time_parser import TimeParser
+from mercury_sync.gossip import GossipQueue
 from mercury_sync.hooks.client_hook import client
 from mercury_sync.hooks.server_hook import server
-from mercury_sync.models.healthcheck import HealthCheck, HealthStatus
+from mercury_sync.load_balancing import (
+    LoadSampler,
+    calculate_load_score
+)
+from mercury_sync.membership import (
+    Member,
+    MemberTable,
+    MembershipEvent,
+    MembershipEventType,
+    MembershipSubscription,
+    PhiAccrualDetector,
+    STATUS_PRECEDENCE,
+    compare_digests,
+    create_digest,
+    select_entries
+)
+from mercury_sync.models.error import Error
+from mercury_sync.models.healthcheck import (
+    HealthCheck,
+    HealthStatus,
+    LoadReport,
+    MembershipUpdate
+)
+from mercury_sync.models.membership_digest import MembershipDigest
 from mercury_sync.service.controller import Controller
 from mercury_sync.snowflake import Snowflake
+from mercury_sync.tasks import TaskSupervisor
+from mercury_sync.timing import TimingWheel
 from mercury_sync.types import Call
-from typing import Optional, Dict, Tuple, List, Deque, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
 
 
 async def cancel(pending_item: asyncio.Task) -> None:
@@ -81,10 +117,6 @@ class Monitor(Controller):
         self._registered: Dict[int, Tuple[str, int]] = {}
         self._running = False
 
-        self._cleanup_interval = TimeParser(
-            env.MERCURY_SYNC_CLEANUP_INTERVAL
-        ).time
-
         self._poll_interval = TimeParser(
             monitor_env.MERCURY_SYNC_HEALTH_POLL_INTERVAL
         ).time
@@ -103,10 +135,6 @@ class Monitor(Controller):
 
         self._poll_retries = monitor_env.MERCURY_SYNC_MAX_POLL_MULTIPLIER
 
-        self._sync_interval = TimeParser(
-            monitor_env.MERCURY_SYNC_UDP_SYNC_INTERVAL
-        ).time
-
         self._check_nodes_count = monitor_env.MERCURY_SYNC_INDIRECT_CHECK_NODES
 
         self.min_suspect_multiplier = monitor_env.MERCURY_SYNC_MIN_SUSPECT_TIMEOUT_MULTIPLIER
@@ -115,114 +143,97 @@ class Monitor(Controller):
         self._max_poll_multiplier = monitor_env.MERCURY_SYNC_MAX_POLL_MULTIPLIER
         self._local_health_multiplier = 0
 
-        self._confirmed_suspicions: Dict[Tuple[str, int], int] = defaultdict(lambda: 0)
-        self._waiter: Union[asyncio.Future, None] = None
+        self._failure_detector = monitor_env.MERCURY_SYNC_FAILURE_DETECTOR
+        self._phi_threshold = monitor_env.MERCURY_SYNC_PHI_THRESHOLD
+        self._phi_window_size = monitor_env.MERCURY_SYNC_PHI_WINDOW_SIZE
+        self._phi_min_samples = monitor_env.MERCURY_SYNC_PHI_MIN_SAMPLES
+        self._phi_min_std_deviation = TimeParser(
+            monitor_env.MERCURY_SYNC_PHI_MIN_STD_DEVIATION
+        ).time
 
-        self._tasks_queue: Deque[asyncio.Task] = deque()
-        self._degraded_nodes: Deque[Tuple[str, int]] = deque()
-        self._suspect_nodes: Deque[Tuple[str, int]] = deque()
+        self._waiter: Union[asyncio.Future, None] = None
 
-        self._degraded_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
-        self._suspect_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
-        self._latest_update: Dict[Tuple[str,int], int] = {}
+        self._tasks = TaskSupervisor(
+            max_pending=env.MERCURY_SYNC_MAX_CONCURRENCY
+        )
+        self._timer = TimingWheel()
+        self._gossip = GossipQueue(
+            max_size=monitor_env.MERCURY_SYNC_GOSSIP_QUEUE_SIZE,
+            max_piggyback=monitor_env.MERCURY_SYNC_GOSSIP_MAX_PIGGYBACK,
+            retransmit_multiplier=monitor_env.MERCURY_SYNC_GOSSIP_RETRANSMIT_MULTIPLIER
+        )
 
         self._local_health_monitor: Union[asyncio.Task, None] = None
-        self._udp_sync_task: Union[asyncio.Task, None] = None
-        self._tcp_sync_task: Union[asyncio.Task, None] = None
-
-        self._cleanup_task: Union[asyncio.Task, None] = None
-        self._investigating_nodes: Dict[Tuple[str, int], Dict[Tuple[str, int]]] = defaultdict(dict)
-        self._node_statuses: Dict[Tuple[str, int], HealthStatus] = {}
 
-        self.bootstrap_host: Union[str, None] = None
-        self.bootstrap_port: Union[int, None] = None
+        self._anti_entropy_interval = TimeParser(
+            monitor_env.MERCURY_SYNC_ANTI_ENTROPY_INTERVAL
+        ).time
+        self._anti_entropy_buckets = max(
+            monitor_env.MERCURY_SYNC_ANTI_ENTROPY_BUCKETS,
+            1
+        )
+        self._anti_entropy_task: Union[asyncio.Task, None] = None
 
-        self._healthy_statuses = [
-            'waiting',
-            'healthy'
-        ]
+        # Indirect checks fanned out for concurrent suspicions often share
+        # relays, so they are coalesced into one datagram per relay.
+        self._probe_batcher: Union[RequestBatcher, None] = None
 
-        self._unhealthy_statuses = [
-            'suspect',
-            'failed'
-        ]
+        probe_batch_window = TimeParser(
+            monitor_env.MERCURY_SYNC_PROBE_BATCH_WINDOW
+        ).time
 
-    @server()
-    async def update_node_status(
-        self,
-        shard_id: int,
-        healthcheck: HealthCheck
-    ) -> Call[HealthCheck]:
-        
-        update_node_host = healthcheck.source_host
-        update_node_port = healthcheck.source_port
-        update_status = healthcheck.status
+        if probe_batch_window > 0:
+            self._probe_batcher = RequestBatcher(
+                probe_batch_window,
+                env.MERCURY_SYNC_BATCH_MAX_SIZE,
+                self.send_many
+            )
 
-        if healthcheck.target_host and healthcheck.target_port:
-            update_node_host = healthcheck.target_host
-            update_node_port = healthcheck.target_port
+        # Load reported by peers rides on probes and acks, so routing can
+        # steer away from hot nodes without a separate metrics channel.
+        self._load_sampler: Union[LoadSampler, None] = None
 
-        if healthcheck.target_status:
-            update_status = healthcheck.target_status
-        
-        local_status = self._node_statuses.get((
-            update_node_host,
-            update_node_port
-        ))
+        load_sample_interval = TimeParser(
+            monitor_env.MERCURY_SYNC_LOAD_SAMPLE_INTERVAL
+        ).time
 
+        if load_sample_interval > 0:
+            self._load_sampler = LoadSampler(load_sample_interval)
 
-        target_last_updated: Union[int, None] = healthcheck.target_last_updated
-        local_last_updated: Union[int, None] = self._latest_update.get((
-            update_node_host,
-            update_node_port
-        ), 0)
+        self._members = MemberTable()
+        self.incarnation = 0
 
-        not_self = update_node_host != self.host and update_node_port != self.port
+        self._membership_events_buffer = monitor_env.MERCURY_SYNC_MEMBERSHIP_EVENTS_BUFFER
+        self._subscriptions: Set[MembershipSubscription] = set()
 
-        if not_self and local_status in self._unhealthy_statuses:
+        self._snapshot_interval = TimeParser(
+            monitor_env.MERCURY_SYNC_SNAPSHOT_INTERVAL
+        ).time
 
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self.refresh_clients(
-                        HealthCheck(
-                            host=update_node_host,
-                            port=update_node_port,
-                            source_host=self.host,
-                            source_port=self.port,
-                            status=update_status,
-                            error=healthcheck.error
-                        )
-                    )
-                )
+        self._snapshots: Union[BackupVolume, None] = None
+        if self._snapshot_interval > 0:
+            self._snapshots = BackupVolume(
+                monitor_env.MERCURY_SYNC_SNAPSHOT_DIRECTORY,
+                self.name,
+                f'{host}_{port}'
             )
 
-        elif not_self and local_status is None:
+        self._snapshot_task: Union[asyncio.Task, None] = None
+        self._last_snapshot: Union[bytes, None] = None
 
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self.extend_client(
-                        HealthCheck(
-                            host=update_node_host,
-                            port=update_node_port,
-                            source_host=self.host,
-                            source_port=self.port,
-                            status=self.status,
-                            error=healthcheck.error
-                        )
-                    )
-                )
-            )
+        self.bootstrap_host: Union[str, None] = None
+        self.bootstrap_port: Union[int, None] = None
 
-        if target_last_updated > local_last_updated:
-            self._node_statuses[(update_node_host, update_node_port)] = update_status
+        self._healthy_statuses = [
+            'waiting',
+            'healthy'
+        ]
 
-        return HealthCheck(
-            host=healthcheck.source_host,
-            port=healthcheck.source_port,
-            source_host=self.host,
-            source_port=self.port,
-            status=self.status
-        )
+        self._unhealthy_statuses = [
+            'suspect',
+            'failed',
+            'left'
+        ]
 
     @server()
     async def update_as_suspect(
@@ -230,6 +241,8 @@ class Monitor(Controller):
         shard_id: int,
         healthcheck: HealthCheck
     ) -> Call[HealthCheck]:
+        self._merge_updates(healthcheck)
+
         
         source_host = healthcheck.source_host
         source_port = healthcheck.source_port
@@ -240,12 +253,10 @@ class Monitor(Controller):
                 self._max_poll_multiplier
             ) + 1
 
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self._run_healthcheck(
-                        source_host,
-                        source_port
-                    )
+            self._tasks.spawn(
+                self._run_healthcheck(
+                    source_host,
+                    source_port
                 )
             )
 
@@ -254,6 +265,31 @@ class Monitor(Controller):
             port=source_port,
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
+            status=self.status,
+            updates=self._get_updates()
+        )
+
+    @server()
+    async def register_leave(
+        self,
+        shard_id: int,
+        healthcheck: HealthCheck
+    ) -> Call[HealthCheck]:
+        self._apply_node_status(
+            healthcheck.source_host,
+            healthcheck.source_port,
+            'left',
+            healthcheck.incarnation or 0
+        )
+
+        return HealthCheck(
+            host=healthcheck.source_host,
+            port=healthcheck.source_port,
+            source_host=self.host,
+            source_port=self.port,
+            incarnation=self.incarnation,
             status=self.status
         )
 
@@ -263,6 +299,8 @@ class Monitor(Controller):
         shard_id: int,
         healthcheck: HealthCheck
     ) -> Call[HealthCheck]:
+        self._merge_updates(healthcheck)
+
         
         source_host = healthcheck.source_host
         source_port = healthcheck.source_port
@@ -295,15 +333,19 @@ class Monitor(Controller):
                     0
                 )
 
+            target = self._members.get(target_host, target_port)
+
             # We've received a refutation
             return HealthCheck(
                 host=healthcheck.source_host,
                 port=healthcheck.source_port,
-                target_status=self._node_statuses.get((target_host, target_port)),   
+                target_status=target.status if target else None,
+                target_incarnation=target.incarnation if target else None,
                 source_host=target_host,
                 source_port=target_port,
                 status=self.status,
-                error=self.error_context
+                error=self.error_context,
+                updates=self._get_updates()
             )
 
         except asyncio.TimeoutError:
@@ -312,6 +354,8 @@ class Monitor(Controller):
                 self._max_poll_multiplier
             ) + 1
 
+            target = self._members.get(target_host, target_port)
+
             # Our suspicion is correct!
             return HealthCheck(
                 host=healthcheck.source_host,
@@ -319,7 +363,9 @@ class Monitor(Controller):
                 source_host=target_host,
                 source_port=target_port,
                 target_status='suspect', 
-                status=self.status
+                target_incarnation=target.incarnation if target else None,
+                status=self.status,
+                updates=self._get_updates()
             )
     
     @server()
@@ -328,24 +374,31 @@ class Monitor(Controller):
         shard_id: int,
         healthcheck: HealthCheck
     ) -> Call[HealthCheck]:
+        self._merge_updates(healthcheck)
+
         source_host = healthcheck.source_host
         source_port = healthcheck.source_port
         target_host = healthcheck.target_host
         target_port = healthcheck.target_port
 
-        if self._investigating_nodes.get((target_host, target_port)) is None:
-            self._investigating_nodes[(target_host, target_port)] = {}
+        target = self._members.get(target_host, target_port)
+
+        if target:
+
+            if target.investigators is None:
+                target.investigators = {}
 
-        self._investigating_nodes[(target_host, target_port)].update({
-            (source_host, source_port): healthcheck.status
-        })
+            target.investigators[(source_host, source_port)] = healthcheck.status
 
         return HealthCheck(
             host=source_host,
             port=source_port,
             source_host=self.host,
             source_port=self.port,
-            status=self.status
+            incarnation=self.incarnation,
+            load=self._get_load(),
+            status=self.status,
+            updates=self._get_updates()
         )
         
     @server()
@@ -354,6 +407,7 @@ class Monitor(Controller):
         shard_id: int,
         healthcheck: HealthCheck
     ) -> Call[HealthCheck]:
+        self._merge_updates(healthcheck)
             
         source_host = healthcheck.source_host
         source_port = healthcheck.source_port
@@ -361,71 +415,117 @@ class Monitor(Controller):
         target_host = healthcheck.target_host
         target_port = healthcheck.target_port
 
-        local_node_status = self._node_statuses.get((source_host, source_port))
+        source = self._members.get(source_host, source_port)
+        local_node_status: Union[HealthStatus, None] = None
 
-        suspect_tasks = dict(self._suspect_tasks)
-        suspect_task = suspect_tasks.pop((source_host, source_port), None)
+        if source:
+            local_node_status = source.status
 
-        if suspect_task:
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    cancel(suspect_task)
-                )
+        if source and source.suspect_task:
+            self._tasks.spawn(
+                cancel(source.suspect_task)
             )
 
-            del self._suspect_tasks[(source_host, source_port)]
-
-            self._suspect_tasks = suspect_tasks
-
+            source.suspect_task = None
 
         if local_node_status is None:
 
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self.extend_client(
-                        HealthCheck(
-                            host=source_host,
-                            port=source_port,
-                            source_host=self.host,
-                            source_port=self.port,
-                            status=healthcheck.status,
-                            error=healthcheck.error
-                        )
+            self._tasks.spawn(
+                self.extend_client(
+                    HealthCheck(
+                        host=source_host,
+                        port=source_port,
+                        source_host=self.host,
+                        source_port=self.port,
+                        status=healthcheck.status,
+                        error=healthcheck.error
                     )
                 )
             )
 
         elif local_node_status in self._unhealthy_statuses:
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self.refresh_clients(
-                        HealthCheck(
-                            host=source_host,
-                            port=source_port,
-                            source_host=self.host,
-                            source_port=self.port,
-                            status=healthcheck.status,
-                            error=healthcheck.error
-                        )
+            self._tasks.spawn(
+                self.refresh_clients(
+                    HealthCheck(
+                        host=source_host,
+                        port=source_port,
+                        source_host=self.host,
+                        source_port=self.port,
+                        status=healthcheck.status,
+                        error=healthcheck.error
                     )
                 )
             )
     
 
-        self._node_statuses[(source_host, source_port)] = healthcheck.status
-        self._latest_update[(source_host, source_port)] = Snowflake.parse(shard_id).timestamp
+        self._set_node_status(
+            source_host,
+            source_port,
+            healthcheck.status,
+            incarnation=healthcheck.incarnation
+        )
 
-        if target_host and target_port: 
-            self._node_statuses[(target_host, target_port)] = healthcheck.target_status
+        if target_host and target_port and healthcheck.target_status: 
+            self._apply_node_status(
+                target_host,
+                target_port,
+                healthcheck.target_status,
+                healthcheck.target_incarnation or 0
+            )
 
         return HealthCheck(
             host=healthcheck.source_host,
             port=healthcheck.source_port,
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
             source_status=local_node_status,
             error=self.error_context,
-            status=self.status
+            status=self.status,
+            updates=self._get_updates()
+        )
+
+    @server()
+    async def sync_membership(
+        self,
+        shard_id: int,
+        digest: MembershipDigest
+    ) -> Call[MembershipDigest]:
+        self._merge_updates(digest)
+
+        requested: Union[List[int], None] = None
+        updates: Union[List[MembershipUpdate], None] = None
+
+        if digest.buckets:
+            # Bucket with the initiator's count so the requested indexes
+            # mean the same thing on both sides.
+            buckets_count = len(digest.buckets)
+            entries = self._get_membership_entries()
+
+            differing = compare_digests(
+                create_digest(
+                    entries,
+                    buckets_count
+                ),
+                digest.buckets
+            )
+
+            if len(differing) > 0:
+                requested = differing
+                updates = select_entries(
+                    entries,
+                    buckets_count,
+                    differing
+                )
+
+        return MembershipDigest(
+            host=digest.source_host,
+            port=digest.source_port,
+            source_host=self.host,
+            source_port=self.port,
+            requested=requested,
+            updates=updates
         )
 
     @client('register_health_update')
@@ -439,20 +539,13 @@ class Monitor(Controller):
         error_context: Optional[str]=None
     ) -> Call[HealthCheck]:
         
-        target_status: Union[HealthCheck, None] = None
-        if target_host and target_port:
-            target_status = self._node_statuses.get((target_host, target_port))
-
-        return HealthCheck(
-            host=host,
-            port=port,
-            source_host=self.host,
-            source_port=self.port,
+        return self._create_status_update(
+            host,
+            port,
+            health_status,
             target_host=target_host,
             target_port=target_port,
-            target_status=target_status,
-            error=error_context,
-            status=health_status
+            error_context=error_context
         )
     
     @client('register_health_update', as_tcp=True)
@@ -466,20 +559,13 @@ class Monitor(Controller):
         error_context: Optional[str]=None
     ) -> Call[HealthCheck]:
         
-        target_status: Union[HealthCheck, None] = None
-        if target_host and target_port:
-            target_status = self._node_statuses.get((target_host, target_port))
-
-        return HealthCheck(
-            host=host,
-            port=port,
-            source_host=self.host,
-            source_port=self.port,
+        return self._create_status_update(
+            host,
+            port,
+            health_status,
             target_host=target_host,
             target_port=target_port,
-            target_status=target_status,
-            error=error_context,
-            status=health_status
+            error_context=error_context
         )
     
     async def _run_tcp_healthcheck(
@@ -497,7 +583,7 @@ class Monitor(Controller):
 
             try:
 
-                response: Tuple[int, HealthCheck] = await asyncio.wait_for(
+                response: Tuple[int, HealthCheck] = await self._timer.wait_for(
                     self.push_tcp_health_update(
                         host,
                         port,
@@ -510,9 +596,15 @@ class Monitor(Controller):
                 )
 
                 shard_id, healthcheck = response
+                self._merge_updates(healthcheck)
                 source_host, source_port = healthcheck.source_host, healthcheck.source_port
 
-                self._node_statuses[(source_host, source_port)] = healthcheck.status
+                self._set_node_status(
+                    source_host,
+                    source_port,
+                    healthcheck.status,
+                    incarnation=healthcheck.incarnation
+                )
 
                 self._local_health_multiplier = max(
                     0, 
@@ -534,16 +626,10 @@ class Monitor(Controller):
             check_host = target_host
             check_port = target_port
 
-        if healthcheck is None and self._node_statuses.get((check_host, check_port)) == 'healthy':
-            self._node_statuses[(check_host, check_port)] = 'suspect'
-
-            self._suspect_nodes.append((
+        if healthcheck is None:
+            self._start_suspicion(
                 check_host,
                 check_port
-            ))
-
-            self._suspect_tasks[(host, port)] = asyncio.create_task(
-                self._start_suspect_monitor()
             )
 
         return shard_id, healthcheck
@@ -563,10 +649,13 @@ class Monitor(Controller):
             port=port,
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
             target_host=target_host,
             target_port=target_port,
             status=health_status,
-            error=error_context
+            error=error_context,
+            updates=self._get_updates()
         )
     
     @client('send_indirect_check')
@@ -585,15 +674,17 @@ class Monitor(Controller):
             port=port,
             target_host=target_host,
             target_port=target_port,
-            target_status=self._node_statuses[(target_host, target_port)],
+            target_status=self._members.get_status(target_host, target_port),
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
             error=error_context,
-            status=health_status
+            status=health_status,
+            updates=self._get_updates()
         )
     
-    @client('update_node_status')
-    async def push_status_update(
+    def _create_status_update(
         self,
         host: str,
         port: int,
@@ -601,68 +692,86 @@ class Monitor(Controller):
         target_host: Optional[str]=None,
         target_port: Optional[int]=None,
         error_context: Optional[str]=None
-    ) -> Call[HealthCheck]:
+    ) -> HealthCheck:
         
         target_status: Union[HealthStatus, None] = None
-        target_last_updated: Union[int,  None] = self._latest_update.get(
-            (host, port), 0
-        )
+        target_incarnation: Union[int, None] = None
 
+        target = None
         if target_host and target_port:
-            target_status = self._node_statuses.get((target_host, target_port))
-            target_last_updated = self._latest_update.get(
-                (target_host, target_port), 0
-            )
+            target = self._members.get(target_host, target_port)
+
+        if target:
+            target_status = target.status
+            target_incarnation = target.incarnation
 
         return HealthCheck(
             host=host,
             port=port,
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
             target_host=target_host,
             target_port=target_port,
-            target_last_updated=target_last_updated,
             target_status=target_status,
+            target_incarnation=target_incarnation,
             status=health_status,
-            error=error_context
+            error=error_context,
+            updates=self._get_updates()
+        )
+
+    @client('sync_membership', as_tcp=True)
+    async def push_membership_digest(
+        self,
+        host: str,
+        port: int
+    ) -> Call[MembershipDigest]:
+        return MembershipDigest(
+            host=host,
+            port=port,
+            source_host=self.host,
+            source_port=self.port,
+            buckets=create_digest(
+                self._get_membership_entries(),
+                self._anti_entropy_buckets
+            )
         )
     
-    @client('update_node_status', as_tcp=True)
-    async def push_tcp_status_update(
+    @client('sync_membership', as_tcp=True, one_way=True)
+    async def push_membership_delta(
         self,
         host: str,
         port: int,
-        health_status: HealthStatus,
-        target_host: Optional[str]=None,
-        target_port: Optional[int]=None,
-        error_context: Optional[str]=None
-    ) -> Call[HealthCheck]:
-        
-        target_status: Union[HealthStatus, None] = None
-        target_last_updated: Union[int,  None] = self._latest_update.get(
-            (host, port), 0
-        )
-
-        if target_host and target_port:
-            target_status = self._node_statuses.get((target_host, target_port))
-            target_last_updated = self._latest_update.get(
-                (target_host, target_port), 0
+        requested: List[int]
+    ) -> Call[MembershipDigest]:
+        return MembershipDigest(
+            host=host,
+            port=port,
+            source_host=self.host,
+            source_port=self.port,
+            updates=select_entries(
+                self._get_membership_entries(),
+                self._anti_entropy_buckets,
+                requested
             )
+        )
 
-
+    @client('register_leave', one_way=True)
+    async def push_leave(
+        self,
+        host: str,
+        port: int
+    ) -> Call[HealthCheck]:
         return HealthCheck(
             host=host,
             port=port,
             source_host=self.host,
             source_port=self.port,
-            target_host=target_host,
-            target_port=target_port,
-            target_status=target_status,
-            target_last_updated=target_last_updated,
-            status=health_status,
-            error=error_context
+            incarnation=self.incarnation,
+            status='left'
         )
-    
+
     @client('update_as_suspect')
     async def push_suspect_update(
         self,
@@ -676,13 +785,20 @@ class Monitor(Controller):
             port=port,
             source_host=self.host,
             source_port=self.port,
+            incarnation=self.incarnation,
+            load=self._get_load(),
             status=health_status,
-            error=error_context
+            error=error_context,
+            updates=self._get_updates()
         )
     
     async def start(self):
 
         await self.start_server()
+
+        if self._load_sampler:
+            self._load_sampler.start()
+
         await asyncio.sleep(self.boot_wait)
 
     async def register(
@@ -693,8 +809,10 @@ class Monitor(Controller):
         
         self.bootstrap_host = host
         self.bootstrap_port = port
+
+        known_members = await self._restore_snapshot()
         
-        await asyncio.wait_for(
+        await self._timer.wait_for(
             asyncio.create_task(
                 self.start_client(
                     HealthCheck(
@@ -711,81 +829,287 @@ class Monitor(Controller):
             timeout=self.registration_timeout
         )
 
-        self._node_statuses[(host, port)] = 'healthy'
+        self._set_node_status(
+            host,
+            port,
+            'healthy'
+        )
 
         self.status = 'healthy'
         self._running = True
+
+        if len(known_members) > 0:
+            await self._rejoin_known_members(known_members)
         
         self._healthchecks[(host, port)] = asyncio.create_task(
             self.start_health_monitor()
         )
-        
-        self.confirmation_task = asyncio.create_task(
-            self.cleanup_pending_checks()
-        )
-
-        self._udp_sync_task = asyncio.create_task(
-            self._run_udp_state_sync()
-        )
 
-        self._tcp_sync_task = asyncio.create_task(
-            self._run_tcp_state_sync()
+        self._anti_entropy_task = asyncio.create_task(
+            self._run_anti_entropy()
         )
 
-    def _calculate_min_suspect_timeout(self):
-        nodes_count = len(self._node_statuses) + 1
-
-        poll_interval = self._poll_interval * (self._local_health_multiplier + 1)
+        if self._snapshots:
+            self._snapshot_task = asyncio.create_task(
+                self._run_snapshots()
+            )
 
-        return round(
-            self.min_suspect_multiplier * math.log10(nodes_count) * poll_interval,
-            2
-        )
+    async def _restore_snapshot(self) -> List[MembershipUpdate]:
 
-    def _calculate_max_suspect_timeout(self, min_suspect_timeout: float):
+        if self._snapshots is None:
+            return []
         
-        return round(
-            self.max_suspect_multiplier * min_suspect_timeout,
-            2
-        )
-
-    def _calculate_suspicion_timeout(
-        self,
-        suspect_node_address: Tuple[str, int]
-    ):
+        try:
+            snapshot_data = await self._snapshots.read()
 
-        min_suspect_timeout = self._calculate_min_suspect_timeout()
+        except OSError:
+            return []
         
-        max_suspect_timeout = self._calculate_max_suspect_timeout(min_suspect_timeout)
+        if snapshot_data is None:
+            return []
+        
+        # The file is plain data and every field is checked, so a bad
+        # or planted snapshot can only be ignored, never executed.
+        try:
+            snapshot: Dict[str, Any] = json.loads(snapshot_data)
+            incarnation = snapshot['incarnation']
 
-        confirmed_suspect_count = max(
-            0,
-            self._confirmed_suspicions[suspect_node_address]
-        )
+            known_members: List[MembershipUpdate] = [
+                (
+                    host,
+                    port,
+                    status,
+                    member_incarnation
+                ) for host, port, status, member_incarnation in snapshot['members']
+            ]
 
-        timeout_modifier = math.log(
-            confirmed_suspect_count + 1
-        )/math.log(self._min_suspect_node_count + 1)
+        except (ValueError, KeyError, TypeError):
+            return []
 
-        timeout_difference = max_suspect_timeout - min_suspect_timeout
+        valid_entries = all([
+            isinstance(host, str) and isinstance(port, int) and isinstance(
+                member_incarnation,
+                int
+            ) and status in STATUS_PRECEDENCE for host, port, status, member_incarnation in known_members
+        ])
 
-        return max(
-            min_suspect_timeout,
-            max_suspect_timeout - (timeout_difference * timeout_modifier)
+        if isinstance(incarnation, int) is False or valid_entries is False:
+            return []
+
+        # Peers may still hold a suspect or failed claim about our last
+        # incarnation, so come back with a newer one that overrides it.
+        self.incarnation = max(
+            self.incarnation,
+            incarnation + 1
         )
+
+        return known_members
     
-    async def _acknowledge_indirect_probe(
-        self,
-        host: str,
-        port: int,
-        target_host: str,
-        target_port: int
-    ):
-        try:
-            timeout = self._poll_timeout * (self._local_health_multiplier + 1)
-            response: Tuple[int, HealthCheck] = await asyncio.wait_for(
-                self.push_acknowledge_check(
-                    host,
+    async def _rejoin_known_members(self, known_members: List[MembershipUpdate]):
+
+        bootstrap_address = (
+            self.bootstrap_host,
+            self.bootstrap_port
+        )
+
+        peers = [
+            (host, port) for host, port, status, _ in known_members if status not in self._unhealthy_statuses and (
+                host,
+                port
+            ) not in (
+                bootstrap_address,
+                (self.host, self.port)
+            )
+        ]
+
+        # Probing every known peer at once rebuilds the view in about one
+        # round trip rather than waiting on gossip from the bootstrap.
+        await asyncio.gather(*[
+            self._rejoin_member(
+                host,
+                port
+            ) for host, port in peers
+        ], return_exceptions=True)
+
+    async def _rejoin_member(
+        self,
+        host: str,
+        port: int
+    ):
+        try:
+            await self._timer.wait_for(
+                self.extend_client(
+                    HealthCheck(
+                        host=host,
+                        port=port,
+                        source_host=self.host,
+                        source_port=self.port,
+                        status=self.status
+                    )
+                ),
+                timeout=self._poll_timeout * (self._max_poll_multiplier + 1)
+            )
+
+        except (asyncio.TimeoutError, OSError):
+            return
+        
+        await self._run_healthcheck(
+            host,
+            port
+        )
+
+    async def _run_snapshots(self):
+
+        while self._running:
+
+            await self._timer.sleep(
+                self._snapshot_interval
+            )
+
+            await self._write_snapshot()
+
+    async def _write_snapshot(self):
+
+        snapshot_data = json.dumps(
+            {
+                'incarnation': self.incarnation,
+                'members': [
+                    (
+                        member.host,
+                        member.port,
+                        member.status,
+                        member.incarnation
+                    ) for member in self._members
+                ]
+            }
+        ).encode()
+
+        if snapshot_data == self._last_snapshot:
+            return
+        
+        try:
+            await self._snapshots.write(snapshot_data)
+            self._last_snapshot = snapshot_data
+
+        except OSError:
+            pass
+
+    def _calculate_min_suspect_timeout(self):
+        nodes_count = len(self._members) + 1
+
+        poll_interval = self._poll_interval * (self._local_health_multiplier + 1)
+
+        return round(
+            self.min_suspect_multiplier * math.log10(nodes_count) * poll_interval,
+            2
+        )
+
+    def _calculate_max_suspect_timeout(self, min_suspect_timeout: float):
+        
+        return round(
+            self.max_suspect_multiplier * min_suspect_timeout,
+            2
+        )
+
+    def _calculate_suspicion_timeout(
+        self,
+        suspect: Member,
+        suspected_at: Optional[float]=None
+    ):
+
+        min_suspect_timeout = self._calculate_min_suspect_timeout()
+        
+        max_suspect_timeout = self._calculate_max_suspect_timeout(min_suspect_timeout)
+
+        confirmed_suspect_count = max(
+            0,
+            suspect.confirmed_suspicions
+        )
+
+        timeout_modifier = math.log(
+            confirmed_suspect_count + 1
+        )/math.log(self._min_suspect_node_count + 1)
+
+        timeout_difference = max_suspect_timeout - min_suspect_timeout
+
+        suspicion_timeout = max(
+            min_suspect_timeout,
+            max_suspect_timeout - (timeout_difference * timeout_modifier)
+        )
+
+        if self._failure_detector == 'phi' and suspect.detector and suspected_at is not None:
+            deadline = suspect.detector.arrival_deadline(self._phi_threshold)
+
+            # A suspect already overdue by its own arrival history fails
+            # as fast as Lifeguard allows, while one with jittery history
+            # keeps up to the full confirmation-scaled timeout.
+            if deadline is not None:
+                suspicion_timeout = min(
+                    suspicion_timeout,
+                    max(
+                        min_suspect_timeout,
+                        deadline - suspected_at
+                    )
+                )
+
+        return suspicion_timeout
+    
+    def _get_probe_timeout(
+        self,
+        host: str,
+        port: int
+    ) -> float:
+        
+        timeout = self._poll_timeout
+
+        member = self._members.get(host, port)
+        if self._failure_detector == 'phi' and member and member.detector and member.detector.ready:
+            timeout = min(
+                member.detector.round_trip_timeout(self._phi_threshold),
+                self._poll_timeout * (self._max_poll_multiplier + 1)
+            )
+
+        return timeout * (self._local_health_multiplier + 1)
+    
+    def _record_heartbeat(
+        self,
+        host: str,
+        port: int,
+        round_trip: float
+    ):
+        if self._failure_detector != 'phi':
+            return
+        
+        member = self._members.get(host, port)
+        if member is None:
+            return
+        
+        if member.detector is None:
+            member.detector = PhiAccrualDetector(
+                window_size=self._phi_window_size,
+                min_samples=self._phi_min_samples,
+                min_std_deviation=self._phi_min_std_deviation
+            )
+
+        member.detector.heartbeat(
+            time.monotonic(),
+            round_trip
+        )
+    
+    async def _acknowledge_indirect_probe(
+        self,
+        host: str,
+        port: int,
+        target_host: str,
+        target_port: int
+    ):
+        try:
+            timeout = self._get_probe_timeout(host, port)
+            start = time.monotonic()
+
+            response: Tuple[int, HealthCheck] = await self._timer.wait_for(
+                self.push_acknowledge_check(
+                    host,
                     port,
                     target_host,
                     target_port,
@@ -796,10 +1120,22 @@ class Monitor(Controller):
             )
 
             _, healthcheck = response
+            self._merge_updates(healthcheck)
 
             source_host, source_port = healthcheck.source_host, healthcheck.source_port
 
-            self._node_statuses[(source_host, source_port)] = healthcheck.status
+            self._set_node_status(
+                source_host,
+                source_port,
+                healthcheck.status,
+                incarnation=healthcheck.incarnation
+            )
+
+            self._record_heartbeat(
+                source_host,
+                source_port,
+                time.monotonic() - start
+            )
 
             self._local_health_multiplier = max(
                 0, 
@@ -812,17 +1148,10 @@ class Monitor(Controller):
                 self._max_poll_multiplier
             ) + 1
 
-            if self._node_statuses.get((host, port)) == 'healthy':
-                self._node_statuses[(host, port)] = 'suspect'
-
-                self._suspect_nodes.append((
-                    host,
-                    port
-                ))
-
-                self._suspect_tasks[(host, port)] = asyncio.create_task(
-                    self._start_suspect_monitor()
-                )
+            self._start_suspicion(
+                host,
+                port
+            )
 
     async def _run_healthcheck(
         self, 
@@ -839,7 +1168,9 @@ class Monitor(Controller):
 
             try:
 
-                response: Tuple[int, HealthCheck] = await asyncio.wait_for(
+                start = time.monotonic()
+
+                response: Tuple[int, HealthCheck] = await self._timer.wait_for(
                     self.push_health_update(
                         host,
                         port,
@@ -848,13 +1179,25 @@ class Monitor(Controller):
                         target_port=target_port,
                         error_context=self.error_context
                     ),
-                    timeout=self._poll_timeout * (self._local_health_multiplier + 1)
+                    timeout=self._get_probe_timeout(host, port)
                 )
 
                 shard_id, healthcheck = response
+                self._merge_updates(healthcheck)
                 source_host, source_port = healthcheck.source_host, healthcheck.source_port
 
-                self._node_statuses[(source_host, source_port)] = healthcheck.status
+                self._set_node_status(
+                    source_host,
+                    source_port,
+                    healthcheck.status,
+                    incarnation=healthcheck.incarnation
+                )
+
+                self._record_heartbeat(
+                    source_host,
+                    source_port,
+                    time.monotonic() - start
+                )
 
                 self._local_health_multiplier = max(
                     0, 
@@ -876,51 +1219,58 @@ class Monitor(Controller):
             check_host = target_host
             check_port = target_port
 
-        if healthcheck is None and self._node_statuses.get((check_host, check_port)) == 'healthy':
-            self._node_statuses[(check_host, check_port)] = 'suspect'
-
-            self._suspect_nodes.append((
+        if healthcheck is None:
+            self._start_suspicion(
                 check_host,
                 check_port
-            ))
-
-            self._suspect_tasks[(host, port)] = asyncio.create_task(
-                self._start_suspect_monitor()
             )
 
         return shard_id, healthcheck
 
-    async def _start_suspect_monitor(self):
-
-        if len(self._suspect_nodes) < 1:
+    def _start_suspicion(
+        self,
+        host: str,
+        port: int
+    ):
+        member = self._members.get(host, port)
+        if member is None or member.status != 'healthy':
             return
         
-        address = self._suspect_nodes.pop()
-        suspect_host, suspect_port = address
-        
-        suspicion_timeout = self._calculate_suspicion_timeout(address)
+        self._set_node_status(
+            host,
+            port,
+            'suspect'
+        )
 
+        if member.suspect_task is None or member.suspect_task.done():
+            member.suspect_task = asyncio.create_task(
+                self._start_suspect_monitor(member)
+            )
 
-        elapsed = 0
+    async def _start_suspect_monitor(self, suspect: Member):
+
+        suspect_host, suspect_port = suspect.address
+        
         start = time.monotonic()
+        suspicion_timeout = self._calculate_suspicion_timeout(
+            suspect,
+            suspected_at=start
+        )
 
-        while elapsed < suspicion_timeout and self._node_statuses[(suspect_host, suspect_port)] == 'suspect':
+        elapsed = 0
 
-            self._tasks_queue.append(
-                asyncio.create_task(
-                    self._push_suspect_update(
-                        host=suspect_host,
-                        port=suspect_port,
-                        health_status=self.status,
-                        error_context=self.error_context
-                    )
+        while elapsed < suspicion_timeout and suspect.status == 'suspect':
+
+            self._tasks.spawn(
+                self._push_suspect_update(
+                    host=suspect_host,
+                    port=suspect_port,
+                    health_status=self.status,
+                    error_context=self.error_context
                 )
             )
                 
-            confirmation_members = self._get_confirmation_members((
-                suspect_host,
-                suspect_port
-            ))
+            confirmation_members = self._get_confirmation_members(suspect.address)
 
             suspect_count = await self._request_indirect_probe(
                 suspect_host,
@@ -928,12 +1278,14 @@ class Monitor(Controller):
                 confirmation_members
             )
 
-            self._confirmed_suspicions[(suspect_host, suspect_port)] += max(
+            suspect.confirmed_suspicions += max(
                 0,
                 suspect_count - 1
             )
 
-            indirect_ack_count = len(self._investigating_nodes[(suspect_host, suspect_port)])
+            indirect_ack_count = 0
+            if suspect.investigators:
+                indirect_ack_count = len(suspect.investigators)
 
             missing_ack_count = len(confirmation_members) - indirect_ack_count
 
@@ -951,41 +1303,52 @@ class Monitor(Controller):
 
             if suspect_count < confirmation_members_count:
                 # We had a majority confirmation the node was healthy.
-                self._investigating_nodes[(suspect_host, suspect_port)] = {}
-                self._confirmed_suspicions[(suspect_host, suspect_port)] = 0
+                suspect.clear_suspicion()
 
-                self._node_statuses[(suspect_host, suspect_port)] = 'healthy'
+                self._set_node_status(
+                    suspect_host,
+                    suspect_port,
+                    'healthy'
+                )
 
                 break
             
-            await asyncio.sleep(
+            await self._timer.sleep(
                 self._poll_interval * (self._local_health_multiplier + 1)
             ) 
 
             elapsed = time.monotonic() - start
-            suspicion_timeout = self._calculate_suspicion_timeout(address)
+            suspicion_timeout = self._calculate_suspicion_timeout(
+                suspect,
+                suspected_at=start
+            )
 
-        if self._node_statuses[(suspect_host, suspect_port)] == 'suspect':
-            self._node_statuses[(suspect_host, suspect_port)] = 'failed'
+        if suspect.status == 'suspect':
+            self._set_node_status(
+                suspect_host,
+                suspect_port,
+                'failed'
+            )
         
-        self._investigating_nodes[(suspect_host, suspect_port)] = {}
-        self._confirmed_suspicions[(suspect_host, suspect_port)] = 0
+        suspect.clear_suspicion()
             
     def _get_confirmation_members(self, suspect_address: Tuple[str, int]) -> List[Tuple[str, int]]:
-
-        confirmation_members = [
-            address for address in self._node_statuses.keys() if address != suspect_address
+        # Sample twice as many relays as we need and keep the cheapest by
+        # latency and piggybacked load, so probes avoid overloaded peers.
+        candidates = [
+            member.address for member in self._members.sample(
+                self._check_nodes_count * 2,
+                exclude=suspect_address
+            )
         ]
 
-        confirmation_members_count = len(confirmation_members)
+        confirmation_members: List[Tuple[str, int]] = []
 
-        if self._check_nodes_count > confirmation_members_count:
-            self._check_nodes_count = confirmation_members_count
-            
-        confirmation_members = random.sample(
-            confirmation_members, 
-            self._check_nodes_count
-        )
+        while len(candidates) > 0 and len(confirmation_members) < self._check_nodes_count:
+            selected = self.select_peer(candidates)
+            candidates.remove(selected)
+
+            confirmation_members.append(selected)
 
         return confirmation_members
 
@@ -996,64 +1359,73 @@ class Monitor(Controller):
         confirmation_members: List[Tuple[str, int]]
     ) -> Tuple[List[Call[HealthCheck]], int]:
 
-        if len(confirmation_members) < 1:
-            requested_checks = [
-                asyncio.create_task(
-                    self._run_tcp_healthcheck(
-                        host,
-                        port
-                    )
-                )
-            ]
+        timeout = self._poll_timeout * (self._local_health_multiplier + 1)
         
-        else:
-            requested_checks = [
-                asyncio.create_task(
-                    self.request_indirect_check(
-                        node_host,
-                        node_port,
-                        host,
-                        port,
-                        self.status,
-                        error_context=self.error_context
-                    )
-                ) for node_host, node_port in confirmation_members
-            ]
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
 
-            requested_checks.append(
-                asyncio.create_task(
-                    self._run_tcp_healthcheck(
-                        host,
-                        port
-                    )
-                )
+        direct_check = asyncio.create_task(
+            self._run_tcp_healthcheck(
+                host,
+                port
             )
-
-        check_tasks: Tuple[List[asyncio.Task], List[asyncio.Task]] = await asyncio.wait(
-            requested_checks, 
-            timeout=self._poll_timeout * (self._local_health_multiplier + 1)
         )
 
-        completed, pending = check_tasks
+        healthchecks: List[Call[HealthCheck]] = []
+        errors_count = 0
+
+        async for shard_id, check in self.scatter(
+            'send_indirect_check',
+            HealthCheck(
+                target_host=host,
+                target_port=port,
+                target_status=self._members.get_status(host, port),
+                source_host=self.host,
+                source_port=self.port,
+                error=self.error_context,
+                status=self.status,
+                incarnation=self.incarnation,
+                load=self._get_load()
+            ),
+            confirmation_members,
+            timeout=timeout,
+            batcher=self._probe_batcher
+        ):
+            
+            if isinstance(check, Error):
+                errors_count += 1
+
+            else:
+                self._merge_updates(check)
 
-        results: List[Call[HealthCheck]]  = await asyncio.gather(
-            *completed,
-            return_exceptions=True
+                healthchecks.append((
+                    shard_id,
+                    check
+                ))
+
+        pending_count = len(confirmation_members) - len(healthchecks) - errors_count
+
+        _, pending = await asyncio.wait(
+            [direct_check],
+            timeout=max(deadline - loop.time(), 0)
         )
 
-        healthchecks = [
-            result for result in results if isinstance(
-                result,
-                tuple
-            )
-        ]
+        if direct_check in pending:
+            pending_count += 1
 
-        errors = [
-            result for result in results if isinstance(
-                result,
-                tuple
-            ) is False
-        ]
+        else:
+
+            try:
+                direct_shard_id, direct_healthcheck = direct_check.result()
+
+                if direct_healthcheck is not None:
+                    healthchecks.append((
+                        direct_shard_id,
+                        direct_healthcheck
+                    ))
+
+            except Exception:
+                errors_count += 1
 
         sorted_checks: List[Call[HealthCheck]] = list(sorted(
             healthchecks,
@@ -1077,7 +1449,7 @@ class Monitor(Controller):
         ]
             
         if len(healthy) < 1:
-            suspect_count = len(suspect) + len(pending) + len(errors)
+            suspect_count = len(suspect) + pending_count + errors_count
 
         else:
             suspect_checks: List[Call[HealthCheck]] = []
@@ -1094,7 +1466,7 @@ class Monitor(Controller):
                         suspect_check
                     ))
 
-            suspect_count = len(suspect_checks) + len(pending) + len(errors)
+            suspect_count = len(suspect_checks) + pending_count + errors_count
         
         await asyncio.gather(*[
             cancel(pending_check) for pending_check in pending
@@ -1102,229 +1474,388 @@ class Monitor(Controller):
 
         return suspect_count
     
-    async def _propagate_state_update(
+    def _set_node_status(
         self,
-        target_host: str,
-        target_port: int
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: Optional[int]=None
     ):
-        monitoring = [
-            address for address, status in self._node_statuses.items() if status in self._healthy_statuses
-        ]
+        member = self._members.get(host, port)
 
-        for host, port in monitoring:
-            await self.push_health_update(
+        if member is None:
+            member = self._members.add(
                 host,
                 port,
-                self.status,
-                target_host=target_host,
-                target_port=target_port
+                status,
+                incarnation=incarnation or 0
             )
 
-    async def run_forever(self):
-        self._waiter = asyncio.Future()
-        await self._waiter
+            self._gossip.enqueue(
+                host,
+                port,
+                status,
+                member.incarnation
+            )
 
-    async def start_health_monitor(self):
+            self._publish_status_change(
+                member,
+                None
+            )
 
-        while self._running:
+            return
 
-            monitors = list(self._node_statuses.keys())
+        previous_status = member.status
+        previous_incarnation = member.incarnation
 
-            host: Union[str, None] = None
-            port: Union[int, None] = None
+        member.status = status
+        if incarnation is not None:
+            member.incarnation = max(
+                incarnation,
+                member.incarnation
+            )
 
-            monitors_count = len(monitors)
+        if previous_status != status or previous_incarnation != member.incarnation:
+            self._gossip.enqueue(
+                host,
+                port,
+                status,
+                member.incarnation
+            )
 
-            if monitors_count > 0:
-                host, port = random.choice(monitors)
+            self._publish_status_change(
+                member,
+                previous_status
+            )
 
-            if self._node_statuses.get((host, port)) == 'healthy':
+    def _apply_node_status(
+        self,
+        host: str,
+        port: int,
+        status: HealthStatus,
+        incarnation: int
+    ) -> bool:
         
-                self._tasks_queue.append(
-                    asyncio.create_task(
-                        self._run_healthcheck(
-                            host,
-                            port
-                        )
-                    )
-                )
+        if host == self.host and port == self.port:
+            return False
+        
+        previous_status = self._members.get_status(host, port)
+        
+        applied = self._members.update(
+            host,
+            port,
+            status,
+            incarnation
+        )
 
-            await asyncio.sleep(
-                self._poll_interval * (self._local_health_multiplier + 1)
+        if applied:
+            self._gossip.enqueue(
+                host,
+                port,
+                status,
+                incarnation
             )
 
-    async def _run_udp_state_sync(self):
-        while self._running:
+            self._publish_status_change(
+                self._members.get(host, port),
+                previous_status
+            )
 
-            monitors = [
-                address for address, status in self._node_statuses.items() if status in self._healthy_statuses
-            ]
+        return applied
+    
+    async def membership_events(
+        self,
+        max_buffered: Optional[int]=None
+    ) -> AsyncIterable[MembershipEvent]:
+        
+        if max_buffered is None:
+            max_buffered = self._membership_events_buffer
 
-            active_nodes_count = len(monitors)
+        subscription = MembershipSubscription(
+            max_buffered=max_buffered
+        )
 
-            if active_nodes_count > 0:
+        self._subscriptions.add(subscription)
 
-                self._tasks_queue.extend([
-                    asyncio.create_task(
-                        self._push_state_to_node(
-                            host=host,
-                            port=port
-                        )
-                    ) for host, port in monitors
-                ])
+        try:
+            async for event in subscription:
+                yield event
 
-            await asyncio.sleep(
-                self._sync_interval
-            )
+        finally:
+            self._subscriptions.discard(subscription)
+            subscription.close()
 
-    async def _run_tcp_state_sync(self):
+    def _publish_status_change(
+        self,
+        member: Member,
+        previous_status: Union[HealthStatus, None]
+    ):
+        # A member first seen suspect or failed has not joined as far as
+        # subscribers know, so its first healthy status is its join.
+        joined = member.joined
+        if member.status not in self._unhealthy_statuses:
+            member.joined = True
 
-        await asyncio.sleep(
-            self._sync_interval/2
-        )
+        if len(self._subscriptions) < 1:
+            return
+        
+        event_type: Union[MembershipEventType, None] = None
+        
+        if joined is False and member.status not in self._unhealthy_statuses:
+            event_type = 'join'
 
-        while self._running:
+        elif member.status == previous_status:
+            return
 
-            monitors = [
-                address for address, status in self._node_statuses.items() if status in self._healthy_statuses
-            ]
+        elif member.status == 'suspect':
+            event_type = 'suspect'
 
-            active_nodes_count = len(monitors)
+        elif member.status == 'failed':
+            event_type = 'failed'
 
-            if active_nodes_count > 0:
+        elif member.status == 'left':
+            event_type = 'left'
 
-                self._tasks_queue.extend([
-                    asyncio.create_task(
-                        self._push_state_to_node_tcp(
-                            host=host,
-                            port=port
-                        )
-                    ) for host, port in monitors
-                ])
+        elif previous_status in self._unhealthy_statuses:
+            event_type = 'alive'
 
-            await asyncio.sleep(
-                self._sync_interval
-            )
+        if event_type is None:
+            return
+        
+        self._publish_event(
+            event_type,
+            member.host,
+            member.port,
+            member.status,
+            member.incarnation
+        )
 
-    async def _push_state_to_node(
+    def _publish_event(
         self,
+        event_type: MembershipEventType,
         host: str,
-        port: int
+        port: int,
+        status: HealthStatus,
+        incarnation: int
     ):
-        
-        updates = [
-            self._push_status_update(
-                host=host,
-                port=port,
-                target_host=node_host,
-                target_port=node_port
-            ) for node_host, node_port in self._node_statuses if self._node_statuses.get((
-                node_host,
-                node_port
-            )) == 'healthy' and host != node_host and port != node_port
-        ]
+        event = MembershipEvent(
+            event_type,
+            host,
+            port,
+            status,
+            incarnation,
+            time.time()
+        )
+
+        for subscription in self._subscriptions:
+            subscription.publish(event)
+
+    def _get_updates(self) -> Union[List[MembershipUpdate], None]:
+        updates = self._gossip.select(
+            len(self._members) + 1
+        )
 
         if len(updates) > 0:
-            await asyncio.gather(*updates)
+            return updates
+        
+    def _get_load(self) -> Union[LoadReport, None]:
+        if self._load_sampler is None:
+            return None
+        
+        inflight = sum([
+            len(connection._tasks) for connection in [
+                *self._udp_pool,
+                *self._tcp_pool
+            ]
+        ])
 
-    async def _push_state_to_node_tcp(
-        self,
-        host: str,
-        port: int
-    ):
-        updates = [
-            self._push_tcp_status_update(
-                host=host,
-                port=port,
-                target_host=node_host,
-                target_port=node_port
-            ) for node_host, node_port in self._node_statuses if self._node_statuses.get((
-                node_host,
-                node_port
-            )) == 'healthy' and host != node_host and port != node_port
-        ]
+        return self._load_sampler.create_report(
+            inflight,
+            len(self._tasks)
+        )
     
-        if len(updates) > 0:
-            await asyncio.gather(*updates)
+    def _record_load(self, healthcheck: HealthCheck):
+        member = self._members.get(
+            healthcheck.source_host,
+            healthcheck.source_port
+        )
+
+        if member is None:
+            return
+        
+        member.load = healthcheck.load
+
+        self.update_peer_load(
+            member.address,
+            calculate_load_score(healthcheck.load)
+        )
+
+    # Relay selection already uses this load through select_peer. The
+    # table exposes the raw reports for callers that route on their own.
+    def load_table(self) -> Dict[Tuple[str, int], LoadReport]:
+        return {
+            member.address: member.load for member in self._members if member.load is not None
+        }
 
-    async def _push_status_update(
+    def _merge_updates(
         self,
-        host: str,
-        port: int,
-        target_host: Optional[str]=None,
-        target_port: Optional[int]=None
-    ) -> Tuple[
-            Union[int, None], 
-            Union[HealthCheck, None]
-        ]:
+        healthcheck: Union[HealthCheck, MembershipDigest]
+    ):
         
-        shard_id: Union[int, None] = None
-        healthcheck: Union[HealthCheck, None] = None
+        if isinstance(healthcheck, HealthCheck) and healthcheck.load:
+            self._record_load(healthcheck)
 
-        for _ in range(self._poll_retries):
+        if not healthcheck.updates:
+            return
+        
+        for host, port, status, incarnation in healthcheck.updates:
 
-            try:
+            if host == self.host and port == self.port:
 
-                response: Tuple[int, HealthCheck] = await asyncio.wait_for(
-                    self.push_status_update(
-                        host,
-                        port,
+                # Refute suspicion of ourselves by bumping our incarnation,
+                # which overrides any suspect or failed claim about it.
+                if status in self._unhealthy_statuses and incarnation >= self.incarnation:
+                    self.incarnation = incarnation + 1
+                    self._gossip.enqueue(
+                        self.host,
+                        self.port,
                         self.status,
-                        target_host=target_host,
-                        target_port=target_port,
-                        error_context=self.error_context
-                    ),
-                    timeout=self._poll_timeout * (self._local_health_multiplier + 1)
+                        self.incarnation
+                    )
+
+                continue
+
+            local_status = self._members.get_status(host, port)
+
+            applied = self._apply_node_status(
+                host,
+                port,
+                status,
+                incarnation
+            )
+
+            if applied is False:
+                continue
+
+            if local_status is None:
+                self._tasks.spawn(
+                    self.extend_client(
+                        HealthCheck(
+                            host=host,
+                            port=port,
+                            source_host=self.host,
+                            source_port=self.port,
+                            status=status
+                        )
+                    )
                 )
 
-                shard_id, healthcheck = response
-                source_host, source_port = healthcheck.source_host, healthcheck.source_port
+            elif local_status in self._unhealthy_statuses and status in self._healthy_statuses:
+                self._tasks.spawn(
+                    self.refresh_clients(
+                        HealthCheck(
+                            host=host,
+                            port=port,
+                            source_host=self.host,
+                            source_port=self.port,
+                            status=status
+                        )
+                    )
+                )
 
-                self._node_statuses[(source_host, source_port)] = healthcheck.status
+    def _get_membership_entries(self) -> List[MembershipUpdate]:
+        entries: List[MembershipUpdate] = [
+            (
+                member.host,
+                member.port,
+                member.status,
+                member.incarnation
+            ) for member in self._members
+        ]
 
-                return shard_id, healthcheck
+        entries.append((
+            self.host,
+            self.port,
+            self.status,
+            self.incarnation
+        ))
 
-            except asyncio.TimeoutError:
-                pass
+        return entries
+    
+    async def _run_anti_entropy(self):
 
-        return shard_id, healthcheck
+        while self._running:
+
+            await self._timer.sleep(
+                self._anti_entropy_interval
+            )
+
+            peers = self._members.sample(
+                1,
+                statuses=self._healthy_statuses
+            )
 
-    async def _push_tcp_status_update(
+            if len(peers) > 0:
+                self._tasks.spawn(
+                    self._sync_membership(*peers[0].address)
+                )
+
+    async def _sync_membership(
         self,
         host: str,
-        port: int,
-        target_host: Optional[str]=None,
-        target_port: Optional[int]=None
+        port: int
     ):
-        shard_id: Union[int, None] = None
-        healthcheck: Union[HealthCheck, None] = None
-        
+        # Push-pull anti-entropy: ship only a per-bucket digest, pull the
+        # peer's entries for buckets that differ and push ours back.
         try:
-            
-            response: Tuple[int, HealthCheck] = await asyncio.wait_for(
-                self.push_tcp_status_update(
+            response: Call[MembershipDigest] = await self._timer.wait_for(
+                self.push_membership_digest(
                     host,
-                    port,
-                    self.status,
-                    target_host=target_host,
-                    target_port=target_port,
-                    error_context=self.error_context
+                    port
                 ),
                 timeout=self._poll_timeout * (self._local_health_multiplier + 1)
             )
 
-            shard_id, healthcheck = response
-            source_host, source_port = healthcheck.source_host, healthcheck.source_port
+        except asyncio.TimeoutError:
+            return
+        
+        _, digest = response
+        if not isinstance(digest, MembershipDigest):
+            return
+
+        self._merge_updates(digest)
 
-            self._node_statuses[(source_host, source_port)] = healthcheck.status
+        if digest.requested:
+            await self.push_membership_delta(
+                host,
+                port,
+                digest.requested
+            )
 
-            return shard_id, healthcheck
+    async def run_forever(self):
+        self._waiter = asyncio.Future()
+        await self._waiter
 
-        except asyncio.TimeoutError:
-            pass
+    async def start_health_monitor(self):
 
-        return shard_id, healthcheck
+        while self._running:
+
+            member = self._members.next_probe(
+                statuses=['healthy']
+            )
 
+            if member is not None:
+        
+                self._tasks.spawn(
+                    self._run_healthcheck(
+                        member.host,
+                        member.port
+                    )
+                )
+
+            await self._timer.sleep(
+                self._poll_interval * (self._local_health_multiplier + 1)
+            )
 
     async def _push_suspect_update(
         self,
@@ -1335,7 +1866,7 @@ class Monitor(Controller):
     ):
         
         try:
-            response: Tuple[int, HealthCheck] = await asyncio.wait_for(
+            response: Tuple[int, HealthCheck] = await self._timer.wait_for(
                 self.push_suspect_update(
                     host=host,
                     port=port,
@@ -1346,58 +1877,93 @@ class Monitor(Controller):
             )
 
             _, healthcheck = response
+            self._merge_updates(healthcheck)
 
-            self._node_statuses[(host, port)] = healthcheck.status
+            self._set_node_status(
+                host,
+                port,
+                healthcheck.status,
+                incarnation=healthcheck.incarnation
+            )
 
         except asyncio.TimeoutError:
             pass
 
-    async def cleanup_pending_checks(self):
+    async def shutdown(self):
+        await self._announce_leave()
 
-        while self._running:
+        self._running = False
 
-            for pending_check in list(self._tasks_queue):
-                if pending_check.done() or pending_check.cancelled():
-                    try:
-                        await pending_check
+        if len(self._subscriptions) > 0:
+            self._publish_event(
+                'left',
+                self.host,
+                self.port,
+                self.status,
+                self.incarnation
+            )
 
-                    except (
-                        ConnectionRefusedError,
-                        ConnectionAbortedError,
-                        ConnectionResetError
-                    ):
-                        pass
+            for subscription in self._subscriptions:
+                subscription.close()
 
-                    self._tasks_queue.remove(pending_check)
+        # Only a registered Monitor has a view worth keeping, so an
+        # unregistered one leaves any earlier snapshot in place.
+        if self._snapshot_task:
+            await cancel(self._snapshot_task)
+            await self._write_snapshot()
 
-            await asyncio.sleep(self._cleanup_interval)
-    
-    async def shutdown(self):
-        self._running = False
-        self._local_health_monitor.cancel()
+        if self._snapshots:
+            await self._snapshots.close()
 
-        await asyncio.gather(*[
-            cancel(check) for check in self._tasks_queue
-        ])
+        if self._anti_entropy_task:
+            await cancel(self._anti_entropy_task)
+
+        if self._probe_batcher:
+            await self._probe_batcher.close()
+
+        if self._load_sampler:
+            await self._load_sampler.close()
+
+        await self._tasks.shutdown()
 
         await asyncio.gather(*[
             cancel(remote_check) for remote_check in self._healthchecks.values()
         ])
 
-        await cancel(self._local_health_monitor)
-        
-        await cancel(self._cleanup_task)
+        if self._local_health_monitor:
+            await cancel(self._local_health_monitor)
+
+        await self.close()
 
-        await cancel(self._udp_sync_task)
+    async def _announce_leave(self):
+        # Peers we tell directly record us as left straight away, and
+        # gossip carries it to the rest instead of a suspicion timeout
+        # eventually declaring us failed.
+        members = self._members.addresses(
+            statuses=self._healthy_statuses
+        )
 
-        await cancel(self._tcp_sync_task)
+        if len(members) < 1:
+            return
 
-        await self.close()
+        self.status = 'left'
+
+        try:
+            await self._timer.wait_for(
+                asyncio.gather(*[
+                    self.push_leave(
+                        host,
+                        port
+                    ) for host, port in members
+                ], return_exceptions=True),
+                timeout=self._poll_timeout
+            )
+
+        except asyncio.TimeoutError:
+            pass
 
     async def soft_shutdown(self):
-        await asyncio.gather(*[
-            cancel(check) for check in self._tasks_queue
-        ])
+        await self._tasks.cancel_all()
 
 
             
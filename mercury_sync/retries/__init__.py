@@ -0,0 +1,2 @@
+from .retry_budget import RetryBudget
+from .retry_executor import RetryExecutor
\ No newline at end of file
@@ -0,0 +1,52 @@
+import time
+
+
+class RetryBudget:
+
+    __slots__ = (
+        'ratio',
+        'min_per_second',
+        'max_tokens',
+        'tokens',
+        '_last_refill'
+    )
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+
+        # Cap the balance at ten seconds worth of the minimum
+        # rate so an idle client cannot bank an unbounded retry storm.
+        self.max_tokens = max(self.min_per_second, 1) * 10
+        self.tokens = float(self.min_per_second)
+        self._last_refill = time.monotonic()
+
+    def deposit(self):
+        self._refill()
+        self.tokens = min(
+            self.max_tokens,
+            self.tokens + self.ratio
+        )
+
+    def try_withdraw(self) -> bool:
+        self._refill()
+
+        if self.tokens < 1:
+            return False
+        
+        self.tokens -= 1
+        return True
+    
+    def _refill(self):
+        current_time = time.monotonic()
+        elapsed = current_time - self._last_refill
+        self._last_refill = current_time
+
+        self.tokens = min(
+            self.max_tokens,
+            self.tokens + (elapsed * self.min_per_second)
+        )
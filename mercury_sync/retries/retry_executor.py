@@ -0,0 +1,121 @@
+import asyncio
+import random
+import time
+from mercury_sync.circuit_breaking import CircuitOpenError
+from mercury_sync.models.retry_policy import RetryPolicy
+from mercury_sync.timing import TimingWheel
+from typing import (
+    Any,
+    Callable,
+    Coroutine
+)
+from .retry_budget import RetryBudget
+
+
+class RetryExecutor:
+
+    retryable = (
+        asyncio.TimeoutError,
+        OSError
+    )
+
+    def __init__(
+        self,
+        policy: RetryPolicy
+    ) -> None:
+        self.policy = policy
+        self.max_attempts = max(policy.max_attempts, 1)
+        self.base_backoff = policy.base_backoff
+        self.max_backoff = policy.backoff_limit
+        self.attempt_timeout = policy.timeout
+        self.total_timeout = policy.total_timeout
+
+        self.budget = RetryBudget(
+            policy.budget_ratio,
+            policy.budget_min_per_second
+        )
+
+        self.attempts = 0
+        self.retries = 0
+        self.budget_exhausted = 0
+        self.deadline_exceeded = 0
+
+    def get_backoff(self, attempt: int) -> float:
+        # Full jitter - spreads retries from many clients evenly
+        # across the window instead of synchronizing them.
+        return random.uniform(
+            0,
+            min(
+                self.max_backoff,
+                self.base_backoff * (2 ** (attempt - 1))
+            )
+        )
+
+    async def run(
+        self,
+        create_call: Callable[[], Coroutine]
+    ) -> Any:
+        
+        self.budget.deposit()
+
+        deadline = None
+        if self.total_timeout:
+            deadline = time.monotonic() + self.total_timeout
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.attempts += 1
+
+            timeout = self.attempt_timeout
+            if deadline:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    self.deadline_exceeded += 1
+                    raise asyncio.TimeoutError()
+                
+                if timeout is None or remaining < timeout:
+                    timeout = remaining
+
+            try:
+                if timeout:
+                    return await TimingWheel.shared().wait_for(
+                        create_call(),
+                        timeout=timeout
+                    )
+                
+                return await create_call()
+            
+            except self.retryable as retry_error:
+
+                # An open breaker means the peer is known to be failing,
+                # so retrying would only burn the budget and the deadline.
+                if isinstance(retry_error, CircuitOpenError):
+                    raise
+
+                if attempt >= self.max_attempts:
+                    raise
+
+                backoff = self.get_backoff(attempt)
+
+                if deadline and time.monotonic() + backoff >= deadline:
+                    self.deadline_exceeded += 1
+                    raise
+
+                if self.budget.try_withdraw() is False:
+                    self.budget_exhausted += 1
+                    raise
+
+                self.retries += 1
+                await asyncio.sleep(backoff)
+
+    def to_dict(self):
+        return {
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'budget_exhausted': self.budget_exhausted,
+            'deadline_exceeded': self.deadline_exceeded,
+            'budget_tokens': self.budget.tokens
+        }
@@ -14,14 +14,28 @@ from concurrent.futures import (
     ProcessPoolExecutor
 )
 from inspect import signature
+from mercury_sync.batching import BatchHistogram, RequestBatcher
+from mercury_sync.circuit_breaking import PeerCircuitBreakers
 from mercury_sync.middleware.base import Middleware
+from mercury_sync.connection.registry import ConnectionRegistry
 from mercury_sync.connection.tcp.mercury_sync_http_connection import MercurySyncHTTPConnection
 from mercury_sync.connection.tcp.mercury_sync_tcp_connection import MercurySyncTCPConnection
 from mercury_sync.connection.udp.mercury_sync_udp_connection import MercurySyncUDPConnection
 from mercury_sync.connection.udp.mercury_sync_udp_multicast_connection import MercurySyncUDPMulticastConnection
 from mercury_sync.env import load_env, Env
+from mercury_sync.env.time_parser import TimeParser
+from mercury_sync.load_balancing import LoadBalancer, TargetStats
 from mercury_sync.models.error import Error
 from mercury_sync.models.message import Message
+from mercury_sync.streaming import (
+    get_session_model,
+    merge,
+    peek
+)
+from mercury_sync.timing import (
+    DEADLINE_EXCEEDED,
+    is_deadline_exceeded
+)
 from pydantic import BaseModel
 from typing import (
     Optional, 
@@ -34,6 +48,7 @@ from typing import (
     get_args,
     Callable,
     AsyncIterable,
+    Coroutine,
     Tuple,
     TypeVarTuple,
     Generic
@@ -52,6 +67,15 @@ mp.allow_connection_pickling()
 spawn = mp.get_context("spawn")
 
 
+def forward_batch_response(
+    indexes: List[int],
+    on_response: Callable[[int, Any], None],
+    idx: int,
+    response: Any
+):
+    on_response(indexes[idx], response)
+
+
 def handle_worker_loop_stop(
     signame, 
     loop: asyncio.AbstractEventLoop,
@@ -175,13 +199,7 @@ class Controller(Generic[*P]):
         self.name = self.__class__.__name__
         self._instance_id = random.randint(0, 2**16)
         self._response_parsers: Dict[str, Message] = {}
-        self._host_map: Dict[
-            str, 
-            Dict[
-                Union[MercurySyncUDPConnection, MercurySyncTCPConnection],
-                Tuple[str, int]
-            ]
-        ] = defaultdict(dict)
+        self._connections = ConnectionRegistry()
 
         if workers < 1:
             workers = 1
@@ -204,6 +222,33 @@ class Controller(Generic[*P]):
 
         self._plugins: Dict[str, PluginGroup[*P]] = {}
 
+        self._balancer = LoadBalancer(env)
+
+        # Keyed by remote address rather than connection, so callers
+        # choosing between peers see latency and reported load per node.
+        self._peer_balancer = LoadBalancer(env)
+        self.call_stats = TargetStats(
+            decay=env.MERCURY_SYNC_BALANCER_EWMA_DECAY
+        )
+
+        self._breakers: Union[PeerCircuitBreakers, None] = None
+        if env.MERCURY_SYNC_USE_CLIENT_CIRCUIT_BREAKER:
+            self._breakers = PeerCircuitBreakers(env)
+
+        self._stream_window = env.MERCURY_SYNC_STREAM_WINDOW
+
+        self.batch_histogram = BatchHistogram()
+        self._batch_max_size = env.MERCURY_SYNC_BATCH_MAX_SIZE
+        self._batcher: Union[RequestBatcher, None] = None
+
+        batch_window = TimeParser(env.MERCURY_SYNC_BATCH_WINDOW).time
+        if batch_window > 0:
+            self._batcher = RequestBatcher(
+                batch_window,
+                self._batch_max_size,
+                self.send_many
+            )
+
         self.engine_type = engine
         self._response_parsers: Dict[str, Message] = {}
 
@@ -261,7 +306,7 @@ class Controller(Generic[*P]):
                     key_path=key_path,
                     env=env
                 ) for _ in range(self._workers)
-            ])
+            ], balancer=self._balancer)
 
         methods = inspect.getmembers(self, predicate=inspect.ismethod)
 
@@ -269,8 +314,13 @@ class Controller(Generic[*P]):
             'connect',
             'send',
             'send_tcp',
+            'send_many',
+            'notify',
+            'notify_tcp',
+            'scatter',
             'stream',
             'stream_tcp',
+            'session',
             'close'
         ]
 
@@ -306,11 +356,16 @@ class Controller(Generic[*P]):
             if not_internal and not_reserved and is_server:
 
                 for param_type in rpc_signature.parameters.values():
+                    session_model = get_session_model(param_type.annotation)
+
                     if param_type.annotation in Message.__subclasses__():
 
                         model = param_type.annotation
                         controller_models[method_name] = model
 
+                    elif session_model:
+                        controller_models[method_name] = session_model
+
                     controller_methods[method_name] = method
 
             elif not_internal and not_reserved and is_client:
@@ -631,22 +686,10 @@ class Controller(Generic[*P]):
         cert_path: Optional[str]=None,
         key_path: Optional[str]=None    
     ):
-
-        remote_pool: List[Message] = []
-        pool_range = self._workers * 2
-
-        for idx in range(0, pool_range, 2):
-            remote_copy = Message(**{
-                'host': remote.host,
-                'port': remote.port + idx
-            })
-
-            remote_pool.append(remote_copy)
         
-        for udp_connection, tcp_connection, remote_copy in zip(
+        for udp_connection, tcp_connection in zip(
             self._udp_pool,
-            self._tcp_pool,
-            remote_pool
+            self._tcp_pool
         ):
       
             await udp_connection.connect_async(
@@ -660,33 +703,18 @@ class Controller(Generic[*P]):
                 key_path=key_path
             )
 
-            await self._udp_queue[(remote.host, remote.port)].put(udp_connection)
-            await self._tcp_queue[(remote.host, remote.port)].put(tcp_connection)
-
-            self._host_map[remote.__class__.__name__][udp_connection] = (
-                remote_copy.host, 
-                remote_copy.port
-            )
-
-            self._host_map[remote.__class__.__name__][tcp_connection] = (
-                remote_copy.host, 
-                remote_copy.port
-            )
+        self._connections.acquire((remote.host, remote.port))
 
-        for tcp_connection, remote_copy in zip(
-            self._tcp_pool,
-            remote_pool
-        ):
-            await tcp_connection.connect_client(
-                    (remote_copy.host, remote_copy.port + 1),
-                    cert_path=cert_path,
-                    key_path=key_path
-                )
+        remote_pool = await self._register_remote(
+            remote,
+            cert_path=cert_path,
+            key_path=key_path
+        )
 
         for idx in range(self._workers):
             for plugin_name in self._plugins:
 
-                remote = remote_pool[idx]
+                remote_copy = remote_pool[idx]
                 plugin: Service = self._plugins[plugin_name].at(idx)
                 
                 await plugin.connect(
@@ -697,6 +725,61 @@ class Controller(Generic[*P]):
 
         await self._copy_to_plugins()
 
+    async def _register_remote(
+        self,
+        remote: Message,
+        cert_path: Optional[str]=None,
+        key_path: Optional[str]=None 
+    ) -> List[Message]:
+        
+        remote_address = (remote.host, remote.port)
+
+        remote_pool: List[Message] = []
+        pool_range = self._workers * 2
+
+        for idx in range(0, pool_range, 2):
+            remote_copy = Message(**{
+                'host': remote.host,
+                'port': remote.port + idx
+            })
+
+            remote_pool.append(remote_copy)
+
+        # Outbound calls reuse the listeners created at startup, so a
+        # new remote only costs a route and a TCP connect per worker.
+        for udp_connection, tcp_connection, remote_copy in zip(
+            self._udp_pool,
+            self._tcp_pool,
+            remote_pool
+        ):
+            
+            self._connections.add_route(
+                remote_address,
+                udp_connection,
+                (remote_copy.host, remote_copy.port)
+            )
+
+            self._connections.add_route(
+                remote_address,
+                tcp_connection,
+                (remote_copy.host, remote_copy.port)
+            )
+
+            await self._udp_queue[remote_address].put(udp_connection)
+            await self._tcp_queue[remote_address].put(tcp_connection)
+
+        for tcp_connection, remote_copy in zip(
+            self._tcp_pool,
+            remote_pool
+        ):
+            await tcp_connection.connect_client(
+                (remote_copy.host, remote_copy.port + 1),
+                cert_path=cert_path,
+                key_path=key_path
+            )
+
+        return remote_pool
+
     async def _copy_to_plugins(self):
 
         for plugin_group in self._plugins.values():
@@ -731,101 +814,15 @@ class Controller(Generic[*P]):
         cert_path: Optional[str]=None,
         key_path: Optional[str]=None    
     ) -> int:
-
-        remote_pool: List[Message] = []
-        pool_range = self._workers * 2
-
-        for idx in range(0, pool_range, 2):
-            remote_copy = Message(**{
-                'host': remote.host,
-                'port': remote.port + idx
-            })
-
-            remote_pool.append(remote_copy)
-
-        port = max(self.port, remote.port) + pool_range
-
-        udp_pool = [
-            MercurySyncUDPConnection(
-                self.host,
-                port + idx,
-                instance_id,
-                env=self._env
-            ) for instance_id, idx in zip(
-                self.instance_ids,
-                range(0, pool_range, 2)
-            )
-        ]
-
-        tcp_pool = [
-            MercurySyncTCPConnection(
-                self.host,
-                port + idx + 1,
-                instance_id,
-                env=self._env
-            ) for instance_id, idx in zip(
-                self.instance_ids,
-                range(0, pool_range, 2)
-            )
-        ]
-
-        for tcp_connection, udp_connection in zip(
-            udp_pool,
-            tcp_pool
-        ):
-            
-            tcp_connection.parsers.update(self._parsers)
-            udp_connection.parsers.update(self._parsers)
-
-            tcp_connection.events.update(self._events)
-            udp_connection.events.update(self._events)
-            
-
-        for udp_connection, tcp_connection, remote_copy in zip(
-            udp_pool,
-            tcp_pool,
-            remote_pool
-        ):
-      
-            await udp_connection.connect_async(
-                cert_path=cert_path,
-                key_path=key_path
-            )
-
-            await tcp_connection.connect_async(
-                cert_path=cert_path,
-                key_path=key_path
-            )
-
-            await self._udp_queue[(remote.host, remote.port)].put(udp_connection)
-            await self._tcp_queue[(remote.host, remote.port)].put(tcp_connection)
-
-            self._host_map[remote.__class__.__name__][udp_connection] = (
-                remote_copy.host, 
-                remote_copy.port
-            )
-
-            self._host_map[remote.__class__.__name__][tcp_connection] = (
-                remote_copy.host, 
-                remote_copy.port
-            )
-
-        for tcp_connection, remote_copy in zip(
-            tcp_pool,
-            remote_pool
-        ):
-            await tcp_connection.connect_client(
-                (remote_copy.host, remote_copy.port + 1),
+        
+        if self._connections.acquire((remote.host, remote.port)):
+            await self._register_remote(
+                remote,
                 cert_path=cert_path,
                 key_path=key_path
             )
-            
-        self._udp_pool.extend(udp_pool)
-        self._tcp_pool.extend(tcp_pool)
-
-        self._copy_to_plugins()
 
-        return port
+        return self.port
     
     async def refresh_clients(
         self,
@@ -833,161 +830,804 @@ class Controller(Generic[*P]):
         cert_path: Optional[str]=None,
         key_path: Optional[str]=None    
     ) -> int:
+        
+        remote_address = (remote.host, remote.port)
 
-        existing_udp_connections = self._udp_queue[(remote.host, remote.port)]
-        existing_tcp_connections = self._tcp_queue[(remote.host, remote.port)]
+        if remote_address not in self._connections:
+            return await self.extend_client(
+                remote,
+                cert_path=cert_path,
+                key_path=key_path
+            )
 
-        while existing_udp_connections.empty() is False:
-            connection: MercurySyncUDPConnection = await existing_udp_connections.get()
-            await connection.close()
+        # Only the per-remote TCP clients hold state worth resetting,
+        # the shared listeners stay up for every other remote.
+        for connection, (host, port) in self._connections.routes(remote_address):
+            if isinstance(connection, MercurySyncTCPConnection):
+                await connection.close_client((host, port + 1))
 
-        while existing_tcp_connections.empty() is False:
-            connection: MercurySyncUDPConnection = await existing_tcp_connections.get()
-            await connection.close()
+                await connection.connect_client(
+                    (host, port + 1),
+                    cert_path=cert_path,
+                    key_path=key_path
+                )
 
-        return await self.extend_client(
-            remote,
-            cert_path=cert_path,
-            key_path=key_path
-        )
+        return self.port
     
     async def remove_clients(
         self,
         remote: Message 
     ):
-        
-        existing_udp_connections = self._udp_queue[(remote.host, remote.port)]
-        existing_tcp_connections = self._tcp_queue[(remote.host, remote.port)]
+        remote_address = (remote.host, remote.port)
 
-        while existing_udp_connections.empty() is False:
-            connection: MercurySyncUDPConnection = await existing_udp_connections.get()
-            await connection.close()
+        if self._connections.release(remote_address) is False:
+            return
 
-        while existing_tcp_connections.empty() is False:
-            connection: MercurySyncUDPConnection = await existing_tcp_connections.get()
-            await connection.close()
+        for connection, (host, port) in self._connections.remove(remote_address):
+            if isinstance(connection, MercurySyncTCPConnection):
+                await connection.close_client((host, port + 1))
 
-        if self._udp_queue.get((remote.host, remote.port)):
-            del self._udp_queue[(remote.host, remote.port)]
+        if self._udp_queue.get(remote_address):
+            del self._udp_queue[remote_address]
 
-        
-        if self._tcp_queue.get((remote.host, remote.port)):
-            del self._tcp_queue[(remote.host, remote.port)]
+        if self._tcp_queue.get(remote_address):
+            del self._tcp_queue[remote_address]
+
+        self._peer_balancer.remove(remote_address)
+
+        if self._breakers:
+            self._breakers.remove(remote_address)
 
     async def send(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        request_id: Optional[int]=None
     ):
-        connection: MercurySyncUDPConnection = await self._udp_queue[(message.host, message.port)].get()
-        (host, port) = self._host_map.get(message.__class__.__name__).get(connection)
+        # Batched requests are assigned fresh ids by the batch, so
+        # calls that must keep a stable id bypass the batcher.
+        if self._batcher and request_id is None:
+            return await self._batcher.submit(
+                event_name,
+                message
+            )
+        
+        remote_address = (message.host, message.port)
+
+        # Checked before waiting on the pool so calls to a peer that
+        # keeps failing are rejected without holding a connection.
+        if self._breakers:
+            self._breakers.check(remote_address)
+
+        connection_queue = self._udp_queue[remote_address]
+
+        connection: MercurySyncUDPConnection = await self._checkout_connection(connection_queue)
+        (host, port) = self._connections.get_route(remote_address, connection)
 
         address = (
             host,
             port
         )
 
-        shard_id, data = await connection.send(
-            event_name,
-            message.to_data(),
-            address
+        started = self._start_call(
+            connection,
+            remote_address
         )
+        failed = True
+        cancelled = False
 
-        response_data = self._response_parsers.get(event_name)(
-            **data
-        )
+        try:
+
+            shard_id, data = await connection.send(
+                event_name,
+                message.to_data(),
+                address,
+                request_id=request_id
+            )
 
-        self._udp_queue[(message.host, message.port)].put_nowait(connection)
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            failed = False
 
-        return shard_id, response_data
+            return shard_id, response_data
+        
+        except asyncio.CancelledError as cancel_error:
+            # A caller's deadline expiring means the peer didn't answer
+            # in time, which counts as a failure unlike other cancels.
+            cancelled = is_deadline_exceeded(cancel_error) is False
+            raise
+        
+        finally:
+            self._complete_call(
+                connection,
+                remote_address,
+                started,
+                failed=failed,
+                cancelled=cancelled
+            )
+
+            connection_queue.put_nowait(connection)
     
     async def send_tcp(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        request_id: Optional[int]=None
     ):
-        connection: MercurySyncTCPConnection = await self._tcp_queue[(message.host, message.port)].get()
-        (host, port) = self._host_map.get(message.__class__.__name__).get(connection)
+        # Batched requests are assigned fresh ids by the batch, so
+        # calls that must keep a stable id bypass the batcher.
+        if self._batcher and request_id is None:
+            return await self._batcher.submit(
+                event_name,
+                message,
+                as_tcp=True
+            )
+        
+        remote_address = (message.host, message.port)
+
+        # Checked before waiting on the pool so calls to a peer that
+        # keeps failing are rejected without holding a connection.
+        if self._breakers:
+            self._breakers.check(remote_address)
+
+        connection_queue = self._tcp_queue[remote_address]
+
+        connection: MercurySyncTCPConnection = await self._checkout_connection(connection_queue)
+        (host, port) = self._connections.get_route(remote_address, connection)
         address = (
             host,
             port + 1
         )
 
-        shard_id, data = await connection.send(
+        started = self._start_call(
+            connection,
+            remote_address
+        )
+        failed = True
+        cancelled = False
+
+        try:
+
+            shard_id, data = await connection.send(
+                event_name,
+                message.to_data(),
+                address,
+                request_id=request_id
+            )
+
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            failed = False
+
+            return shard_id, response_data
+        
+        except asyncio.CancelledError as cancel_error:
+            # A caller's deadline expiring means the peer didn't answer
+            # in time, which counts as a failure unlike other cancels.
+            cancelled = is_deadline_exceeded(cancel_error) is False
+            raise
+        
+        finally:
+            self._complete_call(
+                connection,
+                remote_address,
+                started,
+                failed=failed,
+                cancelled=cancelled
+            )
+
+            connection_queue.put_nowait(connection)
+
+    async def notify(
+        self,
+        event_name: str,
+        message: Message
+    ) -> None:
+        await self._notify(
             event_name,
-            message.to_data(),
-            address
+            message,
+            self._udp_queue
         )
 
-        response_data = self._response_parsers.get(event_name)(
-            **data
+    async def notify_tcp(
+        self,
+        event_name: str,
+        message: Message
+    ) -> None:
+        await self._notify(
+            event_name,
+            message,
+            self._tcp_queue,
+            port_offset=1
+        )
+
+    async def _notify(
+        self,
+        event_name: str,
+        message: Message,
+        queues: Dict[Tuple[str, int], asyncio.Queue],
+        port_offset: int=0
+    ) -> None:
+        remote_address = (message.host, message.port)
+
+        if self._breakers:
+            self._breakers.check(remote_address)
+
+        connection_queue = queues[remote_address]
+
+        connection: Union[
+            MercurySyncUDPConnection,
+            MercurySyncTCPConnection
+        ] = await self._checkout_connection(connection_queue)
+
+        (host, port) = self._connections.get_route(remote_address, connection)
+
+        try:
+            await connection.notify(
+                event_name,
+                message.to_data(),
+                (host, port + port_offset)
+            )
+
+        finally:
+            # No reply means no health signal, so only hand back any
+            # half-open probe slot the breaker check handed out.
+            if self._breakers:
+                self._breakers.record(
+                    remote_address,
+                    cancelled=True
+                )
+
+            connection_queue.put_nowait(connection)
+
+    async def send_many(
+        self,
+        event_name: str,
+        messages: List[Message],
+        as_tcp: bool=False,
+        on_response: Optional[
+            Callable[
+                [int, Tuple[Union[int, None], Union[Message, Error]]],
+                None
+            ]
+        ]=None
+    ) -> List[Tuple[Union[int, None], Union[Message, Error]]]:
+        
+        remote_batches: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        for idx, message in enumerate(messages):
+            remote_batches[(message.host, message.port)].append(idx)
+
+        batch_requests: List[Tuple[List[int], Coroutine]] = []
+        for indexes in remote_batches.values():
+            for batch_start in range(0, len(indexes), self._batch_max_size):
+                batch_indexes = indexes[batch_start:batch_start + self._batch_max_size]
+
+                batch_on_response: Union[Callable[..., None], None] = None
+                if on_response:
+                    batch_on_response = functools.partial(
+                        forward_batch_response,
+                        batch_indexes,
+                        on_response
+                    )
+
+                batch_requests.append((
+                    batch_indexes,
+                    self._send_batch(
+                        event_name,
+                        [
+                            messages[idx] for idx in batch_indexes
+                        ],
+                        as_tcp=as_tcp,
+                        on_response=batch_on_response
+                    )
+                ))
+
+        batch_results = await asyncio.gather(*[
+            batch_request for _, batch_request in batch_requests
+        ])
+
+        results: List[Tuple[Union[int, None], Union[Message, Error]]] = [None] * len(messages)
+        for (batch_indexes, _), batch_responses in zip(batch_requests, batch_results):
+            for idx, response in zip(batch_indexes, batch_responses):
+                results[idx] = response
+
+        return results
+    
+    async def _send_batch(
+        self,
+        event_name: str,
+        messages: List[Message],
+        as_tcp: bool=False,
+        on_response: Optional[
+            Callable[
+                [int, Tuple[Union[int, None], Union[Message, Error]]],
+                None
+            ]
+        ]=None
+    ) -> List[Tuple[Union[int, None], Union[Message, Error]]]:
+        
+        message = messages[0]
+        remote_address = (message.host, message.port)
+
+        if self._breakers:
+            self._breakers.check(remote_address)
+
+        if as_tcp:
+            connection_queue = self._tcp_queue[remote_address]
+
+        else:
+            connection_queue = self._udp_queue[remote_address]
+
+        connection: Union[
+            MercurySyncUDPConnection, 
+            MercurySyncTCPConnection
+        ] = await self._checkout_connection(connection_queue)
+
+        (host, port) = self._connections.get_route(remote_address, connection)
+
+        if as_tcp:
+            port += 1
+
+        self.batch_histogram.record(len(messages))
+
+        started = self._start_call(
+            connection,
+            remote_address
         )
+        failed = True
+        cancelled = False
+
+        response_parser = self._response_parsers.get(event_name)
+        results: List[Tuple[Union[int, None], Union[Message, Error]]] = [None] * len(messages)
+
+        # Items are parsed as the remote answers them so callers waiting
+        # on one item needn't wait on the slowest in its batch.
+        def receive_response(
+            idx: int,
+            response: Tuple[Union[int, None], Dict[str, Any]]
+        ):
+            shard_id, data = response
+
+            if shard_id is None:
+                results[idx] = (
+                    shard_id,
+                    Error(**data)
+                )
+
+            else:
+                results[idx] = (
+                    shard_id,
+                    response_parser(**data)
+                )
+
+            if on_response:
+                on_response(idx, results[idx])
+
+        try:
+
+            await connection.send_batch(
+                event_name,
+                [
+                    message.to_data() for message in messages
+                ],
+                (host, port),
+                on_response=receive_response
+            )
+
+            failed = False
+
+            return results
+        
+        except asyncio.CancelledError as cancel_error:
+            # A caller's deadline expiring means the peer didn't answer
+            # in time, which counts as a failure unlike other cancels.
+            cancelled = is_deadline_exceeded(cancel_error) is False
+            raise
+        
+        finally:
+            self._complete_call(
+                connection,
+                remote_address,
+                started,
+                failed=failed,
+                cancelled=cancelled
+            )
 
-        await self._tcp_queue[(message.host, message.port)].put(connection)
+            connection_queue.put_nowait(connection)
 
-        return shard_id, response_data
+    def _start_call(
+        self,
+        connection: Union[
+            MercurySyncUDPConnection,
+            MercurySyncTCPConnection
+        ],
+        remote_address: Tuple[str, int]
+    ) -> float:
+        self._peer_balancer.start(remote_address)
+        self.call_stats.start()
+
+        return self._balancer.start(connection)
     
+    def _complete_call(
+        self,
+        connection: Union[
+            MercurySyncUDPConnection,
+            MercurySyncTCPConnection
+        ],
+        remote_address: Tuple[str, int],
+        started: float,
+        failed: bool=False,
+        cancelled: bool=False
+    ):
+        # Hedge losers, coalesced waiters and scatter stragglers are
+        # cancelled on purpose, so they give back their in-flight slot
+        # without counting for or against the connection or peer.
+        if cancelled:
+            self._balancer.cancel(connection)
+            self._peer_balancer.cancel(remote_address)
+            self.call_stats.cancel()
+
+        else:
+            self._balancer.complete(
+                connection,
+                started,
+                failed=failed
+            )
+
+            self._peer_balancer.complete(
+                remote_address,
+                started,
+                failed=failed
+            )
+
+            self.call_stats.complete(
+                started,
+                failed=failed
+            )
+
+        if self._breakers:
+            self._breakers.record(
+                remote_address,
+                failed=failed,
+                cancelled=cancelled
+            )
+
+    def select_peer(
+        self,
+        candidates: List[Tuple[str, int]]
+    ) -> Tuple[str, int]:
+        return self._peer_balancer.select(candidates)
+
+    def update_peer_load(
+        self,
+        address: Tuple[str, int],
+        load: float
+    ):
+        self._peer_balancer.update_load(address, load)
+
+    async def _checkout_connection(
+        self,
+        connection_queue: asyncio.Queue
+    ) -> Union[MercurySyncUDPConnection, MercurySyncTCPConnection]:
+        connection = await connection_queue.get()
+
+        idle_count = connection_queue.qsize()
+        if idle_count < 1:
+            return connection
+        
+        # Pool sizes are bounded by the worker count, so draining the
+        # idle connections to pick between them stays cheap.
+        candidates = [connection]
+        candidates.extend([
+            connection_queue.get_nowait() for _ in range(idle_count)
+        ])
+
+        selected = self._balancer.select(candidates)
+
+        for candidate in candidates:
+            if candidate is not selected:
+                connection_queue.put_nowait(candidate)
+
+        return selected
+    
+    async def scatter(
+        self,
+        event_name: str,
+        message: Message,
+        targets: List[Tuple[str, int]],
+        quorum: Optional[int]=None,
+        timeout: Optional[float]=None,
+        as_tcp: bool=False,
+        batcher: Optional[RequestBatcher]=None
+    ) -> AsyncIterable[Tuple[Union[int, None], Union[Message, Error]]]:
+        
+        if quorum is None:
+            quorum = len(targets)
+
+        if batcher:
+            # Requests share a batch with anything else bound for the
+            # same target inside the batcher's window.
+            send = functools.partial(
+                batcher.submit,
+                as_tcp=as_tcp
+            )
+
+        elif as_tcp:
+            send = self.send_tcp
+
+        else:
+            send = self.send
+
+        pending: Dict[asyncio.Future, Tuple[str, int]] = {
+            asyncio.ensure_future(
+                send(
+                    event_name,
+                    message.copy(update={
+                        'host': host,
+                        'port': port
+                    })
+                )
+            ): (host, port) for host, port in targets
+        }
+
+        loop = asyncio.get_event_loop()
+
+        deadline: Union[float, None] = None
+        if timeout is not None:
+            deadline = loop.time() + timeout
+
+        received = 0
+
+        try:
+
+            while len(pending) > 0 and received < quorum:
+
+                remaining: Union[float, None] = None
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+
+                    if remaining <= 0:
+                        break
+
+                completed, _ = await asyncio.wait(
+                    pending.keys(),
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in completed:
+                    host, port = pending.pop(task)
+
+                    # A closing batcher cancels the requests it still
+                    # holds, which is a failed target rather than a
+                    # cancellation of the scatter itself.
+                    if task.cancelled():
+                        yield None, Error(
+                            host=host,
+                            port=port,
+                            error='Err. - Request was cancelled'
+                        )
+
+                        continue
+
+                    try:
+                        shard_id, response = task.result()
+
+                    except Exception as scatter_error:
+                        yield None, Error(
+                            host=host,
+                            port=port,
+                            error=str(scatter_error) or scatter_error.__class__.__name__
+                        )
+
+                        continue
+
+                    received += 1
+
+                    yield shard_id, response
+
+        finally:
+
+            # Once quorum is reached (or the deadline passes) any
+            # stragglers are cancelled so their connections are
+            # returned to the pool immediately. Only those cut off by
+            # the deadline count as having timed out.
+            cancel_message: Union[str, None] = None
+            if received < quorum and deadline is not None and loop.time() >= deadline:
+                cancel_message = DEADLINE_EXCEEDED
+
+            for task in pending:
+                task.cancel(cancel_message)
+
+            if len(pending) > 0:
+                await asyncio.gather(
+                    *pending.keys(), 
+                    return_exceptions=True
+                )
+
     async def stream(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        concurrent: bool=False,
+        max_buffered: Optional[int]=None
     ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
         
-        async for connection in self._iter_udp_connections():
-            (host, port) = self._host_map.get(message.__class__.__name__).get(connection)
+        streams = [
+            self._stream_udp_connection(
+                connection,
+                event_name,
+                message
+            ) async for connection in self._iter_udp_connections()
+        ]
 
-            address = (host, port)
+        async for response in self._merge_streams(
+            streams,
+            concurrent,
+            max_buffered
+        ):
+            yield response
 
-            async for response in connection.stream(
+    async def stream_tcp(
+        self,
+        event_name: str,
+        message: Message,
+        concurrent: bool=False,
+        max_buffered: Optional[int]=None
+    ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        
+        streams = [
+            self._stream_tcp_connection(
+                connection,
                 event_name,
-                message.to_data(),
-                address
+                message
+            ) async for connection in self._iter_tcp_connections()
+        ]
+
+        async for response in self._merge_streams(
+            streams,
+            concurrent,
+            max_buffered
+        ):
+            yield response
+
+    async def _merge_streams(
+        self,
+        streams: List[AsyncIterable[Tuple[int, Union[Message, Error]]]],
+        concurrent: bool,
+        max_buffered: Optional[int]
+    ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        
+        if concurrent:
+
+            if max_buffered is None:
+                max_buffered = self._stream_window
+
+            async for response in merge(
+                streams,
+                max_buffered=max_buffered
             ):
-                shard_id, data = response
-                response_data = self._response_parsers.get(event_name)(
-                    **data
-                )
+                yield response
 
-                yield shard_id, response_data
+        else:
+            for connection_stream in streams:
+                async for response in connection_stream:
+                    yield response
 
-    async def stream_tcp(
+    async def _stream_udp_connection(
+        self,
+        connection: MercurySyncUDPConnection,
+        event_name: str,
+        message: Message
+    ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        (host, port) = self._connections.get_route(
+            (message.host, message.port),
+            connection
+        )
+
+        address = (host, port)
+
+        async for response in connection.stream(
+            event_name,
+            message.to_data(),
+            address
+        ):
+            shard_id, data = response
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            yield shard_id, response_data
+
+    async def _stream_tcp_connection(
         self,
+        connection: MercurySyncTCPConnection,
         event_name: str,
         message: Message
     ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        (host, port) = self._connections.get_route(
+            (message.host, message.port),
+            connection
+        )
+
+        address = (host, port + 1)
+
+        async for response in connection.stream(
+            event_name,
+            message.to_data(),
+            address
+        ):
+            shard_id, data = response
+
+            if data.get('error'):
+                yield shard_id, Error(**data)
+                continue
+
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            yield shard_id, response_data
+    
+    async def session(
+        self,
+        event_name: str,
+        messages: AsyncIterable[Message],
+        window: Optional[int]=None
+    ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
         
+        message, messages = await peek(messages)
+        if message is None:
+            return
         
-        async for connection in self._iter_tcp_connections():
-            (host, port) = self._host_map.get(message.__class__.__name__).get(connection)
+        remote_address = (message.host, message.port)
 
-            address = (host, port + 1)
+        connection_queue = self._tcp_queue[remote_address]
+        connection: MercurySyncTCPConnection = await self._checkout_connection(connection_queue)
+        (host, port) = self._connections.get_route(remote_address, connection)
 
-            async for response in connection.stream(
-                event_name,
-                message.to_data(),
-                address
-            ):
-                shard_id, data = response
+        # Session frames are multiplexed over the connection, so it can
+        # go straight back to the pool instead of being held for the
+        # lifetime of the session.
+        connection_queue.put_nowait(connection)
 
-                if data.get('error'):
-                    yield shard_id, Error(**data)
+        if window is None:
+            window = self._stream_window
 
-                response_data = self._response_parsers.get(event_name)(
-                    **data
-                )
+        response_parser = self._response_parsers.get(event_name)
+
+        async for shard_id, data in connection.open_session(
+            event_name,
+            (
+                item.to_data() async for item in messages
+            ),
+            (host, port + 1),
+            window=window
+        ):
+            
+            if shard_id is None:
+                yield shard_id, Error(**data)
 
-                yield shard_id, response_data
+            else:
+                yield shard_id, response_parser(**data)
     
-    async def _iter_tcp_connections(self) -> AsyncIterable[MercurySyncUDPConnection]:
-        for connection in enumerate(self._tcp_pool):
+    async def _iter_tcp_connections(self) -> AsyncIterable[MercurySyncTCPConnection]:
+        for connection in self._tcp_pool:
             yield connection
 
-    async def _iter_udp_connections(self) -> AsyncIterable[MercurySyncTCPConnection]:
-        for connection in enumerate(self._udp_pool):
+    async def _iter_udp_connections(self) -> AsyncIterable[MercurySyncUDPConnection]:
+        for connection in self._udp_pool:
             yield connection
 
     async def close(self) -> None:
 
+        if self._batcher:
+            await self._batcher.close()
+
         if self._engine:
             self._engine.shutdown(cancel_futures=True)
 
@@ -1,4 +1,5 @@
-from typing import List, Iterable, Generic, TypeVarTuple, Union
+from mercury_sync.load_balancing import LoadBalancer, TargetStats
+from typing import List, Iterable, Generic, TypeVarTuple, Union, Optional
 from .service import Service
 
 
@@ -8,14 +9,23 @@ class PluginGroup(Generic[*P]):
 
     def __init__(
         self,
-        service_pool: List[Union[*P]]
+        service_pool: List[Union[*P]],
+        balancer: Optional[LoadBalancer]=None
     ) -> None:
         self._services = service_pool
         self._services_count = len(service_pool)
         self._current_idx = 0
+        self._balancer = balancer
 
     @property
     def one(self) -> Union[*P]:
+
+        if self._balancer:
+            return self._balancer.select(
+                self._services,
+                lookup=self._get_call_stats
+            )
+        
         service: Service = self._services[self._current_idx]
         self._current_idx = (self._current_idx + 1)%self._services_count
 
@@ -27,3 +37,6 @@ class PluginGroup(Generic[*P]):
     
     def at(self, idx: int) -> Union[*P]:
         return self._services[idx]
+    
+    def _get_call_stats(self, service: Union[*P]) -> TargetStats:
+        return service.call_stats
@@ -6,9 +6,15 @@ import inspect
 from inspect import signature
 from mercury_sync.connection.tcp.mercury_sync_tcp_connection import MercurySyncTCPConnection
 from mercury_sync.connection.udp.mercury_sync_udp_connection import MercurySyncUDPConnection
+from mercury_sync.circuit_breaking import PeerCircuitBreakers
 from mercury_sync.env import load_env, Env
+from mercury_sync.load_balancing import TargetStats
 from mercury_sync.models.error import Error
 from mercury_sync.models.message import Message
+from mercury_sync.streaming import (
+    get_session_model,
+    peek
+)
 from typing import (
     Tuple, 
     Dict, 
@@ -43,6 +49,16 @@ class Service:
 
         self._env = env
 
+        self.call_stats = TargetStats(
+            decay=env.MERCURY_SYNC_BALANCER_EWMA_DECAY
+        )
+
+        self._breakers: Union[PeerCircuitBreakers, None] = None
+        if env.MERCURY_SYNC_USE_CLIENT_CIRCUIT_BREAKER:
+            self._breakers = PeerCircuitBreakers(env)
+
+        self._stream_window = env.MERCURY_SYNC_STREAM_WINDOW
+
         self._udp_connection = MercurySyncUDPConnection(
             host,
             port,
@@ -66,8 +82,11 @@ class Service:
             'connect',
             'send',
             'send_tcp',
+            'notify',
+            'notify_tcp',
             'stream',
             'stream_tcp',
+            'session',
             'close'
         ]
 
@@ -84,12 +103,17 @@ class Service:
             if not_internal and not_reserved and is_server:
                 
                 for param_type in rpc_signature.parameters.values():
+                    session_model = get_session_model(param_type.annotation)
+
                     if param_type.annotation in Message.__subclasses__():
 
                         model = param_type.annotation
 
                         self._tcp_connection.parsers[method_name] = model
                         self._udp_connection.parsers[method_name] = model
+
+                    elif session_model:
+                        self._tcp_connection.parsers[method_name] = session_model
   
                 self._tcp_connection.events[method_name] = method
                 self._udp_connection.events[method_name] = method
@@ -219,7 +243,8 @@ class Service:
     async def send(
         self, 
         event_name: str,
-        message: Message
+        message: Message,
+        request_id: Optional[int]=None
     ) -> Tuple[int, Union[Message, Error]]:
         (host, port)  = self._host_map.get(message.__class__.__name__)
         address = (
@@ -227,21 +252,51 @@ class Service:
             port
         )
 
-        shard_id, data = await self._udp_connection.send(
-            event_name,
-            message.to_data(),
-            address
-        )
+        if self._breakers:
+            self._breakers.check(address)
 
-        response_data = self._response_parsers.get(event_name)(
-            **data
-        )
-        return shard_id, response_data
+        started = self.call_stats.start()
+        failed = True
+        cancelled = False
+
+        try:
+            shard_id, data = await self._udp_connection.send(
+                event_name,
+                message.to_data(),
+                address,
+                request_id=request_id
+            )
+
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            failed = False
+
+            return shard_id, response_data
+        
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        
+        finally:
+            self.call_stats.complete(
+                started,
+                failed=failed
+            )
+
+            if self._breakers:
+                self._breakers.record(
+                    address,
+                    failed=failed,
+                    cancelled=cancelled
+                )
     
     async def send_tcp(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        request_id: Optional[int]=None
     ) -> Tuple[int, Union[Message, Error]]:
         (host, port)  = self._host_map.get(message.__class__.__name__)
         address = (
@@ -249,26 +304,84 @@ class Service:
             port + 1
         )
 
-        shard_id, data = await self._tcp_connection.send(
+        if self._breakers:
+            self._breakers.check(address)
+
+        started = self.call_stats.start()
+        failed = True
+        cancelled = False
+
+        try:
+            shard_id, data = await self._tcp_connection.send(
+                event_name,
+                message.to_data(),
+                address,
+                request_id=request_id
+            )
+
+            if data.get('error'):
+                return shard_id,  Error(**data)
+
+            response_data = self._response_parsers.get(event_name)(
+                **data
+            )
+
+            failed = False
+
+            return shard_id, response_data
+        
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        
+        finally:
+            self.call_stats.complete(
+                started,
+                failed=failed
+            )
+
+            if self._breakers:
+                self._breakers.record(
+                    address,
+                    failed=failed,
+                    cancelled=cancelled
+                )
+    
+    async def notify(
+        self,
+        event_name: str,
+        message: Message
+    ) -> None:
+        (host, port)  = self._host_map.get(message.__class__.__name__)
+
+        await self._udp_connection.notify(
             event_name,
             message.to_data(),
-            address
+            (host, port)
         )
 
+    async def notify_tcp(
+        self,
+        event_name: str,
+        message: Message
+    ) -> None:
+        (host, port)  = self._host_map.get(message.__class__.__name__)
 
-        if data.get('error'):
-            return shard_id,  Error(**data)
-
-        response_data = self._response_parsers.get(event_name)(
-            **data
+        await self._tcp_connection.notify(
+            event_name,
+            message.to_data(),
+            (host, port + 1)
         )
-        return shard_id, response_data
     
     async def stream(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        concurrent: bool=False,
+        max_buffered: Optional[int]=None
     ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        # A service holds a single connection per protocol, so there
+        # are no per-connection streams to merge when concurrent is set.
         (host, port)  = self._host_map.get(message.__class__.__name__)
         address = (
             host,
@@ -290,7 +403,9 @@ class Service:
     async def stream_tcp(
         self,
         event_name: str,
-        message: Message
+        message: Message,
+        concurrent: bool=False,
+        max_buffered: Optional[int]=None
     ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
         (host, port)  = self._host_map.get(message.__class__.__name__)
         address = (
@@ -307,12 +422,50 @@ class Service:
 
             if data.get('error'):
                 yield shard_id, Error(**data)
+                continue
 
             response_data = self._response_parsers.get(event_name)(
                 **data
             )
 
             yield shard_id, response_data
+
+    async def session(
+        self,
+        event_name: str,
+        messages: AsyncIterable[Message],
+        window: Optional[int]=None
+    ) -> AsyncIterable[Tuple[int, Union[Message, Error]]]:
+        
+        message, messages = await peek(messages)
+        if message is None:
+            return
+        
+        (host, port)  = self._host_map.get(message.__class__.__name__)
+        address = (
+            host,
+            port + 1
+        )
+
+        if window is None:
+            window = self._stream_window
+
+        response_parser = self._response_parsers.get(event_name)
+
+        async for shard_id, data in self._tcp_connection.open_session(
+            event_name,
+            (
+                item.to_data() async for item in messages
+            ),
+            address,
+            window=window
+        ):
+            
+            if shard_id is None:
+                yield shard_id, Error(**data)
+
+            else:
+                yield shard_id, response_parser(**data)
     
     async def close(self) -> None:
         await self._tcp_connection.close()
@@ -0,0 +1,3 @@
+from .cluster_simulator import ClusterSimulator
+from .simulated_connection import SimulatedConnection
+from .simulated_network import SimulatedNetwork
\ No newline at end of file
@@ -0,0 +1,289 @@
+import asyncio
+from mercury_sync.env import Env, load_env
+from mercury_sync.monitoring import Monitor
+from mercury_sync.timing import TimingWheel
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union
+)
+from .simulated_connection import SimulatedConnection
+from .simulated_network import (
+    Address,
+    SimulatedNetwork
+)
+
+
+class ClusterSimulator:
+
+    def __init__(
+        self,
+        nodes: int,
+        network: Optional[SimulatedNetwork]=None,
+        host: str='127.0.0.1',
+        base_port: int=10000,
+        env: Optional[Env]=None,
+        sample_interval: float=0.5
+    ) -> None:
+        
+        if nodes < 2:
+            raise ValueError('Err. - A simulated cluster requires at least two nodes')
+        
+        if network is None:
+            network = SimulatedNetwork()
+
+        if env is None:
+            env = load_env(Env)
+
+        self.network = network
+        self.env = env
+        self.sample_interval = sample_interval
+
+        # Each node takes a UDP port and the TCP port above it.
+        self.addresses: List[Address] = [
+            (host, base_port + (idx * 2)) for idx in range(nodes)
+        ]
+
+        self.monitors: Dict[Address, Monitor] = {}
+
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._started_at = 0
+        self._changed_at = 0
+        self._converged = False
+        self._sampler: Union[asyncio.Task, None] = None
+
+        self._failed_at: Dict[Address, float] = {}
+        self._detections: Dict[Tuple[Address, Address], float] = {}
+        self._false_suspicions: Set[Tuple[Address, Address]] = set()
+        self._false_failures: Set[Tuple[Address, Address]] = set()
+        self._convergence_times: List[float] = []
+
+    async def start(self):
+        self._loop = asyncio.get_event_loop()
+
+        for host, port in self.addresses:
+            monitor = Monitor(
+                host,
+                port,
+                self.env,
+                workers=1
+            )
+
+            # Per-monitor wheels would each drive their own loop timer,
+            # which dominates the loop at thousands of nodes.
+            monitor._timer = TimingWheel.shared()
+
+            await self._attach(monitor)
+            self.monitors[(host, port)] = monitor
+
+        bootstrap, *joiners = self.addresses
+
+        await asyncio.gather(
+            self.monitors[bootstrap].register(*joiners[0]),
+            *[
+                self.monitors[address].register(*bootstrap) for address in joiners
+            ]
+        )
+
+        self._started_at = self._loop.time()
+        self._mark_changed()
+
+        self._sampler = asyncio.create_task(
+            self._sample()
+        )
+
+    async def _attach(self, monitor: Monitor):
+
+        node = (monitor.host, monitor.port)
+        instance_id = monitor.instance_ids[0]
+
+        udp_connection = SimulatedConnection(
+            monitor.host,
+            monitor.port,
+            instance_id,
+            node,
+            self.network
+        )
+
+        tcp_connection = SimulatedConnection(
+            monitor.host,
+            monitor.port + 1,
+            instance_id,
+            node,
+            self.network
+        )
+
+        # Handlers and parsers were registered on the real connections
+        # when the Monitor was built, so they are carried across. Replies
+        # are parsed by the Monitor itself, so no response parsers are.
+        for simulated, connection in (
+            (udp_connection, monitor._udp_pool[0]),
+            (tcp_connection, monitor._tcp_pool[0])
+        ):
+            simulated.events.update(connection.events)
+            simulated.parsers.update(connection.parsers)
+
+            await simulated.connect_async()
+
+        monitor._udp_pool = [udp_connection]
+        monitor._tcp_pool = [tcp_connection]
+
+    async def run(self, duration: float):
+        await asyncio.sleep(duration)
+
+    def fail(self, node: Address):
+        monitor = self.monitors[node]
+        monitor._running = False
+
+        self.network.fail(node)
+        self._failed_at[node] = self._loop.time()
+        self._mark_changed()
+
+    def partition(self, *groups: Sequence[Address]):
+        self.network.partition(*groups)
+        self._mark_changed()
+
+    def heal(self):
+        self.network.heal()
+        self._mark_changed()
+
+    def _mark_changed(self):
+        self._changed_at = self._loop.time()
+        self._converged = False
+
+    async def _sample(self):
+
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            self._record_sample()
+
+    def _record_sample(self):
+
+        now = self._loop.time()
+        converged = True
+
+        live = [
+            address for address in self.addresses if address not in self._failed_at
+        ]
+
+        for observer in live:
+            reachable_count = 0
+
+            for member in self.monitors[observer]._members:
+                target = member.address
+
+                if self.network.reachable(observer, target) is False:
+                    continue
+
+                failed_at = self._failed_at.get(target)
+                if failed_at is not None:
+
+                    if member.status == 'failed':
+                        self._detections.setdefault(
+                            (observer, target),
+                            now - failed_at
+                        )
+
+                    else:
+                        converged = False
+
+                    continue
+
+                reachable_count += 1
+
+                if member.status == 'suspect':
+                    self._false_suspicions.add((observer, target))
+                    converged = False
+
+                elif member.status == 'failed':
+                    self._false_failures.add((observer, target))
+                    converged = False
+
+            expected_count = len([
+                target for target in live if target != observer and self.network.reachable(
+                    observer,
+                    target
+                )
+            ])
+
+            if reachable_count < expected_count:
+                converged = False
+
+        if converged and self._converged is False:
+            self._converged = True
+            self._convergence_times.append(
+                now - self._changed_at
+            )
+
+    def report(self) -> Dict[str, Any]:
+
+        elapsed = max(
+            self._loop.time() - self._started_at,
+            1e-9
+        )
+
+        nodes_count = len(self.addresses)
+        live_count = nodes_count - len(self._failed_at)
+        pairs_count = max(live_count * (live_count - 1), 1)
+
+        latencies = sorted(self._detections.values())
+
+        messages = sum(self.network.messages_sent.values())
+        sent_bytes = sum(self.network.bytes_sent.values())
+
+        return {
+            'nodes': nodes_count,
+            'elapsed': round(elapsed, 3),
+            'detection_latency': {
+                'detected': len(latencies),
+                'expected': len(self._failed_at) * live_count,
+                'mean': _mean(latencies),
+                'p50': _percentile(latencies, 0.5),
+                'p99': _percentile(latencies, 0.99),
+                'max': latencies[-1] if latencies else None
+            },
+            'false_suspicion_rate': len(self._false_suspicions)/pairs_count,
+            'false_positive_rate': len(self._false_failures)/pairs_count,
+            'convergence_times': [
+                round(convergence_time, 3) for convergence_time in self._convergence_times
+            ],
+            'messages_per_node_per_second': messages/nodes_count/elapsed,
+            'bytes_per_node_per_second': sent_bytes/nodes_count/elapsed,
+            'messages_dropped': self.network.messages_dropped
+        }
+
+    async def close(self):
+
+        if self._sampler:
+            self._sampler.cancel()
+
+        await asyncio.gather(*[
+            monitor.shutdown() for monitor in self.monitors.values()
+        ], return_exceptions=True)
+
+
+def _mean(values: List[float]) -> Union[float, None]:
+    if len(values) < 1:
+        return None
+    
+    return sum(values)/len(values)
+
+
+def _percentile(
+    values: List[float],
+    percentile: float
+) -> Union[float, None]:
+    if len(values) < 1:
+        return None
+    
+    return values[
+        min(
+            int(len(values) * percentile),
+            len(values) - 1
+        )
+    ]
@@ -0,0 +1,374 @@
+import asyncio
+import itertools
+import pickle
+from mercury_sync.connection.base.batch_waiter import (
+    BatchResponse,
+    BatchWaiter
+)
+from mercury_sync.models.message import Message
+from mercury_sync.snowflake.snowflake_generator import SnowflakeGenerator
+from mercury_sync.tasks import TaskSupervisor
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+from .simulated_network import (
+    Address,
+    SimulatedNetwork
+)
+
+
+class SimulatedConnection:
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        instance_id: int,
+        node: Address,
+        network: SimulatedNetwork
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.node = node
+        self.network = network
+
+        self.id_generator = SnowflakeGenerator(instance_id)
+        self.events: Dict[str, Callable[..., Coroutine]] = {}
+        self.parsers: Dict[str, Message] = {}
+
+        self._correlation_ids = itertools.count()
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._batch_waiters: Dict[int, BatchWaiter] = {}
+        self._tasks = TaskSupervisor()
+        self._running = False
+
+    async def connect_async(
+        self,
+        cert_path: Optional[str]=None,
+        key_path: Optional[str]=None
+    ):
+        self._running = True
+        self.network.register(
+            (self.host, self.port),
+            self
+        )
+
+    async def connect_client(
+        self,
+        address: Address,
+        cert_path: Optional[str]=None,
+        key_path: Optional[str]=None
+    ):
+        pass
+
+    async def close_client(self, address: Address):
+        pass
+
+    async def send(
+        self,
+        event_name: str,
+        data: Dict[str, Any],
+        addr: Address,
+        request_id: Optional[int]=None
+    ) -> Tuple[int, Dict[str, Any]]:
+        
+        if request_id is None:
+            request_id = self.id_generator.generate()
+
+        return await self._request(
+            'request',
+            request_id,
+            event_name,
+            data,
+            addr
+        )
+    
+    async def send_batch(
+        self,
+        event_name: str,
+        data: List[Dict[str, Any]],
+        addr: Address,
+        on_response: Optional[
+            Callable[
+                [int, BatchResponse],
+                None
+            ]
+        ]=None
+    ) -> List[BatchResponse]:
+        correlation_id = next(self._correlation_ids)
+
+        batch_waiter = BatchWaiter(
+            len(data),
+            asyncio.get_event_loop().create_future(),
+            on_response=on_response
+        )
+
+        self._batch_waiters[correlation_id] = batch_waiter
+
+        self._transmit(
+            'batch_request',
+            self.id_generator.generate(),
+            event_name,
+            data,
+            correlation_id,
+            addr
+        )
+
+        try:
+            return await batch_waiter.waiter
+        
+        finally:
+            self._batch_waiters.pop(correlation_id, None)
+    
+    async def notify(
+        self,
+        event_name: str,
+        data: Dict[str, Any],
+        addr: Address
+    ):
+        self._transmit(
+            'notify',
+            self.id_generator.generate(),
+            event_name,
+            data,
+            None,
+            addr
+        )
+
+    async def _request(
+        self,
+        message_type: str,
+        request_id: int,
+        event_name: str,
+        data: Any,
+        addr: Address
+    ):
+        # Retries and hedges reuse request ids, so replies are matched
+        # on a per-call correlation id instead.
+        correlation_id = next(self._correlation_ids)
+
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters[correlation_id] = waiter
+
+        self._transmit(
+            message_type,
+            request_id,
+            event_name,
+            data,
+            correlation_id,
+            addr
+        )
+
+        try:
+            return await waiter
+        
+        finally:
+            self._waiters.pop(correlation_id, None)
+
+    def _transmit(
+        self,
+        message_type: str,
+        shard_id: int,
+        event_name: str,
+        data: Any,
+        correlation_id: Union[int, None],
+        addr: Address
+    ):
+        # Payloads are pickled exactly as the real connections do, so
+        # byte counts and handler-side copies match the wire.
+        self.network.transmit(
+            self,
+            addr,
+            pickle.dumps(
+                (
+                    message_type,
+                    shard_id,
+                    event_name,
+                    data,
+                    correlation_id
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        )
+
+    def receive(
+        self,
+        packet: bytes,
+        addr: Address
+    ):
+        # Packets already in flight are still delivered after close, but
+        # must not start handlers on a node that has shut down.
+        if self._running is False:
+            return
+        
+        (
+            message_type,
+            shard_id,
+            event_name,
+            payload,
+            correlation_id
+        ) = pickle.loads(packet)
+
+        if message_type == 'request':
+            self._tasks.spawn(
+                self._respond(
+                    event_name,
+                    shard_id,
+                    payload,
+                    correlation_id,
+                    addr
+                )
+            )
+
+        elif message_type == 'notify':
+            self._tasks.spawn(
+                self._call(event_name, shard_id, payload)
+            )
+
+        elif message_type == 'batch_request':
+            self._tasks.spawn(
+                self._respond_batch(
+                    event_name,
+                    shard_id,
+                    payload,
+                    correlation_id,
+                    addr
+                )
+            )
+
+        elif message_type == 'batch_response':
+            batch_waiter = self._batch_waiters.get(correlation_id)
+
+            if batch_waiter:
+                batch_waiter.receive(payload)
+
+        else:
+            waiter = self._waiters.get(correlation_id)
+
+            if waiter and waiter.done() is False:
+                waiter.set_result((
+                    shard_id,
+                    payload
+                ))
+
+    async def _call(
+        self,
+        event_name: str,
+        shard_id: int,
+        payload: Dict[str, Any]
+    ) -> Message:
+        # Handler coroutines are only created once the task runs, so a
+        # task cancelled at shutdown never leaves one unawaited.
+        return await self.events[event_name](
+            shard_id,
+            self.parsers[event_name](**payload)
+        )
+
+    async def _respond(
+        self,
+        event_name: str,
+        shard_id: int,
+        payload: Dict[str, Any],
+        correlation_id: int,
+        addr: Address
+    ):
+        response: Message = await self._call(
+            event_name,
+            shard_id,
+            payload
+        )
+
+        self._transmit(
+            'response',
+            self.id_generator.generate(),
+            event_name,
+            response.to_data(),
+            correlation_id,
+            addr
+        )
+
+    async def _respond_batch(
+        self,
+        event_name: str,
+        shard_id: int,
+        payloads: List[Dict[str, Any]],
+        correlation_id: int,
+        addr: Address
+    ):
+        # Mirrors the real connections, which answer each item as soon
+        # as its handler finishes.
+        pending: Dict[asyncio.Task, int] = {
+            asyncio.create_task(
+                self._call(
+                    event_name,
+                    shard_id,
+                    payload
+                )
+            ): idx for idx, payload in enumerate(payloads)
+        }
+
+        try:
+
+            while len(pending) > 0:
+
+                completed, _ = await asyncio.wait(
+                    pending.keys(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                responses: List[Tuple[int, Union[int, None], Dict[str, Any]]] = []
+                for task in completed:
+                    idx = pending.pop(task)
+                    error = task.exception()
+
+                    if error:
+                        responses.append((
+                            idx,
+                            None,
+                            {
+                                'host': self.host,
+                                'port': self.port,
+                                'error': str(error) or error.__class__.__name__
+                            }
+                        ))
+
+                    else:
+                        responses.append((
+                            idx,
+                            self.id_generator.generate(),
+                            task.result().to_data()
+                        ))
+
+                self._transmit(
+                    'batch_response',
+                    self.id_generator.generate(),
+                    event_name,
+                    responses,
+                    correlation_id,
+                    addr
+                )
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def close(self):
+        self._running = False
+        self.network.unregister((self.host, self.port))
+
+        for waiter in self._waiters.values():
+            if waiter.done() is False:
+                waiter.cancel()
+
+        for batch_waiter in self._batch_waiters.values():
+            if batch_waiter.waiter.done() is False:
+                batch_waiter.waiter.cancel()
+
+        await self._tasks.shutdown()
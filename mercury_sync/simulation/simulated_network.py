@@ -0,0 +1,117 @@
+import asyncio
+import random
+from collections import defaultdict
+from typing import (
+    Dict,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union
+)
+
+
+Address = Tuple[str, int]
+
+
+class SimulatedNetwork:
+
+    def __init__(
+        self,
+        latency: float=0.001,
+        jitter: float=0,
+        loss: float=0,
+        seed: Optional[int]=None
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+
+        self._random = random.Random(seed)
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+
+        self._endpoints: Dict[Address, 'SimulatedConnection'] = {}
+        self._groups: Dict[Address, int] = {}
+        self._down: Set[Address] = set()
+
+        self.messages_sent: Dict[Address, int] = defaultdict(int)
+        self.bytes_sent: Dict[Address, int] = defaultdict(int)
+        self.messages_dropped = 0
+
+    def register(
+        self,
+        address: Address,
+        connection: 'SimulatedConnection'
+    ):
+        self._endpoints[address] = connection
+
+    def unregister(self, address: Address):
+        self._endpoints.pop(address, None)
+
+    def fail(self, node: Address):
+        self._down.add(node)
+
+    def recover(self, node: Address):
+        self._down.discard(node)
+
+    def partition(self, *groups: Sequence[Address]):
+        # Nodes left out of every group stay together in group zero.
+        self._groups = {
+            node: group_id for group_id, group in enumerate(
+                groups,
+                start=1
+            ) for node in group
+        }
+
+    def heal(self):
+        self._groups = {}
+
+    def reachable(
+        self,
+        source: Address,
+        target: Address
+    ) -> bool:
+        return self._groups.get(source, 0) == self._groups.get(target, 0)
+
+    def transmit(
+        self,
+        source: 'SimulatedConnection',
+        target: Address,
+        packet: bytes
+    ):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        
+        self.messages_sent[source.node] += 1
+        self.bytes_sent[source.node] += len(packet)
+
+        endpoint = self._endpoints.get(target)
+
+        if endpoint is None or self._is_dropped(source.node, endpoint.node):
+            self.messages_dropped += 1
+            return
+        
+        delay = self.latency
+        if self.jitter > 0:
+            delay += self._random.uniform(0, self.jitter)
+
+        self._loop.call_later(
+            delay,
+            endpoint.receive,
+            packet,
+            (source.host, source.port)
+        )
+
+    def _is_dropped(
+        self,
+        source: Address,
+        target: Address
+    ) -> bool:
+        
+        if source in self._down or target in self._down:
+            return True
+        
+        if self.reachable(source, target) is False:
+            return True
+        
+        return self.loss > 0 and self._random.random() < self.loss
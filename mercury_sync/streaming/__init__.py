@@ -0,0 +1,5 @@
+from .credit_window import CreditWindow
+from .merge import merge
+from .peek import peek
+from .session_model import get_session_model
+from .stream_session import StreamSession
\ No newline at end of file
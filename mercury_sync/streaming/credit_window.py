@@ -0,0 +1,50 @@
+import asyncio
+from collections import deque
+from typing import Deque
+
+
+class CreditWindow:
+
+    __slots__ = (
+        'credits',
+        'closed',
+        '_waiters'
+    )
+
+    def __init__(self, credits: int) -> None:
+        self.credits = credits
+        self.closed = False
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self):
+
+        while self.credits < 1:
+
+            if self.closed:
+                raise ConnectionResetError('Err. - Stream session closed')
+
+            waiter = asyncio.get_event_loop().create_future()
+            self._waiters.append(waiter)
+
+            await waiter
+
+        self.credits -= 1
+
+    def grant(self, credits: int):
+        self.credits += credits
+
+        while self._waiters and credits > 0:
+            waiter = self._waiters.popleft()
+
+            if waiter.done() is False:
+                waiter.set_result(None)
+                credits -= 1
+
+    def close(self):
+        self.closed = True
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+
+            if waiter.done() is False:
+                waiter.set_result(None)
@@ -0,0 +1,73 @@
+import asyncio
+from typing import (
+    AsyncIterable,
+    List,
+    TypeVar
+)
+
+
+T = TypeVar('T')
+
+
+async def merge(
+    iterables: List[AsyncIterable[T]],
+    max_buffered: int=64
+) -> AsyncIterable[T]:
+    
+    if len(iterables) < 1:
+        return
+
+    # The bounded queue applies backpressure to every source, so a fast
+    # producer can't run ahead of the consumer by more than the buffer.
+    queue: asyncio.Queue = asyncio.Queue(
+        maxsize=max(max_buffered, 1)
+    )
+
+    async def pump(iterable: AsyncIterable[T]):
+        try:
+            async for item in iterable:
+                await queue.put(('item', item))
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as stream_error:
+            await queue.put(('error', stream_error))
+            return
+        
+        finally:
+            close = getattr(iterable, 'aclose', None)
+            if close:
+                await close()
+
+        await queue.put(('done', None))
+
+    pumps = [
+        asyncio.create_task(
+            pump(iterable)
+        ) for iterable in iterables
+    ]
+
+    remaining = len(pumps)
+
+    try:
+        while remaining > 0:
+            kind, value = await queue.get()
+
+            if kind == 'item':
+                yield value
+
+            elif kind == 'error':
+                raise value
+            
+            else:
+                remaining -= 1
+
+    finally:
+        for task in pumps:
+            task.cancel()
+
+        await asyncio.gather(
+            *pumps,
+            return_exceptions=True
+        )
@@ -0,0 +1,32 @@
+from typing import (
+    AsyncIterable,
+    Tuple,
+    TypeVar,
+    Union
+)
+
+
+T = TypeVar('T')
+
+
+async def peek(
+    iterable: AsyncIterable[T]
+) -> Tuple[
+    Union[T, None],
+    AsyncIterable[T]
+]:
+    iterator = iterable.__aiter__()
+
+    try:
+        first = await iterator.__anext__()
+
+    except StopAsyncIteration:
+        return None, iterator
+    
+    async def chain():
+        yield first
+
+        async for item in iterator:
+            yield item
+
+    return first, chain()
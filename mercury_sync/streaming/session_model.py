@@ -0,0 +1,25 @@
+from mercury_sync.models.message import Message
+from typing import (
+    Any,
+    Type,
+    Union,
+    get_args
+)
+
+
+def get_session_model(annotation: Any) -> Union[Type[Message], None]:
+    # Session handlers take a Stream[T] - AsyncIterable[Tuple[int, T]] -
+    # rather than a bare Message, so unwrap both layers to find T.
+    stream_args = get_args(annotation)
+    if len(stream_args) < 1:
+        return None
+    
+    call_args = get_args(stream_args[0])
+    if len(call_args) < 2:
+        return None
+    
+    model = call_args[1]
+    if model in Message.__subclasses__():
+        return model
+    
+    return None
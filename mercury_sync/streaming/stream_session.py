@@ -0,0 +1,64 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Tuple,
+    Union
+)
+from .credit_window import CreditWindow
+
+
+class StreamSession:
+
+    def __init__(
+        self,
+        session_id: int,
+        event_name: str,
+        window: int,
+        send_credits: Callable[[int], None]
+    ) -> None:
+        self.session_id = session_id
+        self.event_name = event_name
+        self.window = max(window, 1)
+
+        # Credits bound what the remote may still send, so the inbound
+        # queue never holds more than one window of items.
+        self.inbound: asyncio.Queue = asyncio.Queue()
+        self.outbound = CreditWindow(self.window)
+
+        self.error: Union[str, None] = None
+
+        self._send_credits = send_credits
+        self._consumed = 0
+        self._credit_batch = max(self.window//2, 1)
+
+    def put(self, item: Tuple[int, Any]):
+        self.inbound.put_nowait(item)
+
+    def finish(
+        self,
+        error: Union[str, None]=None
+    ):
+        self.error = error
+        self.inbound.put_nowait(None)
+
+    def close(self):
+        self.outbound.close()
+
+    async def items(self) -> AsyncIterable[Tuple[int, Any]]:
+
+        while True:
+            item: Union[Tuple[int, Any], None] = await self.inbound.get()
+
+            if item is None:
+                break
+
+            yield item
+
+            # Credits are handed back in batches rather than per item
+            # to keep control traffic to a fraction of the data.
+            self._consumed += 1
+            if self._consumed >= self._credit_batch:
+                self._send_credits(self._consumed)
+                self._consumed = 0
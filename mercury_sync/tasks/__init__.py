@@ -0,0 +1 @@
+from .task_supervisor import TaskSupervisor
\ No newline at end of file
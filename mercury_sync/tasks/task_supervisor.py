@@ -0,0 +1,111 @@
+import asyncio
+from collections import defaultdict
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    Optional,
+    Set,
+    Union
+)
+
+
+class TaskSupervisor:
+
+    def __init__(
+        self,
+        max_pending: Optional[int]=None
+    ) -> None:
+        self.max_pending = max_pending
+
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.errors: Dict[str, int] = defaultdict(int)
+
+        self._tasks: Set[asyncio.Task] = set()
+        self._semaphore: Union[asyncio.Semaphore, None] = None
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def spawn(
+        self,
+        coroutine: Coroutine[Any, Any, Any]
+    ) -> asyncio.Task:
+        
+        if self.max_pending:
+
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.max_pending)
+
+            task = asyncio.create_task(
+                self._run_bounded(coroutine)
+            )
+
+            # A task cancelled before it first runs never starts the
+            # wrapped coroutine, so close it explicitly once done.
+            task.add_done_callback(
+                lambda _: coroutine.close()
+            )
+
+        else:
+            task = asyncio.create_task(coroutine)
+
+        # Tasks reap themselves on completion rather than waiting for a
+        # sweep, so finished tasks and their results are freed at once.
+        self._tasks.add(task)
+        task.add_done_callback(self._reap)
+
+        return task
+
+    async def _run_bounded(
+        self,
+        coroutine: Coroutine[Any, Any, Any]
+    ) -> Any:
+        
+        async with self._semaphore:
+            return await coroutine
+
+    def _reap(self, task: asyncio.Task):
+        self._tasks.discard(task)
+
+        if task.cancelled():
+            self.cancelled += 1
+            return
+        
+        error = task.exception()
+        if error is None:
+            self.completed += 1
+            return
+        
+        self.failed += 1
+        self.errors[error.__class__.__name__] += 1
+
+    async def cancel_all(self):
+        current = asyncio.current_task()
+        pending = [
+            task for task in self._tasks if task is not current
+        ]
+
+        for task in pending:
+            task.cancel()
+
+        if len(pending) > 0:
+            await asyncio.gather(
+                *pending,
+                return_exceptions=True
+            )
+
+    async def shutdown(self):
+        await self.cancel_all()
+        self._semaphore = None
+
+    def to_dict(self):
+        return {
+            'pending': len(self._tasks),
+            'completed': self.completed,
+            'failed': self.failed,
+            'cancelled': self.cancelled,
+            'errors': dict(self.errors)
+        }
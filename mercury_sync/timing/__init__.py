@@ -0,0 +1,6 @@
+from .deadline import (
+    DEADLINE_EXCEEDED,
+    is_deadline_exceeded
+)
+from .timer_handle import TimerHandle
+from .timing_wheel import TimingWheel
\ No newline at end of file
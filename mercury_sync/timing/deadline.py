@@ -0,0 +1,10 @@
+import asyncio
+
+
+# Passed as the cancellation message when a deadline expires, so code
+# further down the call can tell a timeout from a deliberate cancel.
+DEADLINE_EXCEEDED = 'deadline exceeded'
+
+
+def is_deadline_exceeded(error: asyncio.CancelledError) -> bool:
+    return DEADLINE_EXCEEDED in error.args
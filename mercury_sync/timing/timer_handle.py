@@ -0,0 +1,50 @@
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Set,
+    Tuple
+)
+
+
+class TimerHandle:
+
+    __slots__ = (
+        'expires_at',
+        'callback',
+        'args',
+        'cancelled',
+        'fired',
+        '_slot',
+        '_wheel'
+    )
+
+    def __init__(
+        self,
+        expires_at: int,
+        callback: Callable[..., Any],
+        args: Tuple[Any, ...],
+        wheel: Any
+    ) -> None:
+        self.expires_at = expires_at
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+        self._slot: Optional[Set['TimerHandle']] = None
+        self._wheel = wheel
+
+    def cancel(self):
+        if self.cancelled or self.fired:
+            return
+        
+        self.cancelled = True
+
+        if self._slot is not None:
+            self._slot.discard(self)
+            self._slot = None
+            self._wheel._pending -= 1
+
+        # Drop references so a cancelled timer doesn't pin its target.
+        self.callback = None
+        self.args = ()
@@ -0,0 +1,256 @@
+import asyncio
+import math
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union
+)
+from .deadline import DEADLINE_EXCEEDED
+from .timer_handle import TimerHandle
+
+
+T = TypeVar('T')
+
+
+class TimingWheel:
+
+    _shared: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TimingWheel]' = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        tick: float=0.01,
+        slots: int=256,
+        levels: int=4
+    ) -> None:
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+
+        self._wheels: List[List[Set[TimerHandle]]] = [
+            [set() for _ in range(slots)] for _ in range(levels)
+        ]
+
+        self._spans = [
+            slots ** level for level in range(levels)
+        ]
+
+        self._max_ticks = slots ** levels - 1
+
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._started_at = 0
+        self._current_tick = 0
+        self._pending = 0
+        self._driver: Union[asyncio.TimerHandle, None] = None
+
+    @classmethod
+    def shared(cls) -> 'TimingWheel':
+        loop = asyncio.get_running_loop()
+
+        wheel = cls._shared.get(loop)
+        if wheel is None:
+            wheel = cls()
+            cls._shared[loop] = wheel
+
+        return wheel
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def schedule(
+        self,
+        delay: float,
+        callback: Callable[..., Any],
+        *args: Any
+    ) -> TimerHandle:
+        
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+            self._started_at = self._loop.time()
+
+        if self._driver is None:
+            # The wheel only keeps a loop timer while it has timers of
+            # its own, and resyncs to wall time after sitting idle.
+            self._current_tick = self._elapsed_ticks()
+
+        ticks = max(
+            math.ceil(delay/self.tick),
+            1
+        )
+
+        handle = TimerHandle(
+            self._current_tick + ticks,
+            callback,
+            args,
+            self
+        )
+
+        self._insert(handle)
+        self._pending += 1
+
+        if self._driver is None:
+            self._driver = self._loop.call_at(
+                self._started_at + (self._current_tick + 1) * self.tick,
+                self._advance
+            )
+
+        return handle
+    
+    def _elapsed_ticks(self) -> int:
+        return int(
+            (self._loop.time() - self._started_at)/self.tick
+        )
+    
+    def _insert(self, handle: TimerHandle):
+        remaining = min(
+            handle.expires_at - self._current_tick,
+            self._max_ticks
+        )
+
+        level = 0
+        while level < self.levels - 1 and remaining >= self._spans[level + 1]:
+            level += 1
+
+        # Timers in upper levels are filed by the coarser slot they
+        # expire in and cascade down as the lower wheel wraps.
+        slot_index = (
+            (self._current_tick + remaining)//self._spans[level]
+        ) % self.slots
+
+        slot = self._wheels[level][slot_index]
+        slot.add(handle)
+        handle._slot = slot
+
+    def _advance(self):
+        target_tick = self._elapsed_ticks()
+
+        while self._current_tick < target_tick and self._pending > 0:
+            self._current_tick += 1
+            self._cascade()
+            self._expire()
+
+        if self._pending > 0:
+            self._driver = self._loop.call_at(
+                self._started_at + (self._current_tick + 1) * self.tick,
+                self._advance
+            )
+
+        else:
+            self._driver = None
+    
+    def _cascade(self):
+        for level in range(1, self.levels):
+            if self._current_tick % self._spans[level] != 0:
+                break
+
+            slot_index = (self._current_tick//self._spans[level]) % self.slots
+            slot = self._wheels[level][slot_index]
+
+            if not slot:
+                continue
+
+            self._wheels[level][slot_index] = set()
+
+            for handle in slot:
+                self._insert(handle)
+
+    def _expire(self):
+        slot_index = self._current_tick % self.slots
+        slot = self._wheels[0][slot_index]
+
+        if not slot:
+            return
+        
+        self._wheels[0][slot_index] = set()
+
+        for handle in slot:
+
+            if handle.expires_at > self._current_tick:
+                self._insert(handle)
+                continue
+
+            handle._slot = None
+            handle.fired = True
+            self._pending -= 1
+
+            # Callbacks run inline so a timeout is applied in the same
+            # loop iteration it expires in, never after the caller moved on.
+            try:
+                handle.callback(*handle.args)
+
+            except Exception as timer_error:
+                self._loop.call_exception_handler({
+                    'message': 'Err. - Timing wheel callback failed',
+                    'exception': timer_error
+                })
+
+    async def wait_for(
+        self,
+        awaitable: Awaitable[T],
+        timeout: Optional[float]
+    ) -> T:
+        
+        if timeout is None:
+            return await awaitable
+        
+        if timeout <= 0:
+            raise asyncio.TimeoutError()
+        
+        # Rather than wrapping the awaitable in a task as asyncio.wait_for
+        # does, the calling task itself is cancelled on expiry.
+        task = asyncio.current_task()
+        handle = self.schedule(
+            timeout,
+            task.cancel,
+            DEADLINE_EXCEEDED
+        )
+
+        try:
+            return await awaitable
+        
+        except asyncio.CancelledError:
+            if handle.fired is False:
+                raise
+
+            uncancel = getattr(task, 'uncancel', None)
+            if uncancel:
+                uncancel()
+
+            raise asyncio.TimeoutError()
+        
+        finally:
+            handle.cancel()
+
+    async def sleep(self, delay: float):
+        waiter = asyncio.get_event_loop().create_future()
+        handle = self.schedule(
+            delay,
+            _release,
+            waiter
+        )
+
+        try:
+            await waiter
+
+        finally:
+            handle.cancel()
+
+    def close(self):
+        if self._driver:
+            self._driver.cancel()
+            self._driver = None
+
+        for wheel in self._wheels:
+            for slot in wheel:
+                for handle in list(slot):
+                    handle.cancel()
+
+
+def _release(waiter: asyncio.Future):
+    if waiter.done() is False:
+        waiter.set_result(None)
@@ -0,0 +1,3 @@
+from .checksum import checksum
+from .inbound_transfer import InboundTransfer
+from .outbound_transfer import OutboundTransfer
\ No newline at end of file
@@ -0,0 +1,9 @@
+import hashlib
+from typing import Union
+
+
+def checksum(buffer: Union[bytes, memoryview]) -> str:
+    return hashlib.blake2b(
+        buffer,
+        digest_size=32
+    ).hexdigest()
@@ -0,0 +1,126 @@
+import asyncio
+import mmap
+import os
+from typing import Tuple, Union
+from .checksum import checksum
+
+
+class InboundTransfer:
+
+    def __init__(
+        self,
+        transfer_id: int,
+        event_name: str,
+        name: str,
+        size: int,
+        expected_checksum: str,
+        chunk_size: int,
+        directory: str
+    ) -> None:
+        self.transfer_id = transfer_id
+        self.event_name = event_name
+        self.name = os.path.basename(name)
+        self.size = size
+        self.checksum = expected_checksum
+        self.chunk_size = max(chunk_size, 1)
+
+        if not self.name:
+            raise ValueError('Err. - Transfer name must not be empty')
+
+        self.path = os.path.join(directory, self.name)
+
+        # Partial files are keyed by content checksum so a resume never
+        # appends to the remains of a different upload with the same name.
+        self.part_path = f'{self.path}.{expected_checksum[:16]}.part'
+
+        self.chunks: asyncio.Queue = asyncio.Queue()
+        self.error: Union[Exception, None] = None
+        self._fd: Union[int, None] = None
+
+    def open(self) -> int:
+        os.makedirs(
+            os.path.dirname(self.part_path),
+            exist_ok=True
+        )
+
+        self._fd = os.open(
+            self.part_path,
+            os.O_RDWR | os.O_CREAT,
+            0o644
+        )
+
+        # Only whole chunks count - a torn trailing write from an earlier
+        # attempt is truncated and sent again.
+        written = os.fstat(self._fd).st_size
+        offset = min(
+            written - written % self.chunk_size,
+            self.size
+        )
+
+        os.ftruncate(self._fd, offset)
+
+        return offset
+
+    def put(self, chunk: Union[Tuple[int, bytes, int, bool], None]):
+        self.chunks.put_nowait(chunk)
+
+    def abort(self, error: Exception):
+        # The partial file is kept, so a retry resumes from the last
+        # whole chunk written.
+        self.error = error
+        self.chunks.put_nowait(None)
+
+    def write(
+        self,
+        offset: int,
+        data: bytes
+    ):
+        if offset + len(data) > self.size:
+            raise ValueError(
+                f'Err. - Chunk at offset - {offset} - exceeds transfer size - {self.size}'
+            )
+
+        os.pwrite(self._fd, data, offset)
+
+    def commit(self):
+        os.fsync(self._fd)
+
+        if os.fstat(self._fd).st_size != self.size:
+            raise ValueError(
+                f'Err. - Transfer - {self.name} - is incomplete'
+            )
+
+        if self.size > 0:
+            with mmap.mmap(
+                self._fd,
+                self.size,
+                access=mmap.ACCESS_READ
+            ) as mapped:
+                received_checksum = checksum(mapped)
+
+        else:
+            received_checksum = checksum(b'')
+
+        if received_checksum != self.checksum:
+            self.discard()
+
+            raise ValueError(
+                f'Err. - Checksum mismatch for transfer - {self.name}'
+            )
+
+        self.close()
+        os.replace(self.part_path, self.path)
+
+    def discard(self):
+        self.close()
+
+        try:
+            os.remove(self.part_path)
+
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,42 @@
+import asyncio
+from mercury_sync.streaming import CreditWindow
+from typing import Any
+
+
+class OutboundTransfer:
+
+    def __init__(
+        self,
+        transfer_id: int,
+        event_name: str,
+        window: int,
+        transport: asyncio.Transport
+    ) -> None:
+        self.transfer_id = transfer_id
+        self.event_name = event_name
+        self.transport = transport
+        self.window = CreditWindow(max(window, 1))
+
+        loop = asyncio.get_event_loop()
+        self.ready: asyncio.Future = loop.create_future()
+        self.done: asyncio.Future = loop.create_future()
+
+    def start(self, offset: int):
+        if self.ready.done() is False:
+            self.ready.set_result(offset)
+
+    def finish(self, result: Any):
+        if self.done.done() is False:
+            self.done.set_result(result)
+
+        # The receiver may answer early with an error, so release
+        # anything still waiting on the handshake or on credits.
+        self.start(None)
+        self.window.close()
+
+    def cancel(self):
+        self.window.close()
+
+        for waiter in (self.ready, self.done):
+            if waiter.done() is False:
+                waiter.cancel()